@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from apps.accounts.models import Otp
 from decouple import config
 from django.contrib.auth.password_validation import validate_password
@@ -64,10 +66,17 @@ def get_client_ip(request):
     return ip
 
 
-client_id = config("GOOGLE_CLIENT_ID")
-client_secret = config("GOOGLE_CLIENT_SECRET")
-authorization_base_url = config("GOOGLE_AUTH_URL")
-token_url = config("GOOGLE_TOKEN_URL")
+@lru_cache(maxsize=None)
+def google_oauth_config():
+    """Google OAuth settings, read on first use rather than at import"""
+    return {
+        "client_id": config("GOOGLE_CLIENT_ID"),
+        "client_secret": config("GOOGLE_CLIENT_SECRET"),
+        "authorization_base_url": config("GOOGLE_AUTH_URL"),
+        "token_url": config("GOOGLE_TOKEN_URL"),
+    }
+
+
 scope = [
     "openid",
     "https://www.googleapis.com/auth/userinfo.email",
@@ -76,16 +85,17 @@ scope = [
 
 
 def google_setup(redirect_uri: str):
+    oauth_config = google_oauth_config()
     # handles the OAuth 2.0 flow
     google = OAuth2Session(
-        client_id=client_id,
+        client_id=oauth_config["client_id"],
         scope=scope,
         redirect_uri=redirect_uri,
     )
 
     # Redirect user to Google for authorization
     authorization_url = google.authorization_url(
-        authorization_base_url,
+        oauth_config["authorization_base_url"],
         # offline for refresh token
         # force to always make user click authorize
         access_type="offline",
@@ -96,13 +106,17 @@ def google_setup(redirect_uri: str):
 
 
 def google_callback(redirect_uri: str, auth_uri: str, state: str):
+    oauth_config = google_oauth_config()
     google = OAuth2Session(
-        client_id=client_id, scope=scope, redirect_uri=redirect_uri, state=state
+        client_id=oauth_config["client_id"],
+        scope=scope,
+        redirect_uri=redirect_uri,
+        state=state,
     )
 
     google.fetch_token(
-        token_url,
-        client_secret=client_secret,
+        oauth_config["token_url"],
+        client_secret=oauth_config["client_secret"],
         authorization_response=auth_uri,
     )
 
@@ -171,6 +171,20 @@ class TestTrackActivityView(APITestCase):
         activity = UserActivity.objects.get(id=activity_id)
         self.assertEqual(activity.user, self.user)
 
+    def test_tracking_with_non_object_metadata(self):
+        """Test metadata that isn't a JSON object is stored but not ranked"""
+        payload = {
+            "event_type": EventTypeChoices.PAGE_VIEW,
+            "session_id": "list-metadata-session",
+            "page_url": "https://techhive.com/articles/test/",
+            "device_type": "Desktop",
+            "metadata": ["content_type", "content_id"],
+        }
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     def test_creates_session_metrics(self):
         """Test creates SessionMetrics on first activity"""
         payload = {
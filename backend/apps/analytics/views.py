@@ -13,6 +13,7 @@ from apps.common.errors import ErrorCode
 from apps.common.exceptions import NotFoundError
 from apps.common.responses import CustomResponse
 from apps.content.models import Article
+from apps.content.services import trending
 from django.core.cache import cache
 from django.db.models import Avg
 from django.utils import timezone
@@ -216,6 +217,8 @@ class TrackActivityView(APIView):
             metadata=validated_data.get("metadata", {}),
         )
 
+        trending.record_activity(activity.event_type, activity.metadata)
+
         session.page_count += 1
         session.is_bounce = session.page_count == 1
         session.save(update_fields=["page_count", "is_bounce"])
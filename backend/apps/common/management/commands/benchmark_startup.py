@@ -0,0 +1,117 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter: set up Django, import the modules a worker
+# loads, then report any service that got built during import
+STARTUP_SCRIPT = """
+import sys
+import django
+from importlib import import_module
+
+django.setup()
+for module in sys.argv[1:]:
+    import_module(module)
+
+from apps.common.services import _registry
+
+eager = [name for name, service in _registry.items() if service.is_initialized]
+print("EAGER:" + ",".join(eager))
+"""
+
+DEFAULT_MODULES = ["tech_hive.urls", "tech_hive.celery"]
+
+
+def parse_importtime(stderr):
+    """Return (cumulative_us, module) pairs from `python -X importtime` output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        rows.append((int(cumulative), module.strip()))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark interpreter startup (django.setup() + importing URLconf, "
+        "Celery app and services) with `python -X importtime`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument(
+            "--module",
+            action="append",
+            dest="modules",
+            help="Module to import (repeatable), defaults to the URLconf, "
+            "Celery app and SERVICE_MODULES",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=None,
+            help="Fail if the median startup time exceeds this (for CI)",
+        )
+
+    def run_once(self, modules):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT, *modules],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise CommandError(f"Startup failed:\n{result.stderr[-2000:]}")
+
+        eager = []
+        for line in result.stdout.splitlines():
+            if line.startswith("EAGER:"):
+                eager = [name for name in line[len("EAGER:") :].split(",") if name]
+        return elapsed, parse_importtime(result.stderr), eager
+
+    def handle(self, *args, **options):
+        modules = options["modules"] or [
+            *DEFAULT_MODULES,
+            *getattr(settings, "SERVICE_MODULES", []),
+        ]
+        timings, imports, eager = [], [], []
+        for _ in range(options["runs"]):
+            elapsed, imports, eager = self.run_once(modules)
+            timings.append(elapsed)
+
+        median = statistics.median(timings)
+        self.stdout.write(f"Imported: {', '.join(modules)}")
+        self.stdout.write(
+            f"Startup over {len(timings)} runs: median {median:.3f}s, "
+            f"min {min(timings):.3f}s, max {max(timings):.3f}s"
+        )
+
+        self.stdout.write("\nSlowest imports (cumulative, last run):")
+        for cumulative, module in sorted(imports, reverse=True)[: options["top"]]:
+            self.stdout.write(f"  {cumulative / 1000:9.1f} ms  {module}")
+
+        if eager:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"\n⚠️ Services initialized at import time: {', '.join(eager)}"
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS("\n✅ No services initialized at import time")
+            )
+
+        if options["max_seconds"] is not None and median > options["max_seconds"]:
+            raise CommandError(
+                f"Median startup {median:.3f}s exceeds {options['max_seconds']:.3f}s"
+            )
@@ -23,6 +23,8 @@ from apps.content.models import (
     Tool,
     ToolTag,
 )
+from apps.content.tags import resolve_tags
+from apps.content.tasks import reconcile_reaction_counts
 from apps.general.models import SiteDetail
 from apps.subscriptions.models import SubscriptionPlan
 from django.conf import settings
@@ -202,8 +204,7 @@ class CreateData:
             "best-practices",
         ]
 
-        for tag_name in tags:
-            Tag.objects.get_or_create(name=tag_name)
+        resolve_tags(tags)
         logger.info(f"Created {len(tags)} tags")
 
     def create_tool_tags(self):
@@ -580,6 +581,9 @@ class CreateData:
                 )
                 reaction_count += 1
 
+        # Seeded reactions bypass the toggle endpoint, so sync the counters
+        reconcile_reaction_counts()
+
         logger.info(f"Created {reaction_count} article reactions")
 
     def create_comments(self):
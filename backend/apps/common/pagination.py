@@ -1,13 +1,218 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination: pages are fetched with a WHERE on the ordering
+    columns of the last row seen instead of COUNT(*) + OFFSET, so deep pages
+    cost the same as the first one.
+
+    Ordering comes from the view's `keyset_ordering` (falls back to the
+    class `ordering`) and must end in a unique column such as "id". Cursors are
+    opaque to clients; the total count is only computed when the client
+    asks for it with `?include_count=true`.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = tuple(getattr(view, "keyset_ordering", None) or self.ordering)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() == "true":
+            self.count = queryset.count()
+
+        cursor = self.decode_cursor(request, queryset.model)
+        self.has_cursor = cursor is not None
+        self.reverse = bool(cursor and cursor["reverse"])
+
+        ordering = self._invert(self.ordering) if self.reverse else self.ordering
+        if cursor:
+            queryset = queryset.filter(self._seek_filter(ordering, cursor["values"]))
+
+        # Fetch one extra row to know whether there is another page
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        self.has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_next_link(self):
+        if not self.page or not (self.has_more or self.reverse):
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.page or not (self.has_more if self.reverse else self.has_cursor):
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        data = {
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        return Response(data=data, status=200)
+
+    def first_page(self, queryset, ordering=None):
+        """
+        Return the first page of `queryset` and the cursor of the page after
+        it (None on the last page), e.g. to embed a preview in another
+        response that links to the paginated endpoint.
+        """
+        ordering = tuple(ordering or self.ordering)
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        if len(rows) <= self.page_size:
+            return rows, None
+        rows = rows[: self.page_size]
+        values = [self._row_value(rows[-1], field.lstrip("-")) for field in ordering]
+        return rows, self.encode_cursor(values, reverse=False)
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({"v": values, "r": int(reverse)}, default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request, model=None):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values, reverse = payload["v"], bool(payload["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        if model is not None:
+            try:
+                values = [
+                    self._parse_value(model, field.lstrip("-"), value)
+                    for field, value in zip(self.ordering, values)
+                ]
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        return {"values": values, "reverse": reverse}
+
+    def _link(self, row, reverse):
+        values = [self._row_value(row, field.lstrip("-")) for field in self.ordering]
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.count_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values, reverse)
+        )
+
+    @staticmethod
+    def _row_value(row, field):
+        if isinstance(row, dict):  # .values() querysets
+            return row[field]
+        return attrgetter(field.replace("__", "."))(row)
+
+    @staticmethod
+    def _parse_value(model, field, value):
+        """
+        Convert a cursor value with the model field it seeks on, so a
+        tampered cursor fails here instead of in the query.
+        """
+        *relations, name = field.split("__")
+        try:
+            for relation in relations:
+                model = model._meta.get_field(relation).related_model
+            model_field = model._meta.get_field(name)
+        except (FieldDoesNotExist, AttributeError):
+            return value  # annotations are left as they are
+        return model_field.to_python(value)
+
+    @staticmethod
+    def _invert(ordering):
+        return tuple(f[1:] if f.startswith("-") else f"-{f}" for f in ordering)
+
+    @staticmethod
+    def _seek_filter(ordering, values):
+        """
+        Rows strictly after `values` in `ordering`, i.e. for (-a, -b):
+        a < va OR (a = va AND b < vb).
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_paginated_response_schema(self, schema):
+        return DefaultPagination().get_paginated_response_schema(schema)
 
 
 class DefaultPagination(PageNumberPagination):
+    """
+    Page-number pagination. Views that define `keyset_ordering` can also be
+    paged with opaque cursors (see KeysetPagination) by passing
+    `?pagination=cursor` or a `cursor` param; that mode skips COUNT/OFFSET.
+    """
+
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+    mode_query_param = "pagination"
+
+    keyset = None
+
+    def is_keyset_request(self, request, view=None):
+        if not getattr(view, "keyset_ordering", None):
+            return False
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset_request(request, view):
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
         data = {
             "count": self.page.paginator.count,
             "next": self.get_next_link(),
@@ -1,8 +1,36 @@
+from django.db import models
 from rest_framework import serializers
 
 from apps.common.errors import ErrorCode
 
 
+class PageAnnotationMixin:
+    """
+    Per-page annotation hook for serializers.
+
+    When serialized with many=True through PageAnnotatedListSerializer,
+    `annotate_page(instances)` is called once with every instance on the page
+    and its return value is stored on `self.page_annotations`, so field methods
+    can read bulk-resolved data instead of querying per object.
+    For single-object serialization `page_annotations` stays None.
+    """
+
+    page_annotations = None
+
+    def annotate_page(self, instances):
+        return {}
+
+
+class PageAnnotatedListSerializer(serializers.ListSerializer):
+    """ListSerializer that runs the child's annotate_page() before serializing"""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        self.child.page_annotations = self.child.annotate_page(instances)
+        return super().to_representation(instances)
+
+
 class SuccessResponseSerializer(serializers.Serializer):
     status = serializers.CharField(default="success")
     message = serializers.CharField()
@@ -0,0 +1,95 @@
+import logging
+import os
+import threading
+from importlib import import_module
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_registry: Dict[str, "LazyService"] = {}
+
+
+class LazyService:
+    """
+    Stand-in for a module-level service singleton (Redis, API clients...).
+
+    The real instance is built by `factory` on first attribute access instead
+    of at import time, so importing a module never opens connections and a
+    briefly unavailable backend doesn't break startup. Instances are dropped
+    in forked children (gunicorn --preload, Celery prefork) and rebuilt there,
+    so workers never share sockets with their parent.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], object]):
+        self._name = name
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    def get(self):
+        """Return the service instance, building it if needed."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                    logger.debug(f"Initialized service {self._name}")
+                instance = self._instance
+        return instance
+
+    def reset(self) -> None:
+        """Drop the instance; the next access builds a new one."""
+        self._instance = None
+        # A lock held by another thread at fork time stays locked in the child
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        # Only called for attributes not set on the proxy itself
+        if name in ("_name", "_factory", "_instance", "_lock"):
+            raise AttributeError(name)  # e.g. during copy/unpickling
+        return getattr(self.get(), name)
+
+    def __repr__(self):
+        state = "initialized" if self.is_initialized else "lazy"
+        return f"<LazyService {self._name} ({state})>"
+
+
+def get_service(name: str) -> LazyService:
+    return _registry[name]
+
+
+def warm_up_services(names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Build services ahead of the first request (e.g. right after a worker
+    starts). Modules in settings.SERVICE_MODULES are imported first so their
+    services are registered. Failures are logged, not raised: the service is
+    retried lazily on first use. Returns whether each service is ready.
+    """
+    for module in getattr(settings, "SERVICE_MODULES", []):
+        import_module(module)
+
+    results = {}
+    for name in names or list(_registry):
+        try:
+            _registry[name].get()
+            results[name] = True
+        except Exception as e:
+            logger.warning(f"Could not warm up service {name}: {e}")
+            results[name] = False
+    return results
+
+
+def _reset_after_fork():
+    for service in _registry.values():
+        service.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
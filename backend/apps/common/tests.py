@@ -1,3 +1,39 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from apps.common.services import LazyService, _registry, warm_up_services
+from django.test import SimpleTestCase
+
+
+class TestLazyService(SimpleTestCase):
+    def make_service(self, name, factory):
+        service = LazyService(name, factory)
+        self.addCleanup(_registry.pop, name, None)
+        return service
+
+    def test_built_on_first_use_only(self):
+        factory = mock.Mock(return_value=mock.Mock(ping=mock.Mock(return_value=1)))
+        service = self.make_service("test_lazy", factory)
+        factory.assert_not_called()
+        self.assertFalse(service.is_initialized)
+
+        self.assertEqual(service.ping(), 1)
+        self.assertEqual(service.ping(), 1)
+        factory.assert_called_once()
+
+    def test_rebuilt_after_reset(self):
+        factory = mock.Mock(side_effect=lambda: object())
+        service = self.make_service("test_reset", factory)
+        first = service.get()
+        service.reset()  # what the after-fork hook does in a child process
+        self.assertIsNot(service.get(), first)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_warm_up_tolerates_failures(self):
+        self.make_service("test_ok", object)
+        broken = self.make_service(
+            "test_broken", mock.Mock(side_effect=ConnectionError("down"))
+        )
+        with self.settings(SERVICE_MODULES=[]):
+            results = warm_up_services(["test_ok", "test_broken"])
+        self.assertEqual(results, {"test_ok": True, "test_broken": False})
+        self.assertFalse(broken.is_initialized)
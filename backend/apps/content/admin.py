@@ -6,14 +6,27 @@ from django.contrib import admin, messages
 
 @admin.register(models.Category)
 class CategoryAdmin(admin.ModelAdmin):
-    list_display = ["name", "slug", "articles_count", "created_at"]
+    list_display = [
+        "name",
+        "slug",
+        "article_count",
+        "job_count",
+        "event_count",
+        "resource_count",
+        "tool_count",
+        "created_at",
+    ]
     search_fields = ["name"]
-    readonly_fields = ["id", "slug", "created_at"]
-
-    def articles_count(self, obj):
-        return obj.articles.count()
-
-    articles_count.short_description = "Articles"
+    readonly_fields = [
+        "id",
+        "slug",
+        "article_count",
+        "job_count",
+        "event_count",
+        "resource_count",
+        "tool_count",
+        "created_at",
+    ]
 
 
 class UnassignedFilter(admin.SimpleListFilter):
@@ -162,14 +175,9 @@ class ArticleAdmin(admin.ModelAdmin):
 
 @admin.register(models.Tag)
 class TagAdmin(admin.ModelAdmin):
-    list_display = ["name", "articles_count", "created_at"]
+    list_display = ["name", "article_count", "created_at"]
     search_fields = ["name"]
-    readonly_fields = ["id", "created_at"]
-
-    def articles_count(self, obj):
-        return obj.articles.count()
-
-    articles_count.short_description = "Articles"
+    readonly_fields = ["id", "article_count", "created_at"]
 
 
 @admin.register(models.ArticleReaction)
@@ -311,14 +319,9 @@ class ResourceAdmin(admin.ModelAdmin):
 
 @admin.register(models.ToolTag)
 class ToolTagAdmin(admin.ModelAdmin):
-    list_display = ["name", "tools_count", "created_at"]
+    list_display = ["name", "tool_count", "created_at"]
     search_fields = ["name"]
-    readonly_fields = ["id", "created_at"]
-
-    def tools_count(self, obj):
-        return obj.tool_set.count()
-
-    tools_count.short_description = "Tools"
+    readonly_fields = ["id", "tool_count", "created_at"]
 
 
 @admin.register(models.Tool)
@@ -0,0 +1,57 @@
+"""
+Plain-text excerpts of rich text (CKEditor HTML) for list responses.
+
+Excerpts are computed when content is saved and stored next to it, so list
+endpoints can defer the full body column instead of loading and stripping
+every body on each request.
+"""
+
+import html
+import re
+
+from django.utils.html import strip_tags
+
+ARTICLE_EXCERPT_LENGTH = 200
+EXCERPT_LENGTH = 150  # resources and tools
+IMAGE_URL_MAX_LENGTH = 500
+
+# Tags that separate words once the markup is gone ("<p>a</p><p>b</p>")
+_BLOCK_TAG = re.compile(
+    r"<(?=/?(?:p|div|br|li|h[1-6]|blockquote|pre|tr|td|th|figcaption)\b)",
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+_IMAGE_SRC = re.compile(
+    r"""<img\b[^>]*?\bsrc\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE
+)
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Return `text` (HTML) as plain text of at most `length` characters, with
+    entities decoded and whitespace collapsed. Escaped text such as
+    "Vec&lt;u8&gt;" is kept as "Vec<u8>", so the excerpt is plain text and
+    must be escaped when rendered as HTML.
+    """
+    if not text:
+        return ""
+    plain = html.unescape(strip_tags(_BLOCK_TAG.sub(" <", text)))
+    plain = _WHITESPACE.sub(" ", plain).strip()
+    if len(plain) <= length:
+        return plain
+    return plain[: length - 3].rstrip() + "..."
+
+
+def first_image_url(text):
+    """Return the src of the first <img> in `text` (HTML) if it's a web URL."""
+    if not text:
+        return ""
+    match = _IMAGE_SRC.search(text)
+    if match is None:
+        return ""
+    url = html.unescape(next(group for group in match.groups() if group is not None))
+    url = url.strip()
+    # Skip inline data: URIs (often huge) and anything script-like
+    if not url.startswith(("http://", "https://", "/")):
+        return ""
+    return url if len(url) <= IMAGE_URL_MAX_LENGTH else ""
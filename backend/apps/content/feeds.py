@@ -1,29 +1,51 @@
-from apps.content.models import Article
+from functools import partial
+
+from apps.content.models import Article, Category, Tag
+from apps.content.services.content_cache import content_cache
 from decouple import config
 from django.conf import settings
 from django.contrib.syndication.views import Feed
-from django.template.defaultfilters import truncatewords_html
+from django.db.models import F
+from django.shortcuts import get_object_or_404
 
 
-class LatestArticlesFeed(Feed):
-    title = "Tech Hive"
+class CachedFeed(Feed):
+    """
+    Feed whose rendered XML is cached until published content changes, with
+    ETag/Last-Modified validators so pollers get 304s.
 
-    if settings.DEBUG:
-        link = config("FRONTEND_URL_DEV")
-    else:
-        link = config("FRONTEND_URL_PROD")
+    Feeds only show published articles, their tags and categories, all of
+    which bump the "global" content version, so the version doubles as the
+    cache key and the validator (see ContentCacheService).
+    """
 
-    # link = "/api/v1/articles/"
-    description = "New posts of Tech Hive."
+    version_scopes = ["global"]
 
-    def items(self):
-        return Article.objects.published().all()[:5]
+    def __call__(self, request, *args, **kwargs):
+        return content_cache.cached_http_response(
+            request,
+            self.version_scopes,
+            partial(super().__call__, request, *args, **kwargs),
+            str(settings.RSS_FEED_ITEMS),
+        )
+
+    def get_queryset(self, obj):
+        return Article.published.all()
+
+    def items(self, obj=None):
+        return (
+            self.get_queryset(obj)
+            .only("title", "slug", "excerpt", "published_at", "created_at")
+            .order_by(F("published_at").desc(nulls_last=True), "-created_at")[
+                : settings.RSS_FEED_ITEMS
+            ]
+        )
 
     def item_title(self, item):
         return item.title
 
     def item_description(self, item):
-        return truncatewords_html(item.content, 30)
+        return item.excerpt
 
     def item_pubdate(self, item):
         return item.published_at
@@ -32,3 +54,43 @@ class LatestArticlesFeed(Feed):
         # This provides individual article links
         # return f"/articles/{item.slug}/"
         return f"{self.link}/articles/{item.slug}/"
+
+
+class LatestArticlesFeed(CachedFeed):
+    title = "Tech Hive"
+
+    if settings.DEBUG:
+        link = config("FRONTEND_URL_DEV")
+    else:
+        link = config("FRONTEND_URL_PROD")
+
+    # link = "/api/v1/articles/"
+    description = "New posts of Tech Hive."
+
+
+class CategoryArticlesFeed(LatestArticlesFeed):
+    def get_object(self, request, slug):
+        return get_object_or_404(Category, slug=slug)
+
+    def title(self, obj):
+        return f"Tech Hive: {obj.name}"
+
+    def description(self, obj):
+        return f"New {obj.name} posts of Tech Hive."
+
+    def get_queryset(self, obj):
+        return Article.published.filter(category=obj)
+
+
+class TagArticlesFeed(LatestArticlesFeed):
+    def get_object(self, request, name):
+        return get_object_or_404(Tag, name=name.lower())
+
+    def title(self, obj):
+        return f"Tech Hive: #{obj.name}"
+
+    def description(self, obj):
+        return f"New posts tagged {obj.name} on Tech Hive."
+
+    def get_queryset(self, obj):
+        return Article.published.filter(tags=obj)
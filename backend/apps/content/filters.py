@@ -1,7 +1,9 @@
 import django_filters
 from apps.content.choices import ArticleReviewStatusChoices
 from apps.content.models import Article, ArticleReview, ArticleStatusChoices, Event, Job
+from apps.content.search import search_articles
 from django_filters import rest_framework as filters
+from rest_framework.filters import BaseFilterBackend
 
 
 class JobFilter(django_filters.FilterSet):
@@ -101,3 +103,15 @@ class ReviewListFilter(filters.FilterSet):
     class Meta:
         model = ArticleReview
         fields = []
+
+
+class ArticleSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text search over articles using the `search` query param.
+    Replaces SearchFilter's ILIKE scans, see apps.content.search.
+    """
+
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        return search_articles(queryset, request.query_params.get(self.search_param))
@@ -0,0 +1,62 @@
+import random
+import time
+
+from apps.content.utils import ReadabilityMetrics
+from django.core.management.base import BaseCommand
+
+WORDS = (
+    "the a of to and in is it that for on with as python django database "
+    "query cache latency throughput serializer middleware asynchronous "
+    "infrastructure observability configuration deployment readable simple"
+).split()
+
+
+def make_article(rng, paragraphs):
+    parts = []
+    for _ in range(paragraphs):
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 30))).capitalize()
+            + rng.choice([".", "!", "?"])
+            for _ in range(rng.randint(3, 8))
+        ]
+        parts.append(f"<p>{' '.join(sentences)}</p>")
+        if rng.random() < 0.2:
+            parts.append("![diagram](https://example.com/diagram.png)")
+        if rng.random() < 0.1:
+            parts.append("```\nprint('hello world')\n```")
+    return "\n".join(parts)
+
+
+class Command(BaseCommand):
+    help = "Benchmark ReadabilityMetrics.analyze_many() against per-article analyze()."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=3000)
+        parser.add_argument("--paragraphs", type=int, default=12)
+        parser.add_argument("--workers", type=int, default=None)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        texts = [
+            make_article(rng, options["paragraphs"]) for _ in range(options["articles"])
+        ]
+        self.stdout.write(f"Generated {len(texts)} synthetic articles")
+
+        start = time.perf_counter()
+        baseline = [ReadabilityMetrics.analyze(text) for text in texts]
+        baseline_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = ReadabilityMetrics.analyze_many(texts, workers=options["workers"])
+        bulk_time = time.perf_counter() - start
+
+        if bulk != baseline:
+            self.stdout.write(self.style.ERROR("❌ analyze_many() results differ"))
+            return
+
+        self.stdout.write(f"analyze() per article: {baseline_time:.3f}s")
+        self.stdout.write(f"analyze_many():        {bulk_time:.3f}s")
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Speedup: {baseline_time / bulk_time:.2f}x")
+        )
@@ -0,0 +1,22 @@
+from apps.content.tasks import rebuild_related_articles
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild the precomputed related-articles lists of published articles."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of article ids loaded per batch",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_related_articles(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully rebuilt related articles for {rebuilt} articles."
+            )
+        )
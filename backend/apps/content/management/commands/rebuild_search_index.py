@@ -0,0 +1,51 @@
+from apps.content import search
+from apps.content.choices import ArticleStatusChoices
+from apps.content.models import Article
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for published articles."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Number of articles loaded and indexed per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = (
+            Article.objects.filter(status=ArticleStatusChoices.PUBLISHED)
+            .order_by("pk")
+            .only("pk", "title", "content", "status")
+            .prefetch_related("tags")
+        )
+
+        with transaction.atomic():
+            search.clear_index()
+
+            indexed = 0
+            last_pk = None
+            while True:
+                # Keyset batching keeps memory flat and avoids OFFSET scans
+                batch_qs = (
+                    queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+                )
+                batch = list(batch_qs[:batch_size])
+                if not batch:
+                    break
+
+                for article in batch:
+                    search.index_article(article)
+
+                indexed += len(batch)
+                last_pk = batch[-1].pk
+                self.stdout.write(f"Indexed {indexed} articles...")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully indexed {indexed} articles.")
+        )
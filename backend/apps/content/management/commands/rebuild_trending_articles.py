@@ -0,0 +1,15 @@
+from apps.content.tasks import rebuild_trending_articles
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the trending articles ranking in Redis from recent analytics "
+        "events, reactions, comments and saves."
+    )
+
+    def handle(self, *args, **options):
+        ranked = rebuild_trending_articles()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt trending scores for {ranked} articles.")
+        )
@@ -0,0 +1,15 @@
+from apps.content.tasks import recompute_content_counts
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the published content counters on categories, tags and "
+        "tool tags from their source tables."
+    )
+
+    def handle(self, *args, **options):
+        updated = recompute_content_counts()
+        for model, rows in updated.items():
+            self.stdout.write(f"{model}: {rows} rows recomputed")
+        self.stdout.write(self.style.SUCCESS("Successfully recomputed content counts."))
@@ -0,0 +1,69 @@
+from collections import defaultdict
+
+from apps.content.models import Comment, CommentLike
+from apps.content.services import comment_like_service
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Redis comment like sets and top comments rankings from the "
+        "database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of comments restored per batch",
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Replace like sets already in Redis. By default they are kept, "
+            "since they may hold likes not yet persisted.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = (
+            Comment.objects.filter(like_count__gt=0)
+            .order_by("pk")
+            .values_list("pk", "article_id", "is_root", "like_count", named=True)
+        )
+
+        restored = 0
+        last_pk = None
+        while True:
+            # Keyset batching keeps memory flat and avoids OFFSET scans
+            batch_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            batch = list(batch_qs[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            comment_ids = [comment.pk for comment in batch]
+
+            likes = defaultdict(list)
+            rows = CommentLike.objects.filter(comment_id__in=comment_ids).values_list(
+                "comment_id", "user_id"
+            )
+            for comment_id, user_id in rows:
+                likes[str(comment_id)].append(str(user_id))
+
+            restored += comment_like_service.restore_likes(
+                dict(likes), overwrite=options["overwrite"]
+            )
+
+            ranking = defaultdict(dict)
+            for comment in batch:
+                if comment.is_root:
+                    ranking[comment.article_id][str(comment.pk)] = comment.like_count
+            comment_like_service.restore_top_comments(
+                ranking, overwrite=options["overwrite"]
+            )
+            self.stdout.write(f"Restored likes for {restored} comments...")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully restored likes for {restored} comments.")
+        )
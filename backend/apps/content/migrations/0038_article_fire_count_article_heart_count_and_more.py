@@ -0,0 +1,71 @@
+# Generated by Django 5.2.4 on 2026-10-16 21:08
+
+from django.db import migrations, models
+from django.db.models import Count
+
+COUNTER_FIELDS = {
+    "❤️": "heart_count",
+    "😍": "heart_eyes_count",
+    "👍": "thumbs_up_count",
+    "🔥": "fire_count",
+}
+
+
+def backfill_reaction_counts(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+    ArticleReaction = apps.get_model("content", "ArticleReaction")
+
+    counts = {}
+    rows = ArticleReaction.objects.values("article_id", "reaction_type").annotate(
+        count=Count("id")
+    )
+    for row in rows:
+        field = COUNTER_FIELDS.get(row["reaction_type"])
+        if field is None:
+            continue
+        article_counts = counts.setdefault(row["article_id"], {})
+        article_counts[field] = row["count"]
+        article_counts["total_reaction_count"] = (
+            article_counts.get("total_reaction_count", 0) + row["count"]
+        )
+
+    for article_id, fields in counts.items():
+        Article.objects.filter(pk=article_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0037_alter_event_agenda_alter_job_requirements_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='fire_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='heart_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='heart_eyes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='thumbs_up_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='total_reaction_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_reaction_counts, reverse_code=migrations.RunPython.noop
+        ),
+    ]
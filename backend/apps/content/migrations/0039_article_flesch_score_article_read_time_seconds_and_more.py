@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-16 21:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0038_article_fire_count_article_heart_count_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='flesch_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='read_time_seconds',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:05
+
+from django.db import migrations, models
+
+
+def mark_root_comments(apps, schema_editor):
+    Comment = apps.get_model("content", "Comment")
+    CommentThread = apps.get_model("content", "CommentThread")
+    Comment.objects.filter(
+        pk__in=CommentThread.objects.values("root_comment_id")
+    ).update(is_root=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0040_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="is_root",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(mark_root_comments, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_root", True)),
+                fields=["article", "is_active", "-created_at"],
+                name="content_comment_root_idx",
+            ),
+        ),
+    ]
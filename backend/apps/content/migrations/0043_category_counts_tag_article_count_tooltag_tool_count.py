@@ -0,0 +1,103 @@
+# Generated by Django 5.2.4 on 2026-10-16 23:30
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, outer_field):
+    counts = (
+        queryset.filter(**{outer_field: OuterRef("pk")})
+        .order_by()
+        .values(outer_field)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def compute_counts(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+    Category = apps.get_model("content", "Category")
+    Tag = apps.get_model("content", "Tag")
+    ToolTag = apps.get_model("content", "ToolTag")
+    published = {"is_published": True}
+
+    Category.objects.update(
+        article_count=count_subquery(
+            Article.objects.filter(status="published"), "category"
+        ),
+        job_count=count_subquery(
+            apps.get_model("content", "Job").objects.filter(**published), "category"
+        ),
+        event_count=count_subquery(
+            apps.get_model("content", "Event").objects.filter(**published),
+            "category",
+        ),
+        resource_count=count_subquery(
+            apps.get_model("content", "Resource").objects.filter(**published),
+            "category",
+        ),
+        tool_count=count_subquery(
+            apps.get_model("content", "Tool").objects.filter(**published), "category"
+        ),
+    )
+    Tag.objects.update(
+        article_count=count_subquery(
+            Article.tags.through.objects.filter(article__status="published"), "tag"
+        )
+    )
+    ToolTag.objects.update(
+        tool_count=count_subquery(
+            apps.get_model("content", "Tool").tags.through.objects.filter(
+                tool__is_published=True
+            ),
+            "tooltag",
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0042_comment_like_count_commentlike"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="article_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="event_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="job_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="resource_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="tool_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="article_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tooltag",
+            name="tool_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(compute_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:10
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0043_category_counts_tag_article_count_tooltag_tool_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('score', models.FloatField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='content.article')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_to_entries', to='content.article')),
+            ],
+            options={
+                'ordering': ['-score'],
+                'indexes': [models.Index(fields=['article', '-score'], name='content_rel_article_27998f_idx')],
+                'unique_together': {('article', 'related')},
+            },
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:10
+
+import html
+import re
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# Frozen copy of apps.content.excerpts as of this migration, so later edits
+# to that module don't change what it writes
+ARTICLE_EXCERPT_LENGTH = 200
+EXCERPT_LENGTH = 150
+IMAGE_URL_MAX_LENGTH = 500
+
+_BLOCK_TAG = re.compile(
+    r"<(?=/?(?:p|div|br|li|h[1-6]|blockquote|pre|tr|td|th|figcaption)\b)",
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+_IMAGE_SRC = re.compile(
+    r"""<img\b[^>]*?\bsrc\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE
+)
+
+
+def make_excerpt(text, length):
+    if not text:
+        return ""
+    plain = html.unescape(strip_tags(_BLOCK_TAG.sub(" <", text)))
+    plain = _WHITESPACE.sub(" ", plain).strip()
+    if len(plain) <= length:
+        return plain
+    return plain[: length - 3].rstrip() + "..."
+
+
+def first_image_url(text):
+    if not text:
+        return ""
+    match = _IMAGE_SRC.search(text)
+    if match is None:
+        return ""
+    url = html.unescape(next(group for group in match.groups() if group is not None))
+    url = url.strip()
+    if not url.startswith(("http://", "https://", "/")):
+        return ""
+    return url if len(url) <= IMAGE_URL_MAX_LENGTH else ""
+
+
+def batched(queryset, batch_size=500):
+    last_pk = None
+    while True:
+        batch_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_qs.order_by("pk")[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_pk = batch[-1].pk
+
+
+def fill_excerpts(apps, schema_editor):
+    Article = apps.get_model("content", "Article")
+    for batch in batched(Article.objects.only("pk", "content")):
+        for article in batch:
+            article.excerpt = make_excerpt(article.content, ARTICLE_EXCERPT_LENGTH)
+            article.first_image_url = first_image_url(article.content)
+        Article.objects.bulk_update(batch, ["excerpt", "first_image_url"])
+
+    for model_name, source in (("Resource", "body"), ("Tool", "desc")):
+        model = apps.get_model("content", model_name)
+        for batch in batched(model.objects.only("pk", source)):
+            for obj in batch:
+                obj.excerpt = make_excerpt(getattr(obj, source), EXCERPT_LENGTH)
+            model.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0044_relatedarticle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="first_image_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="resource",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.AddField(
+            model_name="tool",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:05
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0045_article_excerpt_article_first_image_url_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleSummary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('model', models.CharField(max_length=100)),
+                ('summary', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ai_summary', to='content.article')),
+            ],
+            options={
+                'verbose_name_plural': 'Article Summaries',
+            },
+        ),
+    ]
@@ -1,5 +1,15 @@
+import logging
+import time
+
+from apps.content.services.content_cache import content_cache
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+from redis import RedisError
 from rest_framework.settings import api_settings
 
+logger = logging.getLogger(__name__)
+
+
 class HeaderMixin:
     """
     Mixin to provide get_success_headers method for APIView classes
@@ -8,4 +18,61 @@ class HeaderMixin:
         try:
             return {'Location': str(data[api_settings.URL_FIELD_NAME])}
         except (TypeError, KeyError):
-            return {}
\ No newline at end of file
+            return {}
+
+
+class ConditionalGetMixin:
+    """
+    Mixin for APIView detail endpoints: answers GET with 304 Not Modified
+    when the client's If-None-Match / If-Modified-Since match, using
+    validators built from content versions (see ContentCacheService), so an
+    unchanged object is neither queried nor serialized.
+
+    Set `version_scopes`, or override get_version_scopes() when they depend
+    on the URL. Responses that vary per user should set `vary_on_user`.
+    Responses that also show data no version tracks (e.g. author profiles)
+    can set `validator_max_age` (seconds) to rotate their ETag periodically.
+    Either setting drops Last-Modified, leaving the ETag as the only validator.
+    """
+
+    version_scopes = ()
+    vary_on_user = False
+    validator_max_age = None
+
+    def get_version_scopes(self, request, **kwargs):
+        return self.version_scopes
+
+    def conditional_response(self, request, build_response, **kwargs):
+        extra = [request.path]
+        if self.vary_on_user and request.user.is_authenticated:
+            extra.append(str(request.user.pk))
+        if self.validator_max_age:
+            extra.append(str(int(time.time() // self.validator_max_age)))
+
+        try:
+            etag, last_modified = content_cache.get_validators(
+                self.get_version_scopes(request, **kwargs), *extra
+            )
+        except RedisError as e:
+            logger.error(f"Content versions unavailable, skipping validators: {e}")
+            return build_response()
+        etag = quote_etag(etag)
+        if self.vary_on_user or self.validator_max_age:
+            # Only the ETag carries the user and the rotation, so a client
+            # sending just If-Modified-Since must not get a 304
+            last_modified = None
+
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = build_response()
+            if response.status_code != 200:
+                return response
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        if self.vary_on_user:
+            patch_vary_headers(response, ["Authorization"])
+        return response
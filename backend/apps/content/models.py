@@ -1,6 +1,13 @@
 from apps.common.models import BaseModel
 from apps.common.validators import validate_file_size
+from apps.content import search
 from apps.content.choices import ArticleReviewStatusChoices, ArticleStatusChoices
+from apps.content.excerpts import (
+    ARTICLE_EXCERPT_LENGTH,
+    EXCERPT_LENGTH,
+    first_image_url,
+    make_excerpt,
+)
 from apps.content.manager import (
     ActiveManager,
     ContentManager,
@@ -9,17 +16,124 @@ from apps.content.manager import (
 )
 from apps.content.utils import ReadabilityMetrics
 from autoslug import AutoSlugField
+from django.apps import apps as django_apps
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from django_ckeditor_5.fields import CKEditor5Field
 
 
-class Tag(BaseModel):
+def count_subquery(queryset, outer_field):
+    """COUNT of `queryset` rows whose `outer_field` points at the outer row."""
+    counts = (
+        queryset.filter(**{outer_field: OuterRef("pk")})
+        .order_by()
+        .values(outer_field)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class CountersMixin:
+    """
+    Denormalized counter columns recomputed from their source tables.
+
+    `counter_sources` maps each counter field to what it counts: (model
+    label, filter kwargs, field of that model pointing at the counting row).
+    Counters are refreshed for the affected rows whenever what they count
+    changes (see signals.py), so reads are plain column reads.
+    `counter_scopes` are the content cache scopes showing the counters.
+    """
+
+    counter_sources = {}
+    counter_scopes = ()
+
+    @classmethod
+    def counter_expressions(cls):
+        """Map each counter field to the expression recomputing it."""
+        expressions = {}
+        for field, (label, filters, outer_field) in cls.counter_sources.items():
+            model = django_apps.get_model(label)
+            expressions[field] = count_subquery(
+                model._default_manager.filter(**filters), outer_field
+            )
+        return expressions
+
+    @classmethod
+    def refresh_counts(cls, pks=None):
+        """Recompute counters for rows in `pks` (all rows if None) in one UPDATE."""
+        queryset = cls.objects.all()
+        if pks is not None:
+            pks = [pk for pk in pks if pk is not None]
+            if not pks:
+                return 0
+            queryset = queryset.filter(pk__in=pks)
+        updated = queryset.update(**cls.counter_expressions())
+        if updated and cls.counter_scopes:
+            from apps.content.services.content_cache import content_cache
+
+            content_cache.bump(*cls.counter_scopes)
+        return updated
+
+
+class ExcerptMixin:
+    """
+    Keeps `excerpt`, a plain-text preview of the `excerpt_source` field, up
+    to date on save so lists can defer the full field.
+    """
+
+    excerpt_source = None
+    excerpt_length = EXCERPT_LENGTH
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if self.excerpt_source in self.__dict__ and (  # skip when deferred
+            update_fields is None or self.excerpt_source in update_fields
+        ):
+            self.excerpt = make_excerpt(
+                getattr(self, self.excerpt_source), self.excerpt_length
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "excerpt"}
+        super().save(*args, **kwargs)
+
+
+class CategoryCountedMixin:
+    """
+    Remembers the category and published state loaded from the database, so
+    saves can tell whether category counters need a refresh without reading
+    the row again (see signals.refresh_category_counts).
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_counted_state = (
+            instance.__dict__.get("category_id"),
+            instance.__dict__.get("is_published"),
+        )
+        return instance
+
+
+class Tag(CountersMixin, BaseModel):
     name = models.CharField(max_length=20, unique=True)
+    # Published articles with this tag
+    article_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_sources = {
+        "article_count": (
+            "content.Article_tags",
+            {"article__status": ArticleStatusChoices.PUBLISHED},
+            "tag",
+        ),
+    }
+    counter_scopes = ("tag_index",)
 
     class Meta:
         ordering = ["name"]
@@ -35,11 +149,31 @@ class Tag(BaseModel):
         return self.name
 
 
-class Category(BaseModel):
+class Category(CountersMixin, BaseModel):
     name = models.CharField(max_length=250)
     slug = AutoSlugField(populate_from="name", unique=True, always_update=True)
     desc = models.TextField()
 
+    # Published content in this category
+    article_count = models.PositiveIntegerField(default=0, editable=False)
+    job_count = models.PositiveIntegerField(default=0, editable=False)
+    event_count = models.PositiveIntegerField(default=0, editable=False)
+    resource_count = models.PositiveIntegerField(default=0, editable=False)
+    tool_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_sources = {
+        "article_count": (
+            "content.Article",
+            {"status": ArticleStatusChoices.PUBLISHED},
+            "category",
+        ),
+        "job_count": ("content.Job", {"is_published": True}, "category"),
+        "event_count": ("content.Event", {"is_published": True}, "category"),
+        "resource_count": ("content.Resource", {"is_published": True}, "category"),
+        "tool_count": ("content.Tool", {"is_published": True}, "category"),
+    }
+    counter_scopes = ("categories",)
+
     class Meta:
         ordering = ["name"]
         indexes = [
@@ -102,12 +236,113 @@ class Article(BaseModel):
         null=True, blank=True, help_text="Last time content was synced from Liveblocks"
     )
 
+    # Denormalized reaction counters (source of truth is ArticleReaction).
+    # Updated atomically when reactions are toggled and reconciled periodically.
+    heart_count = models.PositiveIntegerField(default=0)
+    heart_eyes_count = models.PositiveIntegerField(default=0)
+    thumbs_up_count = models.PositiveIntegerField(default=0)
+    fire_count = models.PositiveIntegerField(default=0)
+    total_reaction_count = models.PositiveIntegerField(default=0)
+
+    # Readability metrics, recomputed in save() whenever content changes
+    read_time_seconds = models.PositiveIntegerField(default=0)
+    flesch_score = models.FloatField(null=True, blank=True)
+    word_count = models.PositiveIntegerField(default=0)
+
+    READABILITY_FIELDS = ["read_time_seconds", "flesch_score", "word_count"]
+
+    # Plain-text preview and first inline image of content, also refreshed in
+    # save() so lists never load content (see apps.content.excerpts)
+    excerpt = models.CharField(
+        max_length=ARTICLE_EXCERPT_LENGTH, blank=True, editable=False
+    )
+    first_image_url = models.CharField(max_length=500, blank=True, editable=False)
+
+    EXCERPT_FIELDS = ["excerpt", "first_image_url"]
+
+    # Weighted full-text document (PostgreSQL only, see apps.content.search).
+    # Its GIN index is created in migration 0040 so SQLite can skip it.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Saving any of these refreshes the article's search index entry
+    SEARCH_FIELDS = {"title", "content", "status"}
+
     objects = models.Manager()
     published = PublishedManager()
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded content so save() can tell whether it changed
+        instance._loaded_content = instance.__dict__.get("content")
+        instance._loaded_status = instance.__dict__.get("status")
+        instance._loaded_category_id = instance.__dict__.get("category_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        content_saved = update_fields is None or "content" in update_fields
+        if (
+            content_saved
+            and "content" in self.__dict__  # skip when content is deferred
+            and (
+                self._state.adding
+                or self.content != getattr(self, "_loaded_content", None)
+            )
+        ):
+            self.update_readability_metrics()
+            self.update_excerpt()
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    *self.READABILITY_FIELDS,
+                    *self.EXCERPT_FIELDS,
+                }
+
+        super().save(*args, **kwargs)
+        self._loaded_content = self.__dict__.get("content")
+
+        # Only published articles are indexed and publicly visible, so saving
+        # a draft that never was published (autosaves included) skips both
+        if ArticleStatusChoices.PUBLISHED in (
+            self.status,
+            getattr(self, "_loaded_status", None),
+        ):
+            search_saved = update_fields is None or bool(
+                self.SEARCH_FIELDS.intersection(update_fields)
+            )
+            if search_saved:
+                search.index_article(self)
+
+            from apps.content.services.content_cache import content_cache
+
+            content_cache.invalidate_article(self)
+        self.refresh_related_counts()
+        self._loaded_status = self.status
+        self._loaded_category_id = self.category_id
+
+    def refresh_related_counts(self):
+        """
+        Refresh the category and tag article counters this save affects:
+        only published articles are counted, so it's a no-op unless the
+        article is or was published.
+        """
+        was_published = (
+            getattr(self, "_loaded_status", None) == ArticleStatusChoices.PUBLISHED
+        )
+        is_published = self.status == ArticleStatusChoices.PUBLISHED
+        if not (was_published or is_published):
+            return
+
+        loaded_category_id = getattr(self, "_loaded_category_id", None)
+        if was_published != is_published or loaded_category_id != self.category_id:
+            Category.refresh_counts({loaded_category_id, self.category_id})
+        if was_published != is_published:
+            Tag.refresh_counts(self.tags.values_list("pk", flat=True))
+
     def clean(self):
         if self.tags.count() > 5:
             raise ValidationError("Maximum 5 tags allowed per article")
@@ -125,6 +360,22 @@ class Article(BaseModel):
     def calculate_read_time(self):
         return ReadabilityMetrics.method_hybrid(self.content)
 
+    def update_readability_metrics(self, metrics=None):
+        """
+        Set the persisted readability metrics (no save). Computes them from
+        content unless precomputed `metrics` from analyze_many() are given.
+        """
+        if metrics is None:
+            metrics = ReadabilityMetrics.analyze(self.content or "")
+        self.read_time_seconds = metrics["read_time_seconds"]
+        self.flesch_score = metrics["flesch_score"]
+        self.word_count = metrics["word_count"]
+
+    def update_excerpt(self):
+        """Set the persisted excerpt and first image URL from content (no save)."""
+        self.excerpt = make_excerpt(self.content, ARTICLE_EXCERPT_LENGTH)
+        self.first_image_url = first_image_url(self.content)
+
     @property
     def cover_image_url(self):
         try:
@@ -133,24 +384,58 @@ class Article(BaseModel):
             url = ""
         return url
 
-    # NOTE: IF THESE BECOMES A PERFORMANCE ISSUE CACHE THE COUNT
     @property
     def total_reaction_counts(self):
-        return self.reactions.count()
+        return self.total_reaction_count
 
     @property
     def reaction_counts(self):
         """
-        Returns a dict like {'❤️': 5, '👍': 2, ...} for this article.
+        Returns a dict like {'❤️': 5, '👍': 2, ...} for this article,
+        read from the denormalized counter columns (no extra queries).
+        """
+        counts = {}
+        for reaction_type, field in ArticleReaction.COUNTER_FIELDS.items():
+            count = getattr(self, field)
+            if count:
+                counts[reaction_type] = count
+        return counts
+
+    def compute_reaction_counts(self):
+        """
+        Aggregate reaction counts straight from ArticleReaction.
+        Returns a dict like {'❤️': 5, '👍': 2, ...}.
         """
         counts = self.reactions.values("reaction_type").annotate(count=Count("id"))
         return {item["reaction_type"]: item["count"] for item in counts}
 
+    def adjust_reaction_count(self, reaction_type, delta):
+        """
+        Atomically add `delta` (+1/-1) to the counter for `reaction_type`
+        and the total, then reload the counters on this instance.
+        """
+        field = ArticleReaction.COUNTER_FIELDS[reaction_type]
+        Article.objects.filter(pk=self.pk).update(
+            **{
+                field: Greatest(F(field) + delta, 0),
+                "total_reaction_count": Greatest(F("total_reaction_count") + delta, 0),
+            }
+        )
+        self.refresh_from_db(fields=[field, "total_reaction_count"])
+
+        from apps.content.services.content_cache import content_cache
+
+        content_cache.invalidate_article(self)
+
     @property
     def all_comments_count(self):
         """Total active comments on this article"""
         return self.comments.filter(is_active=True).count()
 
+    def root_comments(self):
+        """Active comments that start a thread (see content_comment_root_idx)"""
+        return Comment.active.filter(article=self, is_root=True)
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
@@ -178,6 +463,14 @@ class ArticleReaction(BaseModel):
     )
     reaction_type = models.CharField(max_length=20, choices=EMOJI_CHOICES)
 
+    # Maps each reaction type to its counter column on Article
+    COUNTER_FIELDS = {
+        "❤️": "heart_count",
+        "😍": "heart_eyes_count",
+        "👍": "thumbs_up_count",
+        "🔥": "fire_count",
+    }
+
     class Meta:
         unique_together = ("user", "article", "reaction_type")
 
@@ -207,6 +500,54 @@ class SavedArticle(BaseModel):
         return self.article.title
 
 
+class RelatedArticle(BaseModel):
+    """
+    Precomputed top-k neighbour of a published article (see
+    apps.content.related), so related articles are one indexed lookup.
+    """
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="related_entries"
+    )
+    related = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="related_to_entries"
+    )
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("article", "related")
+        ordering = ["-score"]
+        indexes = [
+            models.Index(fields=["article", "-score"]),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} ~ {self.related_id} ({self.score:.3f})"
+
+
+class ArticleSummary(BaseModel):
+    """
+    Latest AI summary of an article, the durable tier behind the Redis
+    summaries cache (see GroqAIService). `content_hash` identifies the
+    cleaned content and model it was generated from, so edits are detected
+    and unchanged content is never summarized twice.
+    """
+
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, related_name="ai_summary"
+    )
+    content_hash = models.CharField(max_length=64)
+    model = models.CharField(max_length=100)
+    summary = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Article Summaries"
+
+    def __str__(self):
+        return f"Summary of {self.article_id} ({self.model})"
+
+
 class ArticleReview(BaseModel):
 
     article = models.ForeignKey(
@@ -353,6 +694,14 @@ class CommentThread(BaseModel):
     def __str__(self):
         return f"Thread for {self.article.title} - {self.reply_count} replies"
 
+    def save(self, *args, **kwargs):
+        creating = self._state.adding
+        super().save(*args, **kwargs)
+        if creating:
+            # Denormalized so root comments can be listed without a join
+            self.root_comment.is_root = True
+            Comment.objects.filter(pk=self.root_comment_id).update(is_root=True)
+
 
 class Comment(BaseModel):
     thread = models.ForeignKey(
@@ -374,6 +723,10 @@ class Comment(BaseModel):
     )
     body = models.CharField(max_length=250)
     is_active = models.BooleanField(default=True)  # for moderation purposes
+    # True for comments that start a thread, set when the thread is created
+    is_root = models.BooleanField(default=False, editable=False)
+    # Written behind from Redis by sync_comment_likes, may lag by a minute
+    like_count = models.PositiveIntegerField(default=0, editable=False)
 
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -384,6 +737,11 @@ class Comment(BaseModel):
         ordering = ("-created_at",)
         indexes = [
             models.Index(fields=["thread", "-created_at"]),
+            models.Index(
+                fields=["article", "is_active", "-created_at"],
+                condition=models.Q(is_root=True),
+                name="content_comment_root_idx",
+            ),
         ]
 
     def __str__(self):
@@ -427,7 +785,30 @@ class CommentMention(BaseModel):
         ]
 
 
-class Job(BaseModel):
+class CommentLike(BaseModel):
+    """
+    Durable copy of comment likes. Redis (CommentLikeService) serves and
+    changes likes; sync_comment_likes persists them here so they survive a
+    Redis flush and can be rehydrated with `manage.py rehydrate_comment_likes`.
+    """
+
+    comment = models.ForeignKey(
+        Comment, related_name="likes", on_delete=models.CASCADE
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="comment_likes",
+        on_delete=models.CASCADE,
+    )
+
+    class Meta:
+        unique_together = ("comment", "user")
+
+    def __str__(self):
+        return f"{self.user_id} likes {self.comment_id}"
+
+
+class Job(CategoryCountedMixin, BaseModel):
     JOB_TYPE_CHOICES = [
         ("FULL_TIME", "Full-time"),
         ("PART_TIME", "Part-time"),
@@ -469,7 +850,7 @@ class Job(BaseModel):
         return self.title
 
 
-class Event(BaseModel):
+class Event(CategoryCountedMixin, BaseModel):
     category = models.ForeignKey(
         Category, related_name="events", on_delete=models.SET_NULL, null=True
     )
@@ -495,7 +876,7 @@ class Event(BaseModel):
         return self.title
 
 
-class Resource(BaseModel):
+class Resource(CategoryCountedMixin, ExcerptMixin, BaseModel):
     category = models.ForeignKey(
         Category, related_name="resources", on_delete=models.SET_NULL, null=True
     )
@@ -505,6 +886,7 @@ class Resource(BaseModel):
         upload_to="resources/", null=True, blank=True, validators=[validate_file_size]
     )
     body = CKEditor5Field("Resource Body", config_name="extends")
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
     url = models.CharField(max_length=250, validators=[URLValidator()])
     tags = models.ManyToManyField(Tag, blank=True, related_name="resources")
 
@@ -514,6 +896,8 @@ class Resource(BaseModel):
 
     objects = ContentManager()
 
+    excerpt_source = "body"
+
     class Meta:
         ordering = ["-created_at"]
 
@@ -529,20 +913,28 @@ class Resource(BaseModel):
         return self.name
 
 
-class ToolTag(BaseModel):
+class ToolTag(CountersMixin, BaseModel):
     name = models.CharField(max_length=20)
+    # Published tools with this tag
+    tool_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_sources = {
+        "tool_count": ("content.Tool_tags", {"tool__is_published": True}, "tooltag"),
+    }
+    counter_scopes = ("tag_index",)
 
     def __str__(self):
         return self.name
 
 
-class Tool(BaseModel):
+class Tool(CategoryCountedMixin, ExcerptMixin, BaseModel):
     category = models.ForeignKey(
         Category, related_name="tools", on_delete=models.SET_NULL, null=True
     )
     name = models.CharField(max_length=250)
     slug = AutoSlugField(populate_from="name", unique=True, always_update=True)
     desc = models.TextField()
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
     url = models.CharField(max_length=250, validators=[URLValidator()])
     image_url = models.CharField(max_length=250, validators=[URLValidator()])
     tags = models.ManyToManyField(ToolTag)
@@ -558,6 +950,8 @@ class Tool(BaseModel):
 
     objects = ContentManager()
 
+    excerpt_source = "desc"
+
     class Meta:
         ordering = ["-created_at"]
 
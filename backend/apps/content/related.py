@@ -0,0 +1,215 @@
+"""
+Related articles: a precomputed top-k neighbour list per published article.
+
+Two articles are similar when they share tags (Jaccard overlap of their tag
+sets) and a category, with a bonus for newer targets:
+
+    score = TAG_WEIGHT * jaccard + CATEGORY_WEIGHT * same_category
+            + RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+Articles sharing neither a tag nor the category are never related.
+
+Nothing is compared pairwise across the whole table. An article's
+candidates are the CANDIDATE_LIMIT published articles sharing the most tags
+with it, plus the newest CATEGORY_CANDIDATES of its category. When an
+article is published or retagged (see signals.py), its own list is rebuilt,
+it is offered to each candidate's list, and lists that referenced it but
+are no longer candidates are rebuilt. `manage.py rebuild_related_articles`
+rebuilds every list from scratch.
+"""
+
+import heapq
+from datetime import timedelta
+
+from apps.content.choices import ArticleStatusChoices
+from apps.content.models import Article, RelatedArticle
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+RELATED_K = 10
+CANDIDATE_LIMIT = 200
+CATEGORY_CANDIDATES = 20
+
+TAG_WEIGHT = 0.6
+CATEGORY_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.1
+RECENCY_HALF_LIFE_DAYS = 180
+
+
+def load_profiles(article_ids):
+    """Return {id: (tag ids, category id, published time)} for published ids."""
+    rows = Article.published.filter(pk__in=article_ids).values_list(
+        "pk", "category_id", "published_at", "created_at"
+    )
+    tag_ids = {}
+    for article_id, tag_id in Article.tags.through.objects.filter(
+        article_id__in=article_ids
+    ).values_list("article_id", "tag_id"):
+        tag_ids.setdefault(article_id, set()).add(tag_id)
+    return {
+        pk: (frozenset(tag_ids.get(pk, ())), category_id, published_at or created_at)
+        for pk, category_id, published_at, created_at in rows
+    }
+
+
+def similarity(source, target, now):
+    """Score how related `target` is to `source` (profiles from load_profiles)."""
+    source_tags, source_category, _ = source
+    target_tags, target_category, published_at = target
+    shared = len(source_tags & target_tags)
+    same_category = source_category is not None and source_category == target_category
+    if not shared and not same_category:
+        return 0.0
+
+    jaccard = shared / len(source_tags | target_tags) if shared else 0.0
+    age_days = max((now - published_at) / timedelta(days=1), 0)
+    recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+    return (
+        TAG_WEIGHT * jaccard
+        + CATEGORY_WEIGHT * same_category
+        + RECENCY_WEIGHT * recency
+    )
+
+
+def find_candidates(article_id, profile):
+    """Return ids of the published articles worth scoring against `article_id`."""
+    tag_ids, category_id, _ = profile
+    candidates = set()
+    if tag_ids:
+        candidates.update(
+            Article.tags.through.objects.filter(
+                tag_id__in=tag_ids, article__status=ArticleStatusChoices.PUBLISHED
+            )
+            .exclude(article_id=article_id)
+            .values("article_id")
+            .annotate(shared=Count("*"))
+            .order_by("-shared")
+            .values_list("article_id", flat=True)[:CANDIDATE_LIMIT]
+        )
+    if category_id is not None:
+        candidates.update(
+            Article.published.filter(category_id=category_id)
+            .exclude(pk=article_id)
+            .order_by("-created_at")
+            .values_list("pk", flat=True)[:CATEGORY_CANDIDATES]
+        )
+    return candidates
+
+
+def _top_k(scores):
+    return heapq.nlargest(RELATED_K, scores.items(), key=lambda item: item[1])
+
+
+def _write_lists(lists):
+    """Replace the neighbour lists in `lists` ({article id: [(id, score)]})."""
+    with transaction.atomic():
+        RelatedArticle.objects.filter(article_id__in=lists).delete()
+        RelatedArticle.objects.bulk_create(
+            RelatedArticle(article_id=article_id, related_id=related_id, score=score)
+            for article_id, neighbours in lists.items()
+            for related_id, score in neighbours
+        )
+
+
+def rebuild_article(article_id, now=None):
+    """
+    Recompute the neighbour list of one article from its candidates. Returns
+    (profiles, candidate ids) for reuse, or None if it isn't published.
+    """
+    now = now or timezone.now()
+    profile = load_profiles([article_id]).get(article_id)
+    if profile is None:
+        RelatedArticle.objects.filter(article_id=article_id).delete()
+        return None
+
+    candidates = find_candidates(article_id, profile)
+    profiles = load_profiles(candidates)
+    profiles[article_id] = profile
+    scores = {
+        pk: similarity(profile, profiles[pk], now)
+        for pk in candidates
+        if pk in profiles
+    }
+    _write_lists({article_id: [item for item in _top_k(scores) if item[1] > 0]})
+    return profiles, candidates
+
+
+def refresh_article(article_id):
+    """
+    Incrementally update the index after `article_id` was published,
+    unpublished, retagged or moved to another category.
+    """
+    now = timezone.now()
+    referrers = set(
+        RelatedArticle.objects.filter(related_id=article_id).values_list(
+            "article_id", flat=True
+        )
+    )
+    result = rebuild_article(article_id, now)
+    if result is None:
+        # No longer public: drop it everywhere and backfill the lists it left
+        RelatedArticle.objects.filter(related_id=article_id).delete()
+        for pk in referrers:
+            rebuild_article(pk, now)
+        return
+
+    profiles, candidates = result
+    profile = profiles[article_id]
+    offers = {
+        pk: similarity(profiles[pk], profile, now)
+        for pk in candidates
+        if pk in profiles
+    }
+    offers = {pk: score for pk, score in offers.items() if score > 0}
+
+    current = {}
+    for owner_id, related_id, score in RelatedArticle.objects.filter(
+        article_id__in=offers
+    ).values_list("article_id", "related_id", "score"):
+        current.setdefault(owner_id, {})[related_id] = score
+
+    changed = {}
+    for pk, score in offers.items():
+        neighbours = current.get(pk, {})
+        before = set(neighbours)
+        neighbours[article_id] = score
+        top = _top_k(neighbours)
+        if {related_id for related_id, _ in top} != before or article_id in before:
+            changed[pk] = top
+    if changed:
+        _write_lists(changed)
+
+    # Lists that showed the article but no longer qualify as candidates
+    for pk in referrers - set(offers):
+        rebuild_article(pk, now)
+
+
+def forget_article(referrer_ids):
+    """Backfill the lists that referenced a deleted article."""
+    now = timezone.now()
+    for pk in referrer_ids:
+        rebuild_article(pk, now)
+
+
+def rebuild_all(batch_size=500):
+    """Rebuild every published article's list. Returns the number rebuilt."""
+    now = timezone.now()
+    queryset = Article.published.order_by("pk").values_list("pk", flat=True)
+    RelatedArticle.objects.exclude(
+        Q(article__status=ArticleStatusChoices.PUBLISHED)
+        & Q(related__status=ArticleStatusChoices.PUBLISHED)
+    ).delete()
+
+    rebuilt = 0
+    last_pk = None
+    while True:
+        batch_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_qs[:batch_size])
+        if not batch:
+            break
+        for pk in batch:
+            rebuild_article(pk, now)
+        rebuilt += len(batch)
+        last_pk = batch[-1]
+    return rebuilt
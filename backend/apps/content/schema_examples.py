@@ -14,6 +14,7 @@ from apps.common.serializers import (
 )
 from apps.content.serializers import (  # CoverImageSerializer,
     ArticleApproveResponseSerializer,
+    ArticleCommentSerializer,
     ArticleEditorSerializer,
     ArticleReactionStatusSerializer,
     ArticleSerializer,
@@ -33,6 +34,7 @@ from apps.content.serializers import (  # CoverImageSerializer,
     ReviewListSerializer,
     ReviewStartResponseSerializer,
     TagSerializer,
+    TagSuggestionSerializer,
     ThreadReplySerializer,
     ToolSerializer,
     UserMentionSerializer,
@@ -44,6 +46,11 @@ CATEGORY_LIST_EXAMPLE = {
     "name": "Technology",
     "slug": "technology",
     "desc": "All articles and tutorials related to technology and innovation.",
+    "article_count": 12,
+    "job_count": 3,
+    "event_count": 1,
+    "resource_count": 5,
+    "tool_count": 4,
 }
 
 TAG_LIST_EXAMPLE = [
@@ -73,6 +80,7 @@ ARTICLES = [
         "reaction_counts": {"❤️": 2},
         "is_saved": False,
         "cover_image_url": "",
+        "first_image_url": "",
         "published_at": "2025-08-12T10:00:54.576519Z",
     },
     {
@@ -89,11 +97,28 @@ ARTICLES = [
         "reaction_counts": {"❤️": 1, "👍": 1, "🔥": 1, "😍": 1},
         "is_saved": True,
         "cover_image_url": "",
+        "first_image_url": "",
         "published_at": "2025-08-07T18:48:26.389204Z",
     },
 ]
 
 
+ARTICLE_COMMENTS_EXAMPLE = [
+    {
+        "id": "8485b084-2257-48a1-82bf-cffa90373a80",
+        "thread_id": "6dd9d3f8-bdd3-43e8-83f9-a5533349f776",
+        "body": "This is cool",
+        "created_at": "2025-10-27T18:03:01.913900Z",
+        "user_name": "Praise ID",
+        "user_username": "praise-id",
+        "user_avatar": AVATAR_URL,
+        "total_replies": 0,
+        "like_count": 2,
+        "is_liked": False,
+    }
+]
+
+
 ARTICLE_DETAIL_EXAMPLE = {
     "id": "09fc9e71-d071-4fb4-ba28-16a493e609d6",
     "title": "Test Article",
@@ -109,18 +134,8 @@ ARTICLE_DETAIL_EXAMPLE = {
     "total_reaction_counts": 0,
     "reaction_counts": {},
     "tags": [],
-    "comments": [
-        {
-            "id": "8485b084-2257-48a1-82bf-cffa90373a80",
-            "thread_id": "6dd9d3f8-bdd3-43e8-83f9-a5533349f776",
-            "body": "This is cool",
-            "created_at": "2025-10-27T18:03:01.913900Z",
-            "user_name": "Praise ID",
-            "user_username": "praise-id",
-            "user_avatar": AVATAR_URL,
-            "total_replies": 0,
-        }
-    ],
+    "comments": ARTICLE_COMMENTS_EXAMPLE,
+    "comments_next_cursor": None,
     "comments_count": 1,
 }
 
@@ -133,6 +148,11 @@ CATEGORY_DETAIL_EXAMPLE = {
     "name": "Technology",
     "slug": "technology",
     "desc": "All articles and tutorials related to technology and innovation.",
+    "article_count": 12,
+    "job_count": 3,
+    "event_count": 1,
+    "resource_count": 5,
+    "tool_count": 4,
 }
 
 JOB_DETAIL_EXAMPLE = {
@@ -193,6 +213,8 @@ REPLIES_DATA_EXAMPLE = [
         "user_avatar": AVATAR_URL,
         "replying_to_name": "Joseph Ayo",
         "replying_to_username": "josedev",
+        "like_count": 3,
+        "is_liked": True,
     },
     {
         "id": UUID_EXAMPLE,
@@ -203,6 +225,8 @@ REPLIES_DATA_EXAMPLE = [
         "user_avatar": AVATAR_URL,
         "replying_to_name": "Joseph Ayo",
         "replying_to_username": "josedev",
+        "like_count": 0,
+        "is_liked": False,
     },
 ]
 
@@ -317,6 +341,26 @@ TAG_RESPONSE_EXAMPLE = {
     ),
 }
 
+TAG_AUTOCOMPLETE_RESPONSE_EXAMPLE = {
+    200: OpenApiResponse(
+        response=TagSuggestionSerializer(many=True),
+        description="Tag Suggestions Fetched",
+        examples=[
+            OpenApiExample(
+                name="Tag Suggestions Fetched",
+                value={
+                    "status": SUCCESS_RESPONSE_STATUS,
+                    "message": "Tag suggestions retrieved successfully.",
+                    "data": [
+                        {"id": UUID_EXAMPLE, "name": "python", "usage": 42},
+                        {"id": UUID_EXAMPLE, "name": "pytest", "usage": 7},
+                    ],
+                },
+            ),
+        ],
+    ),
+}
+
 RSS_RESPONSE_EXAMPLE = {
     200: OpenApiResponse(
         response=SuccessResponseSerializer,
@@ -329,9 +373,11 @@ RSS_RESPONSE_EXAMPLE = {
                     "message": "RSS Feed information retrieved successfully.",
                     "data": {
                         "rss_url": "https://127.0.0.1:8000/api/v1/articles/feed/",
+                        "category_rss_url": "https://127.0.0.1:8000/api/v1/categories/{slug}/feed/",
+                        "tag_rss_url": "https://127.0.0.1:8000/api/v1/tags/{name}/feed/",
                         "description": "Subscribe to get the latest Tech Hive articles",
                         "format": "RSS 2.0 XML",
-                        "items_count": 10,
+                        "items_count": 5,
                         "update_frequency": "When new articles are published",
                     },
                 },
@@ -354,6 +400,37 @@ ARTICLE_LIST_RESPONSE_EXAMPLE = {
     ),
 }
 
+ARTICLE_RELATED_RESPONSE_EXAMPLE = {
+    200: OpenApiResponse(
+        description="Related Articles Fetched",
+        response=ArticleSerializer(many=True),
+        examples=[
+            OpenApiExample(
+                name="Success Response",
+                value={
+                    "status": SUCCESS_RESPONSE_STATUS,
+                    "message": "Related articles retrieved successfully.",
+                    "data": ARTICLES,
+                },
+            ),
+        ],
+    ),
+    404: OpenApiResponse(
+        description="Article not found",
+        response=ErrorResponseSerializer,
+        examples=[
+            OpenApiExample(
+                name="Article Not Found",
+                value={
+                    "status": ERR_RESPONSE_STATUS,
+                    "message": "Article not found.",
+                    "code": ErrorCode.NON_EXISTENT,
+                },
+            ),
+        ],
+    ),
+}
+
 ARTICLE_DETAIL_RESPONSE_EXAMPLE = {
     200: OpenApiResponse(
         description="Article Retrieval Successful",
@@ -386,6 +463,43 @@ ARTICLE_DETAIL_RESPONSE_EXAMPLE = {
 }
 
 
+ARTICLE_COMMENTS_RESPONSE_EXAMPLE = {
+    200: OpenApiResponse(
+        description="Comments retrieved successfully",
+        response=ArticleCommentSerializer(many=True),
+        examples=[
+            OpenApiExample(
+                name="Success Response",
+                value={
+                    "status": SUCCESS_RESPONSE_STATUS,
+                    "message": "Comments retrieved successfully.",
+                    "data": {
+                        "count": None,
+                        "next": "http://api.example.org/api/v1/articles/09fc9e71-d071-4fb4-ba28-16a493e609d6/comments/?cursor=eyJ2IjogWyIyMDI1LTEwLTI3In0",
+                        "previous": None,
+                        "results": ARTICLE_COMMENTS_EXAMPLE,
+                    },
+                },
+            ),
+        ],
+    ),
+    404: OpenApiResponse(
+        description="Article not found",
+        response=ErrorResponseSerializer,
+        examples=[
+            OpenApiExample(
+                name="Article Not Found",
+                value={
+                    "status": ERR_RESPONSE_STATUS,
+                    "message": "Article not found.",
+                    "code": ErrorCode.NON_EXISTENT,
+                },
+            ),
+        ],
+    ),
+}
+
+
 CATEGORY_DETAIL_RESPONSE_EXAMPLE = {
     200: OpenApiResponse(
         description="Category retrieved successfully",
@@ -973,6 +1087,26 @@ ARTICLE_SUMMARY_RESPONSE_EXAMPLE = {
             ),
         ],
     ),
+    202: OpenApiResponse(
+        description="Summary is being generated by another request, retry later",
+        response=ArticleSummaryResponseSerializer,
+        examples=[
+            OpenApiExample(
+                name="Summary Pending",
+                value={
+                    "status": "info",
+                    "message": "Article summary is being generated, please retry shortly.",
+                    "data": {
+                        "article_id": UUID_EXAMPLE,
+                        "article_title": "Getting Started with Django REST Framework",
+                        "article_slug": "getting-started-with-django-rest-framework",
+                        "summary": None,
+                        "cached": False,
+                    },
+                },
+            ),
+        ],
+    ),
     401: UNAUTHORIZED_USER_RESPONSE,
     403: OpenApiResponse(
         description="Article is not published",
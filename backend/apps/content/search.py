@@ -0,0 +1,173 @@
+"""
+Full-text search for published articles.
+
+Each published article gets a weighted search document: title > tags > body
+text (HTML stripped). How it is stored depends on the database:
+
+- PostgreSQL: a tsvector in Article.search_vector, backed by a GIN index.
+- SQLite (dev/tests): an FTS5 shadow table, ranked with bm25().
+- Anything else falls back to icontains on title and content.
+
+The index is updated incrementally from Article.save() and when tags change
+(see signals.py). `manage.py rebuild_search_index` rebuilds it from scratch.
+"""
+
+import html
+import re
+
+from apps.content.choices import ArticleStatusChoices
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.utils.html import strip_tags
+
+SEARCH_CONFIG = "english"
+
+FTS_TABLE = "content_article_fts"
+# bm25() column weights for (article_id, title, tags, body)
+FTS_WEIGHTS = (0.0, 10.0, 4.0, 1.0)
+# Upper bound on ranked matches pulled from the FTS table per query, applied
+# after the queryset's own filters
+FTS_MAX_RESULTS = 500
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def build_search_document(article):
+    """Return the title, tags and plain-text body to index for `article`."""
+    return {
+        "title": article.title or "",
+        "tags": " ".join(tag.name for tag in article.tags.all()),
+        "body": html.unescape(strip_tags(article.content or "")),
+    }
+
+
+def weighted_search_vector(document):
+    return (
+        SearchVector(Value(document["title"]), weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(document["tags"]), weight="B", config=SEARCH_CONFIG)
+        + SearchVector(Value(document["body"]), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def index_article(article):
+    """
+    Add or refresh `article` in the search index. Articles that are not
+    published are removed instead, so only public content is searchable.
+    """
+    if article.status != ArticleStatusChoices.PUBLISHED:
+        remove_article(article)
+        return
+
+    document = build_search_document(article)
+    connection = connections[article._state.db or "default"]
+
+    if connection.vendor == "postgresql":
+        type(article).objects.filter(pk=article.pk).update(
+            search_vector=weighted_search_vector(document)
+        )
+    elif connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE article_id = %s", [str(article.pk)]
+            )
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (article_id, title, tags, body) "
+                "VALUES (%s, %s, %s, %s)",
+                [str(article.pk), document["title"], document["tags"], document["body"]],
+            )
+
+
+def remove_article(article):
+    """Drop `article` from the search index."""
+    connection = connections[article._state.db or "default"]
+
+    if connection.vendor == "postgresql":
+        type(article).objects.filter(pk=article.pk).update(search_vector=None)
+    elif connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE article_id = %s", [str(article.pk)]
+            )
+
+
+def clear_index(using="default"):
+    """Empty the search index (used before a full rebuild)."""
+    from apps.content.models import Article
+
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        Article.objects.using(using).update(search_vector=None)
+    elif connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+
+
+def fts_match_expression(term):
+    """
+    Turn free user input into a safe FTS5 MATCH expression: every word is
+    quoted so FTS5 operators in the input are treated as plain text.
+    """
+    return " ".join(f'"{token}"' for token in TOKEN_RE.findall(term.lower()))
+
+
+def search_articles(queryset, term):
+    """
+    Filter an Article queryset down to matches for `term`, annotated with
+    `search_rank` and ordered by relevance (newest first on ties).
+    """
+    term = (term or "").strip()
+    if not term:
+        return queryset
+
+    connection = connections[queryset.db]
+
+    if connection.vendor == "postgresql":
+        query = SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_at")
+        )
+
+    if connection.vendor == "sqlite":
+        match = fts_match_expression(term)
+        if not match:
+            return queryset.none()
+
+        # Only rank rows the queryset (category, author... filters) keeps.
+        # The table stores dashed UUIDs, Django stores them as plain hex.
+        candidates, candidate_params = (
+            queryset.order_by()
+            .values("pk")
+            .query.get_compiler(using=queryset.db)
+            .as_sql()
+        )
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT article_id, bm25({FTS_TABLE}, {weights}) AS score "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"AND replace(article_id, '-', '') IN ({candidates}) "
+                "ORDER BY score LIMIT %s",
+                [match, *candidate_params, FTS_MAX_RESULTS],
+            )
+            # bm25() is lower-is-better, flip it so rank sorts like Postgres
+            ranks = {article_id: -score for article_id, score in cursor.fetchall()}
+
+        if not ranks:
+            return queryset.none()
+
+        return (
+            queryset.filter(pk__in=list(ranks))
+            .annotate(
+                search_rank=Case(
+                    *[When(pk=pk, then=Value(rank)) for pk, rank in ranks.items()],
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-search_rank", "-created_at")
+        )
+
+    return queryset.filter(Q(title__icontains=term) | Q(content__icontains=term))
@@ -1,4 +1,6 @@
 from apps.accounts.models import ContributorOnboarding, User
+from apps.common.pagination import KeysetPagination
+from apps.common.serializers import PageAnnotatedListSerializer, PageAnnotationMixin
 from apps.content import models
 from apps.content.choices import ArticleStatusChoices
 from apps.content.models import (
@@ -9,12 +11,15 @@ from apps.content.models import (
     Comment,
     CommentMention,
     CommentThread,
+    SavedArticle,
 )
+from apps.content.tags import resolve_tags
 from apps.notification.utils import create_notification
 from apps.profiles.serializers import UserSerializer
 from django.contrib.auth import get_user_model
 from django.db.models import F
 from drf_spectacular.utils import extend_schema_field
+from redis import RedisError
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
@@ -22,14 +27,98 @@ User = get_user_model()
 
 
 def process_tags(tag_names):
-    """Convert tag names to Tag instances using get_or_create"""
-    tag_instances = []
-    for tag_name in tag_names:
-        cleaned_name = tag_name.strip().lower()
-        if cleaned_name:  # Skip empty strings
-            tag, _ = models.Tag.objects.get_or_create(name=cleaned_name)
-            tag_instances.append(tag)
-    return tag_instances
+    """Convert tag names to Tag instances, creating missing ones in bulk"""
+    return resolve_tags(tag_names)
+
+
+def get_saved_article_ids(user, article_ids):
+    """Return the subset of article_ids saved by user, in a single query"""
+    if not user or not user.is_authenticated or not article_ids:
+        return set()
+    return set(
+        SavedArticle.objects.filter(
+            user=user, article_id__in=article_ids
+        ).values_list("article_id", flat=True)
+    )
+
+
+class UserPageAnnotationMixin(PageAnnotationMixin):
+    """Page annotations that depend on the requesting user."""
+
+    def _get_request_user(self):
+        request = self.context.get("request")
+        return getattr(request, "user", None)
+
+
+class SavedStatusMixin(UserPageAnnotationMixin):
+    """
+    Provides `is_saved` for article serializers. With many=True the current
+    user's saved article IDs are resolved for the whole page in one query.
+    """
+
+    def annotate_page(self, instances):
+        return {
+            "saved_ids": get_saved_article_ids(
+                self._get_request_user(), [obj.pk for obj in instances]
+            )
+        }
+
+    @extend_schema_field(serializers.BooleanField)
+    def get_is_saved(self, obj):
+        """Check if article is saved by the current user"""
+        if self.page_annotations is not None:
+            return obj.pk in self.page_annotations["saved_ids"]
+
+        user = self._get_request_user()
+        if user and user.is_authenticated:
+            return obj.saved_by_user.filter(user=user).exists()
+        return False
+
+
+def get_comment_likes(user, comment_ids):
+    """
+    Map each comment id to its like_count/is_liked with one pipelined Redis
+    call. Values are None when the like service is unavailable, and is_liked
+    is None for anonymous users.
+    """
+    from apps.content.services import comment_like_service
+
+    user_id = user.id if user and user.is_authenticated else None
+    try:
+        return comment_like_service.get_bulk_like_status(comment_ids, user_id)
+    except RedisError:
+        return {}
+
+
+class CommentLikesMixin(UserPageAnnotationMixin):
+    """
+    Provides `like_count` and `is_liked` for comment serializers. With
+    many=True the whole page is resolved in a single Redis round trip.
+    """
+
+    unavailable_likes = {"like_count": None, "is_liked": None}
+
+    def annotate_page(self, instances):
+        return {
+            "likes": get_comment_likes(
+                self._get_request_user(), [obj.pk for obj in instances]
+            )
+        }
+
+    def _get_likes(self, obj):
+        if self.page_annotations is not None:
+            likes = self.page_annotations["likes"]
+        else:
+            likes = get_comment_likes(self._get_request_user(), [obj.pk])
+        return likes.get(obj.pk, self.unavailable_likes)
+
+    @extend_schema_field(serializers.IntegerField(allow_null=True))
+    def get_like_count(self, obj):
+        return self._get_likes(obj)["like_count"]
+
+    @extend_schema_field(serializers.BooleanField(allow_null=True))
+    def get_is_liked(self, obj):
+        return self._get_likes(obj)["is_liked"]
 
 
 class ContributorOnboardingSerializer(serializers.ModelSerializer):
@@ -59,6 +148,12 @@ class TagSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
+class TagSuggestionSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+    usage = serializers.IntegerField()
+
+
 class TagCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.Tag
@@ -66,23 +161,31 @@ class TagCreateSerializer(serializers.ModelSerializer):
         extra_kwargs = {"name": {"validators": []}}  # Remove default unique validator
 
     def create(self, validated_data):
-        tag, created = models.Tag.objects.get_or_create(
-            name=validated_data["name"].lower()
-        )
-        return tag, created
+        tags, created = resolve_tags([validated_data["name"]], return_created=True)
+        return tags[0], bool(created)
 
 
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = models.Category
-        fields = ["id", "name", "desc", "slug"]
+        fields = [
+            "id",
+            "name",
+            "desc",
+            "slug",
+            "article_count",
+            "job_count",
+            "event_count",
+            "resource_count",
+            "tool_count",
+        ]
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SavedStatusMixin, serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
     category = serializers.SerializerMethodField()
     cover_image_url = serializers.SerializerMethodField()
-    read_time = serializers.SerializerMethodField()
+    read_time = serializers.IntegerField(source="read_time_seconds", read_only=True)
     author = serializers.SerializerMethodField()
     total_reaction_counts = serializers.SerializerMethodField()
     reaction_counts = serializers.SerializerMethodField()
@@ -107,15 +210,12 @@ class ArticleSerializer(serializers.ModelSerializer):
             "reaction_counts",
             "tags",
         ]
+        list_serializer_class = PageAnnotatedListSerializer
 
     @extend_schema_field(serializers.URLField)
     def get_cover_image_url(self, obj):
         return obj.cover_image_url
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_read_time(self, obj):
-        return obj.calculate_read_time()
-
     @extend_schema_field(serializers.DictField)
     def get_author(self, obj):
         return {
@@ -137,23 +237,16 @@ class ArticleSerializer(serializers.ModelSerializer):
     def get_reaction_counts(self, obj):
         return obj.reaction_counts
 
-    @extend_schema_field(serializers.BooleanField)
-    def get_is_saved(self, obj):
-        """Check if article is saved by the current user"""
-        request = self.context.get("request")
-        if request and hasattr(request, "user") and request.user.is_authenticated:
-            return obj.saved_by_user.filter(user=request.user).exists()
-        return False
 
-
-class ArticleListSerializer(serializers.ModelSerializer):
-    content = serializers.SerializerMethodField()
+class ArticleListSerializer(SavedStatusMixin, serializers.ModelSerializer):
+    # Lists defer the full content, see Article.excerpt
+    content = serializers.CharField(source="excerpt", read_only=True)
     category = serializers.SerializerMethodField()
     tags = TagSerializer(many=True, read_only=True)
     total_reaction_counts = serializers.SerializerMethodField()
     reaction_counts = serializers.SerializerMethodField()
     is_saved = serializers.SerializerMethodField()
-    read_time = serializers.SerializerMethodField()
+    read_time = serializers.IntegerField(source="read_time_seconds", read_only=True)
     cover_image_url = serializers.SerializerMethodField()
     author = serializers.SerializerMethodField()
 
@@ -173,17 +266,11 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "reaction_counts",
             "is_saved",
             "cover_image_url",
+            "first_image_url",
             "published_at",
             "created_at",
         ]
-
-    @extend_schema_field(serializers.BooleanField)
-    def get_is_saved(self, obj):
-        """Check if article is saved by the current user"""
-        user = self.context.get("request").user
-        if user.is_authenticated:
-            return obj.saved_by_user.filter(user=user).exists()
-        return False
+        list_serializer_class = PageAnnotatedListSerializer
 
     @extend_schema_field(serializers.DictField)
     def get_reaction_counts(self, obj):
@@ -194,10 +281,6 @@ class ArticleListSerializer(serializers.ModelSerializer):
     def get_total_reaction_counts(self, obj):
         return obj.total_reaction_counts
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_read_time(self, obj):
-        return obj.calculate_read_time()
-
     @extend_schema_field(serializers.URLField)
     def get_cover_image_url(self, obj):
         return obj.cover_image_url
@@ -215,18 +298,6 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "username": obj.author.username,
         }
 
-    @extend_schema_field(serializers.CharField)
-    def get_content(self, obj):
-        if not obj.content:
-            return ""
-        # Remove HTML tags and truncate
-        from django.utils.html import strip_tags
-
-        text = strip_tags(obj.content)
-        if len(text) <= 200:
-            return text
-        return text[:197] + "..."
-
 
 class ArticleCreateSerializer(serializers.ModelSerializer):
     # url = CustomHyperlinkedIdentityField(
@@ -280,12 +351,21 @@ class ArticleReactionSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "article", "reaction_type"]
 
 
-class SavedArticleSerializer(serializers.ModelSerializer):
+class SavedArticleSerializer(PageAnnotationMixin, serializers.ModelSerializer):
     article = ArticleSerializer()
 
     class Meta:
         model = models.SavedArticle
         fields = ["id", "article"]
+        list_serializer_class = PageAnnotatedListSerializer
+
+    def annotate_page(self, instances):
+        # Resolve the nested article serializer's page data in bulk as well
+        article_serializer = self.fields["article"]
+        article_serializer.page_annotations = article_serializer.annotate_page(
+            [saved.article for saved in instances]
+        )
+        return {}
 
 
 class SaveArticleCreateSerializer(serializers.Serializer):
@@ -521,7 +601,7 @@ class CommentResponseSerializer(serializers.ModelSerializer):
         return obj.is_root_comment
 
 
-class ArticleCommentSerializer(serializers.ModelSerializer):
+class ArticleCommentSerializer(CommentLikesMixin, serializers.ModelSerializer):
     """Serializer for displaying comments on articles with lazy-loading support"""
 
     user_name = serializers.CharField(source="user.full_name", read_only=True)
@@ -529,6 +609,8 @@ class ArticleCommentSerializer(serializers.ModelSerializer):
     user_username = serializers.CharField(source="user.username", read_only=True)
     total_replies = serializers.SerializerMethodField()
     thread_id = serializers.UUIDField(source="thread.id", read_only=True)
+    like_count = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = models.Comment
@@ -541,7 +623,10 @@ class ArticleCommentSerializer(serializers.ModelSerializer):
             "user_username",
             "user_avatar",
             "total_replies",
+            "like_count",
+            "is_liked",
         ]
+        list_serializer_class = PageAnnotatedListSerializer
 
     @extend_schema_field(serializers.IntegerField)
     def get_total_replies(self, obj):
@@ -550,38 +635,54 @@ class ArticleCommentSerializer(serializers.ModelSerializer):
 
 
 class ArticleDetailSerializer(ArticleSerializer):
+    """
+    Embeds only the first page of root comments; `comments_next_cursor`
+    continues from there on the article's comments endpoint.
+    """
+
     comments = serializers.SerializerMethodField()
+    comments_next_cursor = serializers.SerializerMethodField()
     comments_count = serializers.SerializerMethodField()
 
     class Meta(ArticleSerializer.Meta):
-        fields = ArticleSerializer.Meta.fields + ["comments", "comments_count"]
+        fields = ArticleSerializer.Meta.fields + [
+            "comments",
+            "comments_next_cursor",
+            "comments_count",
+        ]
+
+    def _root_comments_page(self, obj):
+        if getattr(self, "_comments_page_for", None) != obj.pk:
+            self._comments_page = KeysetPagination().first_page(
+                obj.root_comments().select_related("user", "thread")
+            )
+            self._comments_page_for = obj.pk
+        return self._comments_page
 
     @extend_schema_field(ArticleCommentSerializer(many=True))
     def get_comments(self, obj):
-        """Get root comments only (comments that start threads)"""
-        root_comments = [
-            comment
-            for comment in obj.comments.all()
-            if comment.thread is not None
-            and comment.thread.root_comment_id == comment.id
-        ]
-
-        # Sort by recency (newest first) - TODO: CHECK IF IT SORTS BY DEFAULT
-        root_comments.sort(key=lambda x: x.created_at, reverse=True)
+        """Get the newest root comments (comments that start threads)"""
+        root_comments, _ = self._root_comments_page(obj)
+        return ArticleCommentSerializer(
+            root_comments, many=True, context=self.context
+        ).data
 
-        serializer = ArticleCommentSerializer(
-            root_comments,
-            many=True,
-        )
-        return serializer.data
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_comments_next_cursor(self, obj):
+        _, cursor = self._root_comments_page(obj)
+        return cursor
 
     @extend_schema_field(serializers.IntegerField)
     def get_comments_count(self, obj):
         """Get total count of all active comments on article"""
-        return obj.all_comments_count
+        from apps.content.services.content_cache import content_cache
+
+        return content_cache.article_value(
+            obj, "comments_count", lambda: obj.all_comments_count
+        )
 
 
-class ThreadReplySerializer(serializers.ModelSerializer):
+class ThreadReplySerializer(CommentLikesMixin, serializers.ModelSerializer):
     """Serializer for displaying replies in a thread"""
 
     user_name = serializers.CharField(source="user.full_name", read_only=True)
@@ -589,6 +690,8 @@ class ThreadReplySerializer(serializers.ModelSerializer):
     user_username = serializers.CharField(source="user.username", read_only=True)
     replying_to_name = serializers.SerializerMethodField()
     replying_to_username = serializers.SerializerMethodField()
+    like_count = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = models.Comment
@@ -601,19 +704,25 @@ class ThreadReplySerializer(serializers.ModelSerializer):
             "user_avatar",
             "replying_to_name",
             "replying_to_username",
+            "like_count",
+            "is_liked",
         ]
+        list_serializer_class = PageAnnotatedListSerializer
+
+    @staticmethod
+    def _replying_to(obj):
+        # .all() (unlike .first()) reads the prefetch_related cache, see
+        # ThreadRepliesView; mentions are prefetched oldest first
+        mentions = obj.mentions.all()
+        return mentions[0].mentioned_user if mentions else None
 
     def get_replying_to_name(self, obj):
-        mention = obj.mentions.first()
-        if mention and mention.mentioned_user:
-            return mention.mentioned_user.full_name
-        return None
+        user = self._replying_to(obj)
+        return user.full_name if user else None
 
     def get_replying_to_username(self, obj):
-        mention = obj.mentions.first()
-        if mention and mention.mentioned_user:
-            return mention.mentioned_user.username
-        return None
+        user = self._replying_to(obj)
+        return user.username if user else None
 
 
 class JobSerializer(serializers.ModelSerializer):
@@ -728,7 +837,7 @@ class ResourceSerializer(serializers.ModelSerializer):
 
 
 class ResourceListSerializer(serializers.ModelSerializer):
-    body = serializers.SerializerMethodField()
+    body = serializers.CharField(source="excerpt", read_only=True)
     category = serializers.CharField(source="category.name", read_only=True)
 
     class Meta:
@@ -748,17 +857,6 @@ class ResourceListSerializer(serializers.ModelSerializer):
     def get_image_url(self, obj):
         return obj.image_url
 
-    @extend_schema_field(serializers.CharField)
-    def get_body(self, obj):
-        if not obj.body:
-            return ""
-        from django.utils.html import strip_tags
-
-        text = strip_tags(obj.body)
-        if len(text) <= 150:
-            return text
-        return text[:147] + "..."
-
 
 class ToolTagSerializer(serializers.ModelSerializer):
     class Meta:
@@ -793,7 +891,7 @@ class ToolSerializer(serializers.ModelSerializer):
 
 
 class ToolListSerializer(serializers.ModelSerializer):
-    desc = serializers.SerializerMethodField()
+    desc = serializers.CharField(source="excerpt", read_only=True)
     image_url = serializers.SerializerMethodField()
     tags = ToolTagSerializer(many=True, read_only=True)
     category = serializers.CharField(source="category.name", read_only=True)
@@ -818,17 +916,6 @@ class ToolListSerializer(serializers.ModelSerializer):
     def get_image_url(self, obj):
         return obj.image_url
 
-    @extend_schema_field(serializers.CharField)
-    def get_desc(self, obj):
-        if not obj.desc:
-            return ""
-        from django.utils.html import strip_tags
-
-        text = strip_tags(obj.desc)
-        if len(text) <= 150:
-            return text
-        return text[:147] + "..."
-
 
 class CommentLikeSerializer(serializers.Serializer):
     """
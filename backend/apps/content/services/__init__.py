@@ -1,3 +1,5 @@
 from .comment_like_service import comment_like_service
+from .content_cache import content_cache
+from .trending import trending_service
 
-__all__ = ["comment_like_service"]
+__all__ = ["comment_like_service", "content_cache", "trending_service"]
@@ -1,29 +1,103 @@
+import hashlib
 import logging
+import re
+import threading
+import time
+from types import SimpleNamespace
 from typing import Optional
 
+from apps.common.services import LazyService
+from apps.content.models import ArticleSummary
 from decouple import config
 from django.conf import settings
 from django.core.cache import caches
+from django.db import DatabaseError
 from groq import Groq
+from redis import RedisError
+from redis.exceptions import LockError
 
 logger = logging.getLogger(__name__)
 
 
+class SummaryPendingError(Exception):
+    """Another request is generating the summary and it isn't ready yet."""
+
+
+class FakeGroqClient:
+    """
+    Offline stand-in for the Groq client (settings.GROQ_FAKE_CLIENT), for
+    tests and local development without an API key. Completions list the
+    first sentences of the prompt's article content after `latency` seconds,
+    and `calls` counts them.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages, model, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+        prompt = messages[-1]["content"]
+        content = prompt.split("Article Content:", 1)[-1]
+        content = content.split("Requirements:", 1)[0].strip()
+        sentences = [s for s in re.split(r"(?<=[.!?])\s+", content) if s][:3]
+        summary = "\n".join(f"- {sentence}" for sentence in sentences)
+        message = SimpleNamespace(content=summary)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
 class GroqAIService:
-    """Service for interacting with GROQ AI API"""
+    """
+    Service for interacting with GROQ AI API
+
+    Generation is single-flight per article: the first request to miss the
+    cache takes a short-lived Redis lock and calls the API, while concurrent
+    requests briefly poll the cache for its result (up to SUMMARY_WAIT_TIMEOUT
+    seconds, then they get a 202 to retry later) instead of paying for their
+    own call. Summaries of newly published articles are also generated in the
+    background (see tasks.pregenerate_article_summary).
+
+    Summaries are keyed by a hash of the cleaned content and the model, so an
+    edit is summarized afresh while unchanged content never is twice. Each
+    article's latest summary is also stored in the database (ArticleSummary),
+    which backs the Redis cache: entries that expired or were flushed are
+    restored from it instead of regenerated.
+    """
+
+    # Longer than any API call, so a crashed holder can't block generation
+    LOCK_TIMEOUT = 60
+    # Waiting holds a worker, so only short generations are waited for
+    SUMMARY_WAIT_TIMEOUT = 2
+    POLL_INTERVAL = 0.25
 
     def __init__(self):
-        self.client = Groq(api_key=config("GROQ_API_KEY"))
-        self.model = config("GROQ_MODEL")
+        if settings.GROQ_FAKE_CLIENT:
+            self.client = FakeGroqClient()
+            self.model = config("GROQ_MODEL", default="fake-summarizer")
+        else:
+            self.client = Groq(api_key=config("GROQ_API_KEY"))
+            self.model = config("GROQ_MODEL")
         self.cache = caches["summaries"]
 
-    def _get_cache_key(self, article_id: str) -> str:
+    def _get_cache_key(self, article_id: str, content_hash: str) -> str:
         """Generate cache key for article summary"""
-        return f"summary:{article_id}"
+        return f"summary:{article_id}:{content_hash}"
+
+    def _get_lock_key(self, article_id: str, content_hash: str) -> str:
+        return f"summary:lock:{article_id}:{content_hash}"
+
+    def _content_hash(self, clean_content: str) -> str:
+        """Identify what a summary was generated from (content and model)"""
+        source = f"{self.model}\n{clean_content}".encode()
+        return hashlib.sha256(source).hexdigest()
 
     def _clean_content(self, html_content: str) -> str:
         """Strip HTML tags and clean content for AI processing"""
-        import re
         from html import unescape
 
         # Remove HTML tags
@@ -58,9 +132,9 @@ class GroqAIService:
 
                 Summary:"""
 
-    def get_cached_summary(self, article_id: str) -> Optional[dict]:
+    def get_cached_summary(self, article_id: str, content_hash: str) -> Optional[dict]:
         """Retrieve cached summary if available"""
-        cache_key = self._get_cache_key(article_id)
+        cache_key = self._get_cache_key(article_id, content_hash)
         cached_data = self.cache.get(cache_key)
 
         if cached_data:
@@ -70,33 +144,140 @@ class GroqAIService:
         logger.info(f"Cache MISS for article {article_id}")
         return None
 
+    def get_stored_summary(self, article_id: str, content_hash: str) -> Optional[dict]:
+        """
+        Retrieve the summary stored in the database if it was generated from
+        the same content and model, and put it back in the cache.
+        """
+        try:
+            stored = ArticleSummary.objects.filter(
+                article_id=article_id, content_hash=content_hash
+            ).values_list("summary", flat=True)
+            summary = stored.first()
+        except DatabaseError as e:
+            logger.error(f"Stored summary unavailable for article {article_id}: {e}")
+            return None
+        if summary is None:
+            return None
+
+        logger.info(f"Restored stored summary for article {article_id}")
+        data = {"summary": summary, "article_id": article_id}
+        self._cache_summary(article_id, content_hash, data)
+        return data
+
+    def _cache_summary(self, article_id: str, content_hash: str, data: dict) -> None:
+        try:
+            self.cache.set(self._get_cache_key(article_id, content_hash), data)
+        except RedisError as e:
+            # Still stored, it is restored from the database next time
+            logger.error(f"Failed to cache summary for article {article_id}: {e}")
+
+    def _store_summary(self, article_id: str, content_hash: str, summary: str) -> None:
+        """Persist the summary, replacing the one of a previous revision."""
+        try:
+            ArticleSummary.objects.update_or_create(
+                article_id=article_id,
+                defaults={
+                    "content_hash": content_hash,
+                    "model": self.model,
+                    "summary": summary,
+                },
+            )
+        except DatabaseError as e:
+            # Still cached, it is only regenerated once that expires
+            logger.error(f"Failed to store summary for article {article_id}: {e}")
+
     def generate_summary(
         self, article_id: str, title: str, content: str, force_regenerate: bool = False
     ) -> dict:
         """
-        Generate article summary using GROQ AI
+        Generate article summary using GROQ AI, unless one of the same
+        content is cached or stored
 
         Args:
             article_id: UUID of the article
             title: Article title
             content: Article HTML content
-            force_regenerate: If True, bypass cache and regenerate
+            force_regenerate: If True, bypass cache and database and regenerate
 
         Returns:
             dict with summary data including 'summary' and 'cached' fields
+
+        Raises:
+            ValueError: content too short to summarize
+            SummaryPendingError: another request is generating it, retry later
         """
+        # Clean the content
+        clean_content = self._clean_content(content)
+
+        if not clean_content or len(clean_content) < 50:
+            raise ValueError("Article content is too short to summarize")
+
+        content_hash = self._content_hash(clean_content)
+
         # Check cache first (unless force regenerate)
         if not force_regenerate:
-            cached = self.get_cached_summary(article_id)
+            cached = self.get_cached_summary(article_id, content_hash)
             if cached:
                 return {**cached, "cached": True}
 
-        # Clean the content
-        clean_content = self._clean_content(content)
+        lock_key = self._get_lock_key(article_id, content_hash)
+        lock = self.cache.lock(lock_key, timeout=self.LOCK_TIMEOUT)
+        try:
+            acquired = lock.acquire(blocking=False)
+        except RedisError as e:
+            logger.error(f"Summary lock unavailable for article {article_id}: {e}")
+            acquired = None  # generate unlocked
 
-        if not clean_content or len(clean_content) < 50:
-            raise ValueError("Article content is too short to summarize")
+        if acquired is False:
+            # Someone else is generating it (a forced regeneration included)
+            summary = self._wait_for_summary(article_id, content_hash)
+            return {**summary, "cached": True}
 
+        try:
+            # Only the lock holder falls back to the database, and a
+            # generation may have finished between the cache check and here
+            if not force_regenerate:
+                cached = self.get_cached_summary(article_id, content_hash)
+                if not cached:
+                    cached = self.get_stored_summary(article_id, content_hash)
+                if cached:
+                    return {**cached, "cached": True}
+            return self._generate(article_id, title, clean_content, content_hash)
+        finally:
+            try:
+                if acquired:
+                    lock.release()
+            except (LockError, RedisError) as e:
+                # The lock expired (another generation may have started)
+                logger.warning(f"Summary lock for article {article_id} lost: {e}")
+
+    def _wait_for_summary(self, article_id: str, content_hash: str) -> dict:
+        """
+        Poll the cache for a summary being generated by another request.
+        Raises SummaryPendingError if it doesn't show up in time, or if the
+        generation ended without one (it failed).
+        """
+        deadline = time.monotonic() + self.SUMMARY_WAIT_TIMEOUT
+        lock_key = self._get_lock_key(article_id, content_hash)
+        cache_key = self._get_cache_key(article_id, content_hash)
+        while True:
+            time.sleep(self.POLL_INTERVAL)
+            # Checked before the cache: the holder caches, then unlocks
+            generating = self.cache.has_key(lock_key)
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info(f"Waited for summary of article {article_id}")
+                return cached
+            if not generating:
+                raise SummaryPendingError("Summary generation failed, try again.")
+            if time.monotonic() >= deadline:
+                raise SummaryPendingError("Summary is still being generated.")
+
+    def _generate(
+        self, article_id: str, title: str, clean_content: str, content_hash: str
+    ) -> dict:
+        """Call the API, then store and cache the summary of cleaned content."""
         # Generate prompt
         prompt = self._generate_summary_prompt(title, clean_content)
 
@@ -125,10 +306,11 @@ class GroqAIService:
                 "cached": False,
             }
 
-            # Cache the result
-            cache_key = self._get_cache_key(article_id)
-            self.cache.set(
-                cache_key,
+            # Store and cache the result
+            self._store_summary(article_id, content_hash, summary)
+            self._cache_summary(
+                article_id,
+                content_hash,
                 {"summary": summary, "article_id": article_id},
             )
 
@@ -143,5 +325,5 @@ class GroqAIService:
             raise
 
 
-# Singleton instance
-groq_service = GroqAIService()
+# Singleton instance, the Groq client is built on first use
+groq_service = LazyService("groq", GroqAIService)
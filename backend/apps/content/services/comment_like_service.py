@@ -1,12 +1,47 @@
 import logging
 import uuid
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import redis
+from apps.common.services import LazyService
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Toggle membership and return {is_liked, like_count} in one atomic call.
+# The comment is also marked dirty (KEYS[2]) for write-behind persistence,
+# and re-scored in its article's top comments ZSET (KEYS[3]) if given.
+TOGGLE_LIKE_SCRIPT = """
+redis.call('SADD', KEYS[2], ARGV[2])
+local liked = 1
+if redis.call('SREM', KEYS[1], ARGV[1]) == 1 then
+    liked = 0
+else
+    redis.call('SADD', KEYS[1], ARGV[1])
+end
+local count = redis.call('SCARD', KEYS[1])
+if KEYS[3] then
+    if count > 0 then
+        redis.call('ZADD', KEYS[3], count, ARGV[2])
+    else
+        redis.call('ZREM', KEYS[3], ARGV[2])
+    end
+end
+return {liked, count}
+"""
+
+# Delete the set, mark the comment dirty, drop it from its article's top
+# comments ZSET (KEYS[3]) if given and return how many likes it held
+REMOVE_ALL_LIKES_SCRIPT = """
+local count = redis.call('SCARD', KEYS[1])
+redis.call('DEL', KEYS[1])
+redis.call('SADD', KEYS[2], ARGV[1])
+if KEYS[3] then
+    redis.call('ZREM', KEYS[3], ARGV[1])
+end
+return count
+"""
+
 
 class CommentLikeService:
     """
@@ -16,8 +51,24 @@ class CommentLikeService:
     - Key: comment:likes:{comment_id}
     - Type: SET
     - Members: user_ids who liked the comment
+
+    Read-modify-write operations run as Lua scripts, so they are atomic
+    (no lost updates on concurrent double-clicks) and take one round trip.
+
+    Root comments with likes are also ranked per article:
+    - Key: article:top_comments:{article_id}
+    - Type: ZSET (member: comment_id, score: like count)
+    Updated in the toggle script, so ranking costs O(log n) per like and
+    reading the top k is O(log n + k).
+
+    Every change also adds the comment id to the comment:likes:dirty SET.
+    The sync_comment_likes task drains it and writes the likes behind to
+    CommentLike/Comment.like_count; `manage.py rehydrate_comment_likes`
+    rebuilds the SETs from there after Redis loses its data.
     """
 
+    DIRTY_KEY = "comment:likes:dirty"
+
     def __init__(self):
         """Initialize Redis connection with connection pooling."""
         try:
@@ -27,6 +78,11 @@ class CommentLikeService:
                 max_connections=50,
             )
 
+            self._toggle_like = self.redis_client.register_script(TOGGLE_LIKE_SCRIPT)
+            self._remove_all_likes = self.redis_client.register_script(
+                REMOVE_ALL_LIKES_SCRIPT
+            )
+
             # Test connection
             self.redis_client.ping()
             logger.info("Redis connection established successfully")
@@ -50,7 +106,16 @@ class CommentLikeService:
         """
         return f"comment:likes:{str(comment_id)}"
 
-    def toggle_like(self, comment_id: uuid.UUID, user_id: uuid.UUID) -> Dict[str, any]:
+    def _get_top_key(self, article_id: uuid.UUID) -> str:
+        """Redis key of an article's top comments ZSET."""
+        return f"article:top_comments:{str(article_id)}"
+
+    def toggle_like(
+        self,
+        comment_id: uuid.UUID,
+        user_id: uuid.UUID,
+        article_id: Optional[uuid.UUID] = None,
+    ) -> Dict[str, any]:
         """
         Toggle like status for a comment.
         If user already liked, it unlikes. If not liked, it likes.
@@ -58,6 +123,8 @@ class CommentLikeService:
         Args:
             comment_id: ID of the comment (UUID)
             user_id: ID of the user (UUID)
+            article_id: Article of the comment, pass it for root comments
+                to keep the article's top comments ranking up to date
 
         Returns:
             Dictionary with:
@@ -68,26 +135,15 @@ class CommentLikeService:
         try:
             redis_key = self._get_key(comment_id)
 
-            user_id_str = str(user_id)
-
-            # Check if user already liked this comment
-            is_currently_liked = self.redis_client.sismember(redis_key, user_id_str)
-
-            if is_currently_liked:
-                # Unlike: Remove user from set
-                self.redis_client.srem(redis_key, user_id_str)
-                action = "unliked"
-                is_liked = False
-                logger.info(f"User {user_id} unliked comment {comment_id}")
-            else:
-                # Like: Add user to set
-                self.redis_client.sadd(redis_key, user_id_str)
-                action = "liked"
-                is_liked = True
-                logger.info(f"User {user_id} liked comment {comment_id}")
-
-            # Get updated like count
-            like_count = self.redis_client.scard(redis_key)
+            keys = [redis_key, self.DIRTY_KEY]
+            if article_id is not None:
+                keys.append(self._get_top_key(article_id))
+            liked, like_count = self._toggle_like(
+                keys=keys, args=[str(user_id), str(comment_id)]
+            )
+            is_liked = bool(liked)
+            action = "liked" if is_liked else "unliked"
+            logger.info(f"User {user_id} {action} comment {comment_id}")
 
             return {"is_liked": is_liked, "like_count": like_count, "action": action}
 
@@ -220,20 +276,26 @@ class CommentLikeService:
             logger.error(f"Unexpected error in get_users_who_liked: {e}")
             raise
 
-    def remove_all_likes(self, comment_id: uuid.UUID) -> int:
+    def remove_all_likes(
+        self, comment_id: uuid.UUID, article_id: Optional[uuid.UUID] = None
+    ) -> int:
         """
         Remove all likes from a comment (useful when comment is deleted).
 
         Args:
             comment_id: ID of the comment (UUID)
+            article_id: Article of the comment, pass it to also drop the
+                comment from the article's top comments ranking
 
         Returns:
             Number of likes removed
         """
         try:
             redis_key = self._get_key(comment_id)
-            like_count = self.redis_client.scard(redis_key)
-            self.redis_client.delete(redis_key)
+            keys = [redis_key, self.DIRTY_KEY]
+            if article_id is not None:
+                keys.append(self._get_top_key(article_id))
+            like_count = self._remove_all_likes(keys=keys, args=[str(comment_id)])
 
             logger.info(f"Removed {like_count} likes from comment {comment_id}")
             return like_count
@@ -245,6 +307,92 @@ class CommentLikeService:
             logger.error(f"Unexpected error in remove_all_likes: {e}")
             raise
 
+    def get_top_comments(
+        self, article_id: uuid.UUID, count: int
+    ) -> List[Tuple[str, int]]:
+        """
+        Return (comment_id, like_count) pairs for the article's `count` most
+        liked root comments, highest first. Comments tied with the last one
+        are included too, so callers can break ties (the ZSET orders them
+        by id). Comments without likes are not ranked.
+        """
+        key = self._get_top_key(article_id)
+        ranked = self.redis_client.zrevrange(key, 0, count - 1, withscores=True)
+        if len(ranked) == count:
+            lowest = ranked[-1][1]
+            seen = {comment_id for comment_id, _ in ranked}
+            ranked += [
+                (comment_id, score)
+                for comment_id, score in self.redis_client.zrevrangebyscore(
+                    key, lowest, lowest, withscores=True
+                )
+                if comment_id not in seen
+            ]
+        return [(comment_id, int(score)) for comment_id, score in ranked]
+
+    def restore_top_comments(
+        self, ranking: Dict[uuid.UUID, Dict[str, int]], overwrite: bool = False
+    ) -> None:
+        """
+        Load like counts (article id -> {comment id: like count}) into the
+        top comments ZSETs. Existing scores are kept unless `overwrite`.
+        """
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for article_id, scores in ranking.items():
+            if scores:
+                pipeline.zadd(
+                    self._get_top_key(article_id), scores, nx=not overwrite
+                )
+        pipeline.execute()
+
+    def pop_dirty_comment_ids(self, count: int) -> List[str]:
+        """
+        Remove and return up to `count` comment ids whose likes changed since
+        they were last persisted. A like changing after this call marks the
+        comment dirty again, so no update is lost.
+        """
+        return self.redis_client.spop(self.DIRTY_KEY, count) or []
+
+    def mark_dirty(self, comment_ids: List[str]) -> None:
+        """Queue comments for persistence again (e.g. after a failed sync)."""
+        if comment_ids:
+            self.redis_client.sadd(self.DIRTY_KEY, *comment_ids)
+
+    def get_bulk_likers(self, comment_ids: List[str]) -> Dict[str, Set[str]]:
+        """Map each comment id to the user ids that liked it, in one round trip."""
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for comment_id in comment_ids:
+            pipeline.smembers(self._get_key(comment_id))
+        return dict(zip(comment_ids, pipeline.execute()))
+
+    def restore_likes(
+        self, likes: Dict[str, List[str]], overwrite: bool = False
+    ) -> int:
+        """
+        Load likes (comment id -> user ids) back into Redis. Existing SETs are
+        kept unless `overwrite`, since they may hold changes not yet persisted.
+        Returns the number of comments restored.
+        """
+        comment_ids = list(likes)
+        if not overwrite:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for comment_id in comment_ids:
+                pipeline.exists(self._get_key(comment_id))
+            comment_ids = [
+                comment_id
+                for comment_id, exists in zip(comment_ids, pipeline.execute())
+                if not exists
+            ]
+
+        pipeline = self.redis_client.pipeline()
+        for comment_id in comment_ids:
+            redis_key = self._get_key(comment_id)
+            pipeline.delete(redis_key)
+            if likes[comment_id]:
+                pipeline.sadd(redis_key, *likes[comment_id])
+        pipeline.execute()
+        return len(comment_ids)
+
     def health_check(self) -> bool:
         """
         Check if Redis connection is healthy.
@@ -259,5 +407,13 @@ class CommentLikeService:
             return False
 
 
-# Singleton instance
-comment_like_service = CommentLikeService()
+# Singleton instance, connects to Redis on first use
+comment_like_service = LazyService("comment_likes", CommentLikeService)
+
+
+def forget_comment(comment_id: uuid.UUID, article_id: uuid.UUID) -> None:
+    """Drop a deleted comment's likes and ranking; errors are logged, not raised."""
+    try:
+        comment_like_service.remove_all_likes(comment_id, article_id)
+    except redis.RedisError as e:
+        logger.error(f"Failed to remove likes of deleted comment {comment_id}: {e}")
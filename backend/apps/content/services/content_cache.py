@@ -0,0 +1,262 @@
+import hashlib
+import logging
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from redis import RedisError
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+class ContentCacheService:
+    """
+    Content versions for public content endpoints, used for the anonymous
+    article response cache and for ETag/Last-Modified validators.
+
+    A version is a token stored in Redis under content:version:{scope} and
+    replaced whenever that scope's content changes (see signals.py), so
+    invalidating never has to hunt down keys:
+    - global: everything shown in article lists. Bumped when a published
+      article is edited/published/unpublished, reactions change, or a tag
+      or category changes. Article detail pages include it too.
+    - article:{slug}: a single article's detail page. Bumped with the above
+      for that article, and on comment or saved-article changes.
+    - jobs, events, resources, tools, categories: the other content types,
+      bumped on any change to that type (or to what it displays).
+    - trending: the trending articles ranking (see TrendingService), bumped
+      each time its scores are decayed.
+
+    Tokens are the bump time in nanoseconds, which also gives a
+    Last-Modified date. Stale cached responses are never deleted, they just
+    stop being read and expire after the "responses" cache TIMEOUT.
+    """
+
+    GLOBAL_SCOPE = "global"
+    GLOBAL_VERSION_KEY = "content:version:global"
+
+    def __init__(self):
+        self.cache = caches["responses"]
+
+    def version_key(self, scope: str) -> str:
+        return f"content:version:{scope}"
+
+    def article_scope(self, slug: str) -> str:
+        return f"article:{slug}"
+
+    def _article_version_key(self, slug: str) -> str:
+        return self.version_key(self.article_scope(slug))
+
+    @staticmethod
+    def _new_token() -> str:
+        return str(time.time_ns())
+
+    def _get_versions(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(keys)
+        versions = self.cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Never fall back to a fixed default: after an eviction that
+                # could resurrect responses cached under that default earlier
+                self.cache.add(key, self._new_token(), timeout=None)
+                versions[key] = self.cache.get(key)
+        return versions
+
+    def get_version(self, scope: str) -> str:
+        """Return the current version token of `scope`."""
+        key = self.version_key(scope)
+        return self._get_versions([key])[key]
+
+    def _set_versions(self, keys: Iterable[str]) -> None:
+        try:
+            self.cache.set_many(
+                {key: self._new_token() for key in keys}, timeout=None
+            )
+        except RedisError as e:
+            logger.error(f"Failed to bump content cache version: {e}")
+
+    def _bump(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        self._set_versions(keys)
+        # A reader between now and COMMIT could cache pre-commit data under
+        # the new version, so bump again once the transaction commits.
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: self._set_versions(keys))
+
+    def bump(self, *scopes: str) -> None:
+        """Mark the content in `scopes` as changed."""
+        self._bump(self.version_key(scope) for scope in scopes)
+
+    def bump_global(self) -> None:
+        """Invalidate every cached article list and detail response."""
+        self.bump(self.GLOBAL_SCOPE)
+
+    def invalidate_article(self, article, listed: bool = True) -> None:
+        """
+        Invalidate the cached detail page of `article`, and all cached lists
+        too unless `listed` is False (for changes lists don't show, e.g.
+        comments).
+        """
+        keys = [self._article_version_key(article.slug)]
+        if listed:
+            keys.append(self.GLOBAL_VERSION_KEY)
+        self._bump(keys)
+
+    def _make_key(self, kind: str, request, versions: Iterable[str]) -> str:
+        # Host is part of the key because paginated payloads embed absolute URLs
+        params = sorted(request.query_params.lists())
+        fingerprint = hashlib.md5(
+            repr((request.get_host(), request.path, params)).encode()
+        ).hexdigest()
+        return f"response:{kind}:{fingerprint}:{':'.join(versions)}"
+
+    def list_key(self, request, *scopes: str) -> str:
+        """Key of a cached list; `scopes` are versions it depends on besides global."""
+        keys = [self.GLOBAL_VERSION_KEY, *(self.version_key(s) for s in scopes)]
+        versions = self._get_versions(keys)
+        return self._make_key("list", request, [versions[key] for key in keys])
+
+    def detail_key(self, request, slug: str) -> str:
+        article_key = self._article_version_key(slug)
+        versions = self._get_versions([self.GLOBAL_VERSION_KEY, article_key])
+        return self._make_key(
+            "detail", request, [versions[self.GLOBAL_VERSION_KEY], versions[article_key]]
+        )
+
+    def article_value(self, article, name: str, compute: Callable[[], object]):
+        """
+        Return `compute()` for `article`, cached until the article's version
+        changes (e.g. comment counts, which comment signals invalidate).
+        """
+        return self.scope_value(
+            self.article_scope(article.slug), f"article:{article.pk}:{name}", compute
+        )
+
+    def scope_value(self, scope: str, name: str, compute: Callable[[], object]):
+        """Return `compute()`, cached until the version of `scope` changes."""
+        key: Optional[str] = None
+        try:
+            version_key = self.version_key(scope)
+            version = self._get_versions([version_key])[version_key]
+            key = f"{name}:{version}"
+            value = self.cache.get(key)
+        except RedisError as e:
+            logger.error(f"Content cache unavailable: {e}")
+            value = None
+
+        if value is not None:
+            return value
+
+        value = compute()
+        if key is not None:
+            try:
+                self.cache.set(key, value)
+            except RedisError as e:
+                logger.error(f"Failed to cache {name}: {e}")
+        return value
+
+    def get_validators(
+        self, scopes: Iterable[str], *extra: str
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Build an ETag and Last-Modified timestamp (seconds) for a response
+        that depends on `scopes`, without touching the database. `extra`
+        values (e.g. path, user id) are mixed into the ETag.
+        """
+        keys = [self.version_key(scope) for scope in scopes]
+        versions = self._get_versions(keys)
+        tokens = [str(versions[key]) for key in keys]
+        etag = hashlib.md5(":".join([*tokens, *extra]).encode()).hexdigest()
+        try:
+            last_modified = max(int(token) for token in tokens) // 10**9
+        except ValueError:
+            last_modified = None
+        return etag, last_modified
+
+    def cached_response(
+        self, get_key: Callable[[], str], build_response: Callable[[], Response]
+    ) -> Response:
+        """
+        Serve the cached body for the key from `get_key`, or call
+        `build_response` and cache it if it succeeded. If Redis is down,
+        responses are built uncached.
+        """
+        key: Optional[str] = None
+        try:
+            key = get_key()
+            data = self.cache.get(key)
+        except RedisError as e:
+            logger.error(f"Content cache unavailable: {e}")
+            data = None
+
+        if data is not None:
+            return Response(data=data, status=200)
+
+        response = build_response()
+        if key is not None and response.status_code == 200:
+            try:
+                self.cache.set(key, response.data)
+            except RedisError as e:
+                logger.error(f"Failed to cache response: {e}")
+        return response
+
+    def cached_http_response(
+        self,
+        request,
+        scopes: Iterable[str],
+        build_response: Callable[[], HttpResponse],
+        *extra: str,
+    ) -> HttpResponse:
+        """
+        Plain Django counterpart of cached_response() for non-DRF views
+        (feeds, sitemaps): answer 304 when the client's validators match the
+        versions of `scopes`, else serve the rendered body cached for those
+        versions, else call `build_response` and cache its body. The URL and
+        host (absolute URLs end up in the body) are part of the key.
+        """
+        try:
+            etag, last_modified = self.get_validators(
+                scopes, request.get_host(), request.get_full_path(), *extra
+            )
+        except RedisError as e:
+            logger.error(f"Content versions unavailable, response not cached: {e}")
+            return build_response()
+        quoted_etag = quote_etag(etag)
+
+        response = get_conditional_response(
+            request, etag=quoted_etag, last_modified=last_modified
+        )
+        if response is None:
+            key = f"http:{etag}"
+            try:
+                cached = self.cache.get(key)
+            except RedisError as e:
+                logger.error(f"Content cache unavailable: {e}")
+                cached = None
+
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                response = build_response()
+                if response.status_code != 200:
+                    return response
+                if hasattr(response, "render"):
+                    response.render()  # TemplateResponse
+                try:
+                    self.cache.set(key, (response.content, response["Content-Type"]))
+                except RedisError as e:
+                    logger.error(f"Failed to cache response: {e}")
+
+        response["ETag"] = quoted_etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+content_cache = ContentCacheService()
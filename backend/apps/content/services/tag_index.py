@@ -0,0 +1,153 @@
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional
+
+from apps.content.models import Tag, ToolTag
+from apps.content.services.content_cache import content_cache
+from redis import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class TagEntry(NamedTuple):
+    key: str  # lowercased name, what prefixes are matched against
+    id: object
+    name: str
+    usage: int
+
+
+class _Snapshot(NamedTuple):
+    index: "PrefixIndex"
+    version: Optional[str]
+    built_at: float
+    checked_at: float
+
+
+class PrefixIndex:
+    """
+    Immutable, sorted snapshot of tag names for prefix lookups.
+
+    Top entries for short prefixes (the ones matching the most names) are
+    precomputed; longer prefixes bisect into the sorted names and rank the
+    few matches on the fly.
+    """
+
+    def __init__(self, entries: List[TagEntry], max_limit: int, precomputed: int):
+        self.entries = sorted(entries)
+        self.keys = [entry.key for entry in self.entries]
+        self.precomputed = precomputed
+        self.top: Dict[str, List[TagEntry]] = {}
+        for length in range(precomputed + 1):
+            groups: Dict[str, List[TagEntry]] = {}
+            for entry in self.entries:
+                groups.setdefault(entry.key[:length], []).append(entry)
+            for prefix, group in groups.items():
+                self.top[prefix] = self._rank(group, max_limit)
+
+    @staticmethod
+    def _rank(entries, limit: int) -> List[TagEntry]:
+        return heapq.nsmallest(limit, entries, key=lambda e: (-e.usage, e.key))
+
+    def search(self, prefix: str, limit: int) -> List[TagEntry]:
+        if len(prefix) <= self.precomputed:
+            return self.top.get(prefix, [])[:limit]
+        start = bisect_left(self.keys, prefix)
+        # Every key starting with `prefix` sorts before prefix + U+10FFFF
+        end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+        return self._rank(self.entries[start:end], limit)
+
+
+class TagIndexService:
+    """
+    In-memory prefix index of tag names for typeahead, one per tag kind
+    ("article": Tag ranked by published articles, "tool": ToolTag ranked by
+    tools).
+
+    Lookups never touch the database. Each process keeps its own snapshot and
+    rebuilds it (one query over the tag counter columns) when the "tag_index"
+    content version changes, which signals.py bumps on tag and tagging
+    changes. The version is checked at most every CHECK_INTERVAL seconds, and
+    snapshots are rebuilt every REBUILD_INTERVAL seconds regardless, to pick
+    up usage changes that don't bump it (e.g. an article being published).
+    """
+
+    SCOPE = "tag_index"
+    KINDS = ("article", "tool")
+    MAX_LIMIT = 20
+    PRECOMPUTED_PREFIX_LENGTH = 2
+    CHECK_INTERVAL = 1.0
+    REBUILD_INTERVAL = 300
+
+    def __init__(self):
+        # kind -> _Snapshot, replaced as a whole so readers need no lock
+        self._snapshots: Dict[str, _Snapshot] = {}
+        self._lock = threading.Lock()
+
+    def _load_entries(self, kind: str) -> List[TagEntry]:
+        if kind == "article":
+            rows = Tag.objects.values_list("pk", "name", "article_count")
+        else:
+            rows = ToolTag.objects.values_list("pk", "name", "tool_count")
+        return [TagEntry(name.lower(), pk, name, usage) for pk, name, usage in rows]
+
+    def _current_version(self) -> Optional[str]:
+        try:
+            return content_cache.get_version(self.SCOPE)
+        except RedisError as e:
+            logger.error(f"Tag index version unavailable: {e}")
+            return None
+
+    def _fresh_index(self, kind: str, now: float) -> Optional[PrefixIndex]:
+        snapshot = self._snapshots.get(kind)
+        if snapshot is not None and now - snapshot.checked_at < self.CHECK_INTERVAL:
+            return snapshot.index
+        return None
+
+    def _get_index(self, kind: str) -> PrefixIndex:
+        now = time.monotonic()
+        index = self._fresh_index(kind, now)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._fresh_index(kind, now)
+            if index is not None:
+                return index
+            snapshot = self._snapshots.get(kind)
+            version = self._current_version()
+            if (
+                snapshot is None
+                or now - snapshot.built_at >= self.REBUILD_INTERVAL
+                # Keep serving the snapshot we have while Redis is down
+                or (version is not None and version != snapshot.version)
+            ):
+                index = PrefixIndex(
+                    self._load_entries(kind),
+                    self.MAX_LIMIT,
+                    self.PRECOMPUTED_PREFIX_LENGTH,
+                )
+                snapshot = _Snapshot(index, version, now, now)
+            else:
+                snapshot = snapshot._replace(checked_at=now)
+            self._snapshots[kind] = snapshot
+            return snapshot.index
+
+    def search(self, prefix: str, kind: str = "article", limit: int = 10):
+        """Return up to `limit` tags starting with `prefix`, most used first."""
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        return self._get_index(kind).search(prefix.strip().lower(), limit)
+
+    def invalidate(self) -> None:
+        """Make every process rebuild its tag index on its next lookup."""
+        content_cache.bump(self.SCOPE)
+
+    def reset(self) -> None:
+        """Drop this process's snapshots (e.g. between tests)."""
+        with self._lock:
+            self._snapshots.clear()
+
+
+tag_index = TagIndexService()
@@ -0,0 +1,180 @@
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import redis
+from apps.analytics.choices import EventTypeChoices
+from apps.common.services import LazyService
+from apps.content.models import Article
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Scale every score by the decay accrued since the last run (KEYS[2] holds
+# its time), then drop the scores that faded out and keep the top ARGV[4].
+# Atomic, so increments racing with the decay are never lost.
+DECAY_SCRIPT = """
+local now = tonumber(ARGV[1])
+local last = tonumber(redis.call('GET', KEYS[2]) or ARGV[1])
+redis.call('SET', KEYS[2], ARGV[1])
+local elapsed = now - last
+if elapsed <= 0 then
+    return '1'
+end
+local factor = 0.5 ^ (elapsed / tonumber(ARGV[2]))
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', factor)
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[3])
+    redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -tonumber(ARGV[4]) - 1)
+end
+return tostring(factor)
+"""
+
+
+class TrendingService:
+    """
+    Trending articles ranked by engagement that fades over time.
+
+    Redis Data Structure:
+    - Key: articles:trending
+    - Type: ZSET (member: article_id, score: decayed engagement)
+
+    Each engagement event with a published article adds its weight to the
+    article's score (ZINCRBY), so recording costs an indexed lookup plus
+    O(log n) and reading the top k is O(log n + k); raw
+    events are never aggregated per request. The decay_trending_articles
+    task periodically scales every score by 0.5 ** (elapsed / HALF_LIFE),
+    which makes an event's contribution halve every HALF_LIFE seconds, and
+    prunes articles that faded below MIN_SCORE. `manage.py
+    rebuild_trending_articles` recomputes the scores from the database
+    (analytics events, reactions, comments and saves) after Redis loses them.
+    """
+
+    KEY = "articles:trending"
+    DECAYED_AT_KEY = "articles:trending:decayed_at"
+    SCOPE = "trending"  # content version, bumped after each decay
+
+    WEIGHTS = {
+        "view": 1.0,
+        "share": 5.0,
+        "reaction": 2.0,
+        "comment": 3.0,
+        "save": 3.0,
+    }
+    # Analytics (UserActivity) event types that count, and their WEIGHTS key
+    ACTIVITY_EVENTS = {
+        EventTypeChoices.PAGE_VIEW: "view",
+        EventTypeChoices.SHARE: "share",
+    }
+    HALF_LIFE = 24 * 60 * 60
+    MIN_SCORE = 0.05
+    MAX_SIZE = 5000
+
+    def __init__(self):
+        """Initialize Redis connection with connection pooling."""
+        try:
+            self.redis_client = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                max_connections=50,
+            )
+            self._decay = self.redis_client.register_script(DECAY_SCRIPT)
+            self.redis_client.ping()
+        except redis.ConnectionError as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            raise
+
+    def record(self, article_id: uuid.UUID, event: str, count: int = 1) -> None:
+        """
+        Add `count` engagement events of kind `event` (a WEIGHTS key) to the
+        article's score, if it is published. Errors are logged, never raised:
+        tracking must not fail the request that triggered it.
+        """
+        # Drafts and made up ids (tracked events come from clients) would
+        # take the ranking slots of published articles
+        if not Article.published.filter(pk=article_id).exists():
+            return
+        try:
+            self.redis_client.zincrby(
+                self.KEY, self.WEIGHTS[event] * count, str(article_id)
+            )
+        except redis.RedisError as e:
+            logger.error(f"Failed to record trending {event} for {article_id}: {e}")
+
+    def record_activity(self, event_type: str, metadata: dict) -> None:
+        """Record a tracked analytics event if it is a view or share of an article."""
+        event = self.ACTIVITY_EVENTS.get(event_type)
+        # Metadata is client-supplied JSON, so it may not be an object at all
+        if event is None or not isinstance(metadata, dict):
+            return
+        if metadata.get("content_type") != "article":
+            return
+        try:
+            article_id = uuid.UUID(str(metadata.get("content_id")))
+        except ValueError:
+            return
+        self.record(article_id, event)
+
+    def remove(self, article_id: uuid.UUID) -> None:
+        """Drop an article from the ranking (e.g. unpublished or deleted)."""
+        try:
+            self.redis_client.zrem(self.KEY, str(article_id))
+        except redis.RedisError as e:
+            logger.error(f"Failed to remove {article_id} from trending: {e}")
+
+    def get_top_ids(self, count: int) -> List[str]:
+        """Return up to `count` article ids, most trending first."""
+        return self.redis_client.zrevrange(self.KEY, 0, count - 1)
+
+    def decay(self, now: Optional[float] = None) -> float:
+        """Apply the decay accrued since the last call; returns the factor."""
+        now = time.time() if now is None else now
+        factor = self._decay(
+            keys=[self.KEY, self.DECAYED_AT_KEY],
+            args=[now, self.HALF_LIFE, self.MIN_SCORE, self.MAX_SIZE],
+        )
+        return float(factor)
+
+    def restore(self, scores: Dict[str, float], now: Optional[float] = None) -> None:
+        """Replace the ranking with `scores` (article id -> score) decayed to `now`."""
+        now = time.time() if now is None else now
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(self.KEY)
+        if scores:
+            pipeline.zadd(self.KEY, scores)
+        pipeline.set(self.DECAYED_AT_KEY, now)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        self.redis_client.delete(self.KEY, self.DECAYED_AT_KEY)
+
+
+# Singleton instance, connects to Redis on first use
+trending_service = LazyService("trending", TrendingService)
+
+
+# Entry points for request and signal code. Connecting raises when Redis is
+# unreachable, before the service methods can log their errors, so these
+# swallow that too: trending must never fail an unrelated write.
+
+
+def record_engagement(article_id: uuid.UUID, event: str) -> None:
+    try:
+        trending_service.record(article_id, event)
+    except redis.RedisError as e:
+        logger.error(f"Failed to record trending {event} for {article_id}: {e}")
+
+
+def record_activity(event_type: str, metadata: dict) -> None:
+    try:
+        trending_service.record_activity(event_type, metadata)
+    except redis.RedisError as e:
+        logger.error(f"Failed to record trending {event_type}: {e}")
+
+
+def remove_article(article_id: uuid.UUID) -> None:
+    try:
+        trending_service.remove(article_id)
+    except redis.RedisError as e:
+        logger.error(f"Failed to remove {article_id} from trending: {e}")
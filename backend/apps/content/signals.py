@@ -0,0 +1,351 @@
+from apps.content import search, tags
+from apps.content.choices import ArticleStatusChoices
+from apps.content.models import (
+    Article,
+    ArticleReaction,
+    Category,
+    Comment,
+    Event,
+    Job,
+    RelatedArticle,
+    Resource,
+    SavedArticle,
+    Tag,
+    Tool,
+    ToolTag,
+)
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+
+def _content_cache():
+    # Imported lazily so loading the app doesn't pull in the Redis services
+    from apps.content.services.content_cache import content_cache
+
+    return content_cache
+
+
+def _trending():
+    from apps.content.services import trending
+
+    return trending
+
+
+def _schedule_related_refresh(article_ids):
+    # Imported lazily: tasks pull in the Redis services
+    from apps.content.tasks import refresh_related_articles
+
+    for pk in {str(pk) for pk in article_ids}:
+        transaction.on_commit(lambda pk=pk: refresh_related_articles.delay(pk))
+
+
+def _article_tags_changed(article):
+    if article.status == ArticleStatusChoices.PUBLISHED:
+        search.index_article(article)
+        _content_cache().invalidate_article(article)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def reindex_on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Tags are part of the search document and responses, so refresh both."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            _article_tags_changed(instance)
+        return
+
+    # Changed from the tag side (tag.articles.add(...)): pk_set holds the
+    # affected articles, except on clear where we collect them up front.
+    if action == "pre_clear":
+        instance._search_cleared_article_ids = list(
+            instance.articles.values_list("pk", flat=True)
+        )
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_search_cleared_article_ids", [])
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    for article in Article.objects.filter(pk__in=pk_set).prefetch_related("tags"):
+        _article_tags_changed(article)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def refresh_tag_article_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # tag.articles.add(...): only this tag's count can change
+        if action in ("post_add", "post_remove", "post_clear"):
+            Tag.refresh_counts([instance.pk])
+        return
+    if instance.status != ArticleStatusChoices.PUBLISHED:
+        return
+    if action == "pre_clear":
+        instance._counter_cleared_tag_ids = list(
+            instance.tags.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        Tag.refresh_counts(instance.__dict__.pop("_counter_cleared_tag_ids", []))
+    elif action in ("post_add", "post_remove"):
+        Tag.refresh_counts(pk_set)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def refresh_related_on_tags_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        if instance.status == ArticleStatusChoices.PUBLISHED:
+            _schedule_related_refresh([instance.pk])
+    elif pk_set:
+        # Changed from the tag side; a clear is left to the periodic rebuild
+        _schedule_related_refresh(
+            Article.published.filter(pk__in=pk_set).values_list("pk", flat=True)
+        )
+
+
+@receiver(post_save, sender=Article)
+def refresh_related_on_save(sender, instance, **kwargs):
+    # Article.save() only updates the _loaded_* values after post_save has run
+    was_published = (
+        getattr(instance, "_loaded_status", None) == ArticleStatusChoices.PUBLISHED
+    )
+    is_published = instance.status == ArticleStatusChoices.PUBLISHED
+    moved = getattr(instance, "_loaded_category_id", None) != instance.category_id
+    if was_published != is_published or (is_published and moved):
+        _schedule_related_refresh([instance.pk])
+
+
+@receiver(post_save, sender=Article)
+def prewarm_summary_on_publish(sender, instance, **kwargs):
+    if not settings.ARTICLE_SUMMARY_PREWARM:
+        return
+    # Article.save() only updates _loaded_status after post_save has run
+    was_published = (
+        getattr(instance, "_loaded_status", None) == ArticleStatusChoices.PUBLISHED
+    )
+    if instance.status == ArticleStatusChoices.PUBLISHED and not was_published:
+        from apps.content.tasks import pregenerate_article_summary
+
+        article_id = str(instance.pk)
+        transaction.on_commit(lambda: pregenerate_article_summary.delay(article_id))
+
+
+@receiver(pre_delete, sender=Article)
+def remember_related_referrers(sender, instance, **kwargs):
+    # Their rows pointing at this article are cascaded away on delete
+    instance._related_referrer_ids = [
+        str(pk)
+        for pk in RelatedArticle.objects.filter(related_id=instance.pk).values_list(
+            "article_id", flat=True
+        )
+    ]
+
+
+@receiver(post_delete, sender=Article)
+def backfill_related_on_delete(sender, instance, **kwargs):
+    from apps.content.tasks import backfill_related_articles
+
+    referrer_ids = instance.__dict__.pop("_related_referrer_ids", [])
+    if referrer_ids:
+        transaction.on_commit(lambda: backfill_related_articles.delay(referrer_ids))
+
+
+@receiver(pre_delete, sender=Article)
+@receiver(pre_delete, sender=Tool)
+def remember_tags_for_counts(sender, instance, **kwargs):
+    # The m2m rows are gone by post_delete
+    instance._counter_tag_ids = list(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Article)
+def remove_deleted_article_from_index(sender, instance, **kwargs):
+    search.remove_article(instance)
+    if instance.status == ArticleStatusChoices.PUBLISHED:
+        _content_cache().invalidate_article(instance)
+        Category.refresh_counts([instance.category_id])
+        Tag.refresh_counts(getattr(instance, "_counter_tag_ids", []))
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def refresh_article_sitemap(sender, instance, signal, **kwargs):
+    from apps.content.sitemaps import invalidate_article_sitemap
+
+    # Article.save() only updates _loaded_status after post_save has run
+    if signal is post_delete:
+        previous_status = instance.status
+    else:
+        previous_status = getattr(instance, "_loaded_status", None)
+    invalidate_article_sitemap(
+        instance,
+        was_published=previous_status == ArticleStatusChoices.PUBLISHED,
+        is_published=signal is post_save
+        and instance.status == ArticleStatusChoices.PUBLISHED,
+    )
+
+
+@receiver(post_save, sender=ArticleReaction)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=SavedArticle)
+def record_trending_engagement(sender, instance, created, **kwargs):
+    # Not deferred to commit: a rolled back event only nudges a fading score
+    if created:
+        event = {ArticleReaction: "reaction", Comment: "comment"}.get(sender, "save")
+        _trending().record_engagement(instance.article_id, event)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def remove_unlisted_article_from_trending(sender, instance, signal, **kwargs):
+    # Article.save() only updates _loaded_status after post_save has run
+    if signal is post_save and (
+        instance.status == ArticleStatusChoices.PUBLISHED
+        or getattr(instance, "_loaded_status", None) != ArticleStatusChoices.PUBLISHED
+    ):
+        return
+    _trending().remove_article(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Resource)
+@receiver(post_save, sender=Tool)
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Resource)
+@receiver(post_delete, sender=Tool)
+def refresh_category_counts(sender, instance, signal, **kwargs):
+    # Category counters count published content, so compare (category,
+    # published) with what was loaded (see CategoryCountedMixin)
+    loaded = instance.__dict__.get("_loaded_counted_state")
+    if signal is post_delete:
+        previous = loaded or (instance.category_id, instance.is_published)
+        current = (None, False)
+    else:
+        previous = loaded or (None, False)
+        current = (instance.category_id, instance.is_published)
+        instance._loaded_counted_state = current
+    if previous == current:
+        return
+    Category.refresh_counts({previous[0], current[0]})
+
+    if sender is Tool and previous[1] != current[1]:
+        if signal is post_delete:
+            ToolTag.refresh_counts(instance.__dict__.pop("_counter_tag_ids", []))
+        else:
+            ToolTag.refresh_counts(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=Tool.tags.through)
+def refresh_tool_tag_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            ToolTag.refresh_counts([instance.pk])
+        return
+    if not instance.is_published:
+        return
+    if action == "pre_clear":
+        instance._counter_cleared_tag_ids = list(
+            instance.tags.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        ToolTag.refresh_counts(instance.__dict__.pop("_counter_cleared_tag_ids", []))
+    elif action in ("post_add", "post_remove"):
+        ToolTag.refresh_counts(pk_set)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_article_on_comment_change(sender, instance, **kwargs):
+    # Comments only show on the detail page, lists are unaffected
+    try:
+        article = instance.article
+    except Article.DoesNotExist:
+        return
+    _content_cache().invalidate_article(article, listed=False)
+
+
+@receiver(post_delete, sender=Comment)
+def remove_deleted_comment_likes(sender, instance, **kwargs):
+    from apps.content.services.comment_like_service import forget_comment
+
+    # Once committed, so a rolled back delete keeps its likes and rank
+    comment_id, article_id = instance.pk, instance.article_id
+    transaction.on_commit(lambda: forget_comment(comment_id, article_id))
+
+
+@receiver(post_save, sender=SavedArticle)
+@receiver(post_delete, sender=SavedArticle)
+def invalidate_article_on_save_change(sender, instance, **kwargs):
+    # Detail pages show is_saved, lists don't
+    try:
+        article = instance.article
+    except Article.DoesNotExist:
+        return
+    _content_cache().invalidate_article(article, listed=False)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_on_category_change(sender, **kwargs):
+    # Every content type shows its category
+    _content_cache().bump(
+        "global", "jobs", "events", "resources", "tools", "categories"
+    )
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_on_tag_change(sender, instance, **kwargs):
+    tags.forget_tag(instance)
+    _content_cache().bump("global", "resources")
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=ToolTag)
+@receiver(post_delete, sender=ToolTag)
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Tool.tags.through)
+def invalidate_tag_index(sender, action=None, **kwargs):
+    # Tag names and usage counts feed the autocomplete index
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        _content_cache().bump("tag_index")
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_jobs(sender, **kwargs):
+    _content_cache().bump("jobs")
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_events(sender, **kwargs):
+    _content_cache().bump("events")
+
+
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+@receiver(m2m_changed, sender=Resource.tags.through)
+def invalidate_resources(sender, action=None, **kwargs):
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        _content_cache().bump("resources")
+
+
+@receiver(post_save, sender=Tool)
+@receiver(post_delete, sender=Tool)
+@receiver(post_save, sender=ToolTag)
+@receiver(post_delete, sender=ToolTag)
+@receiver(m2m_changed, sender=Tool.tags.through)
+def invalidate_tools(sender, action=None, **kwargs):
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        _content_cache().bump("tools")
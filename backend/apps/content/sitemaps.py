@@ -1,16 +1,206 @@
-from apps.content.models import Article
+from bisect import bisect_right
+from functools import partial
+
+from apps.content.models import Article, Category, Event, Job, Resource, Tool
+from apps.content.services.content_cache import content_cache
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.db.models import Max
+from django.http import Http404
+
+
+class CachedSitemap(Sitemap):
+    """
+    Sitemap split into SITEMAP_CHUNK_SIZE pages (listed by the sitemap index),
+    each loading only the columns it renders and cached until its content
+    version changes.
 
+    Subclasses set `model` (or override get_queryset()) and `section_scope`,
+    the content version scope bumped when the section changes.
+    """
 
-class ArticleSitemap(Sitemap):
     changefreq = "weekly"
-    priority = 0.9
+    limit = settings.SITEMAP_CHUNK_SIZE
+    model = None
+    lookup_field = "id"
+    lastmod_field = "created_at"
+    section_scope = None
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
 
     def items(self):
-        return Article.objects.published().all()
+        # A stable order keeps chunk boundaries from moving between requests
+        return (
+            self.get_queryset()
+            .order_by("created_at", "id")
+            .values_list(self.lookup_field, self.lastmod_field, named=True)
+        )
 
     def lastmod(self, obj):
-        return obj.updated_at
+        return getattr(obj, self.lastmod_field)
+
+    def get_latest_lastmod(self):
+        # The default iterates every item, the index only needs the maximum
+        latest = self.get_queryset().aggregate(latest=Max(self.lastmod_field))
+        return latest["latest"]
+
+    def version_scopes(self, page=None):
+        return [self.section_scope]
+
+
+class ArticleSitemap(CachedSitemap):
+    priority = 0.9
+    model = Article
+    lookup_field = "slug"
+    lastmod_field = "updated_at"
+    section_scope = "sitemap:articles"
+
+    def get_queryset(self):
+        return Article.published.all()
 
     def location(self, obj):
         return f"/api/v1/articles/{obj.slug}"
+
+    def version_scopes(self, page=None):
+        # Articles are edited far more often than published or removed, so
+        # each chunk also has its own version (see invalidate_article_sitemap)
+        scopes = [self.section_scope]
+        if page is not None:
+            scopes.append(f"{self.section_scope}:{page}")
+        return scopes
+
+    def page_boundaries(self):
+        """
+        (created_at, id) of the first article of each page after the first.
+        Pages only shift when articles are published or removed, which bumps
+        the section version, so this is computed once per section version.
+        """
+
+        def compute():
+            keys = self.items().values_list("created_at", "id")
+            return [
+                key
+                for position, key in enumerate(keys.iterator())
+                if position and position % self.limit == 0
+            ]
+
+        return content_cache.scope_value(
+            self.section_scope, f"sitemap:articles:boundaries:{self.limit}", compute
+        )
+
+    def page_for(self, article):
+        """Return the sitemap page listing `article`."""
+        key = (article.created_at, article.pk)
+        return bisect_right(self.page_boundaries(), key) + 1
+
+
+class ContentSitemap(CachedSitemap):
+    changefreq = "daily"
+    priority = 0.6
+    path = None
+
+    def get_queryset(self):
+        return self.model.objects.published()
+
+    def location(self, obj):
+        return f"/api/v1/{self.path}/{obj.id}/"
+
+
+class JobSitemap(ContentSitemap):
+    model = Job
+    path = "jobs"
+    section_scope = "jobs"
+
+
+class EventSitemap(ContentSitemap):
+    model = Event
+    path = "events"
+    section_scope = "events"
+
+
+class ResourceSitemap(ContentSitemap):
+    model = Resource
+    path = "resources"
+    section_scope = "resources"
+
+
+class ToolSitemap(ContentSitemap):
+    model = Tool
+    path = "tools"
+    section_scope = "tools"
+
+
+class CategorySitemap(CachedSitemap):
+    priority = 0.5
+    model = Category
+    lookup_field = "slug"
+    section_scope = "categories"
+
+    def location(self, obj):
+        return f"/api/v1/categories/{obj.slug}/"
+
+
+sitemaps = {
+    "articles": ArticleSitemap,
+    "categories": CategorySitemap,
+    "jobs": JobSitemap,
+    "events": EventSitemap,
+    "resources": ResourceSitemap,
+    "tools": ToolSitemap,
+}
+
+
+def invalidate_article_sitemap(article, was_published, is_published):
+    """
+    Refresh the sitemap chunks showing `article` after it was saved or
+    deleted: only its own chunk when it stays published, but the whole
+    section when it is published or removed, as that moves later articles
+    to other chunks.
+    """
+    sitemap = ArticleSitemap()
+    if was_published != is_published:
+        content_cache.bump(sitemap.section_scope)
+    elif is_published:
+        content_cache.bump(f"{sitemap.section_scope}:{sitemap.page_for(article)}")
+
+
+@sitemap_views.x_robots_tag
+def index(request, sitemaps):
+    """Sitemap index, cached until any section changes."""
+    scopes = {sitemap().section_scope for sitemap in sitemaps.values()}
+    # Article sections only bump on publish/removal, but the index also shows
+    # their latest lastmod, which any article edit (bumping global) moves
+    scopes.add(content_cache.GLOBAL_SCOPE)
+    return content_cache.cached_http_response(
+        request,
+        sorted(scopes),
+        partial(sitemap_views.index.__wrapped__, request, sitemaps),
+    )
+
+
+@sitemap_views.x_robots_tag
+def section(request, sitemaps, section):
+    """One page (chunk) of a section, cached until that chunk changes."""
+    if section not in sitemaps:
+        raise Http404(f"No sitemap available for section: {section!r}")
+    sitemap = sitemaps[section]()
+    try:
+        page = int(request.GET.get("p", 1))
+    except ValueError:
+        raise Http404(f"No page {request.GET['p']!r}")
+    # Validated before building scopes: each page has its own version key,
+    # which must not be created for arbitrary client input
+    num_pages = content_cache.scope_value(
+        sitemap.section_scope,
+        f"sitemap:{section}:pages",
+        lambda: sitemap.paginator.num_pages,
+    )
+    if not 1 <= page <= num_pages:
+        raise Http404(f"No page {page}")
+    return content_cache.cached_http_response(
+        request,
+        sitemap.version_scopes(page),
+        partial(sitemap_views.sitemap.__wrapped__, request, sitemaps, section),
+    )
@@ -0,0 +1,138 @@
+"""
+Set-based tag resolution: turn a list of tag names into Tag instances,
+creating the missing ones, in at most three queries. Relies on the unique
+Tag.name, so it isn't used for ToolTag (whose names aren't unique).
+
+Hot names are kept in a small in-process LRU of name -> id. Saving or
+deleting a tag (see signals.py) drops its entries in this process and bumps
+the "tag_names" content version, which makes every other process (web and
+Celery workers) drop its whole cache on its next lookup. Entries also expire
+after TAG_CACHE_TTL seconds. While the version can't be read, the cache is
+bypassed.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from apps.content.models import Tag
+from redis import RedisError
+
+logger = logging.getLogger(__name__)
+
+TAG_CACHE_SIZE = 1024
+TAG_CACHE_TTL = 300
+TAG_NAMES_SCOPE = "tag_names"
+
+_cache = OrderedDict()  # name -> (id, expires_at)
+_cache_version = None  # TAG_NAMES_SCOPE version the entries were cached under
+_lock = threading.Lock()
+
+
+def _content_cache():
+    # Imported lazily so loading the app doesn't pull in the Redis services
+    from apps.content.services.content_cache import content_cache
+
+    return content_cache
+
+
+def normalize_tag_names(names):
+    """Strip and lowercase `names`, dropping blanks and duplicates (order kept)."""
+    cleaned = (name.strip().lower() for name in names)
+    return list(dict.fromkeys(name for name in cleaned if name))
+
+
+def _check_version():
+    """
+    Drop the cache if a tag was renamed or deleted by any process since it
+    was filled. Returns whether the cache can be trusted.
+    """
+    global _cache_version
+    try:
+        version = _content_cache().get_version(TAG_NAMES_SCOPE)
+    except RedisError as e:
+        logger.error(f"Tag cache version unavailable: {e}")
+        return False
+    with _lock:
+        if version != _cache_version:
+            _cache.clear()
+            _cache_version = version
+    return True
+
+
+def _cache_get(names):
+    if not _check_version():
+        return {}
+    now = time.monotonic()
+    found = {}
+    with _lock:
+        for name in names:
+            entry = _cache.get(name)
+            if entry is None:
+                continue
+            if entry[1] < now:
+                del _cache[name]
+                continue
+            _cache.move_to_end(name)
+            found[name] = entry[0]
+    return found
+
+
+def _cache_set(ids):
+    expires_at = time.monotonic() + TAG_CACHE_TTL
+    with _lock:
+        for name, tag_id in ids.items():
+            _cache[name] = (tag_id, expires_at)
+            _cache.move_to_end(name)
+        while len(_cache) > TAG_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def forget_tag(tag):
+    """Drop every cached name that points at `tag` (after a rename/delete)."""
+    with _lock:
+        for name in [name for name, entry in _cache.items() if entry[0] == tag.pk]:
+            del _cache[name]
+    # Other processes can't be reached directly, they compare versions
+    _content_cache().bump(TAG_NAMES_SCOPE)
+
+
+def clear_tag_cache():
+    with _lock:
+        _cache.clear()
+
+
+def resolve_tags(names, return_created=False):
+    """
+    Return the tags named `names` (normalized, in order), creating missing
+    ones with a single bulk insert. Concurrent creators are tolerated: names
+    that already exist are skipped by the insert and picked up by a re-read.
+
+    With `return_created`, returns (tags, names that had to be inserted).
+    """
+    names = normalize_tag_names(names)
+
+    ids = _cache_get(names)
+    missing = [name for name in names if name not in ids]
+    created = []
+    if missing:
+        found = dict(Tag.objects.filter(name__in=missing).values_list("name", "pk"))
+        new = [name for name in missing if name not in found]
+        if new:
+            Tag.objects.bulk_create(
+                [Tag(name=name) for name in new], ignore_conflicts=True
+            )
+            rows = Tag.objects.filter(name__in=new).values_list("name", "pk")
+            created_ids = dict(rows)
+            found.update(created_ids)
+            created = [name for name in new if name in created_ids]
+        _cache_set(found)
+        ids.update(found)
+
+    # Build instances from (id, name) so cache hits need no query at all
+    db = Tag.objects.db
+    tags = [Tag.from_db(db, ["id", "name"], [ids[name], name]) for name in names]
+    if return_created:
+        return tags, created
+    return tags
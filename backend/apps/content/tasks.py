@@ -1,10 +1,34 @@
+import logging
+import uuid
+from collections import Counter
 from datetime import timedelta
 
-from apps.content.models import Article, ArticleStatusChoices
+from apps.analytics.models import UserActivity
+from apps.content.models import (
+    Article,
+    ArticleReaction,
+    ArticleStatusChoices,
+    Category,
+    Comment,
+    CommentLike,
+    SavedArticle,
+    Tag,
+    ToolTag,
+)
 from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncHour
 from django.utils import timezone
 
-from . import notification_service
+from . import notification_service, related
+from .services import comment_like_service, trending_service
+from .services.ai_service import SummaryPendingError, groq_service
+from .services.content_cache import content_cache
+from .services.trending import TrendingService
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
@@ -105,3 +129,288 @@ def handle_editor_inactivity():
     ).select_related("assigned_editor")
     for article in articles_to_escalate:
         notification_service.send_manager_escalation_for_stale_publication(article)
+
+
+@shared_task
+def reconcile_reaction_counts(batch_size=500):
+    """
+    Recompute the denormalized reaction counters on Article from ArticleReaction.
+    Processes articles in batches and only writes rows whose counters drifted.
+    """
+    counter_fields = list(ArticleReaction.COUNTER_FIELDS.values())
+    fields = counter_fields + ["total_reaction_count"]
+    article_ids = Article.objects.order_by("pk").values_list("pk", flat=True)
+
+    fixed = 0
+    last_pk = None
+    while True:
+        batch_qs = article_ids
+        if last_pk is not None:
+            batch_qs = batch_qs.filter(pk__gt=last_pk)
+        batch_ids = list(batch_qs[:batch_size])
+        if not batch_ids:
+            break
+        last_pk = batch_ids[-1]
+
+        expected = {pk: dict.fromkeys(fields, 0) for pk in batch_ids}
+        rows = (
+            ArticleReaction.objects.filter(article_id__in=batch_ids)
+            .values("article_id", "reaction_type")
+            .annotate(count=Count("id"))
+        )
+        for row in rows:
+            field = ArticleReaction.COUNTER_FIELDS.get(row["reaction_type"])
+            if field is None:
+                continue
+            expected[row["article_id"]][field] = row["count"]
+            expected[row["article_id"]]["total_reaction_count"] += row["count"]
+
+        to_update = []
+        batch = Article.objects.filter(pk__in=batch_ids).only("pk", "slug", *fields)
+        for article in batch:
+            counts = expected[article.pk]
+            if any(getattr(article, field) != counts[field] for field in fields):
+                for field in fields:
+                    setattr(article, field, counts[field])
+                to_update.append(article)
+
+        if to_update:
+            Article.objects.bulk_update(to_update, fields)
+            fixed += len(to_update)
+            for article in to_update:
+                content_cache.invalidate_article(article)
+
+    logger.info(f"Reaction counter reconciliation completed: {fixed} articles fixed")
+    return fixed
+
+
+@shared_task
+def sync_comment_likes(batch_size=500):
+    """
+    Write comment likes behind from Redis to CommentLike and
+    Comment.like_count, for comments whose likes changed since the last run.
+    """
+    synced = 0
+    while True:
+        comment_ids = comment_like_service.pop_dirty_comment_ids(batch_size)
+        if not comment_ids:
+            break
+        try:
+            persist_comment_likes(comment_like_service.get_bulk_likers(comment_ids))
+        except Exception:
+            # Queue them again so the next run retries
+            comment_like_service.mark_dirty(comment_ids)
+            raise
+        synced += len(comment_ids)
+
+    logger.info(f"Comment like sync completed: {synced} comments persisted")
+    return synced
+
+
+def persist_comment_likes(likers):
+    """
+    Make the stored likes of each comment match `likers` (comment id -> ids
+    of users who like it, as read from Redis). Deleted comments and users are
+    skipped.
+    """
+    likers = {
+        uuid.UUID(comment_id): {uuid.UUID(user_id) for user_id in user_ids}
+        for comment_id, user_ids in likers.items()
+    }
+    comment_ids = set(
+        Comment.objects.filter(pk__in=likers).values_list("pk", flat=True)
+    )
+    user_ids = set().union(*(likers[comment_id] for comment_id in comment_ids))
+    existing_users = set(
+        get_user_model().objects.filter(pk__in=user_ids).values_list("pk", flat=True)
+    )
+    wanted = {
+        (comment_id, user_id)
+        for comment_id in comment_ids
+        for user_id in likers[comment_id]
+        if user_id in existing_users
+    }
+
+    with transaction.atomic():
+        stored, stale_ids = set(), []
+        rows = CommentLike.objects.filter(comment_id__in=comment_ids).values_list(
+            "pk", "comment_id", "user_id"
+        )
+        for pk, comment_id, user_id in rows:
+            if (comment_id, user_id) in wanted:
+                stored.add((comment_id, user_id))
+            else:
+                stale_ids.append(pk)
+
+        CommentLike.objects.filter(pk__in=stale_ids).delete()
+        CommentLike.objects.bulk_create(
+            [
+                CommentLike(comment_id=comment_id, user_id=user_id)
+                for comment_id, user_id in wanted - stored
+            ],
+            ignore_conflicts=True,
+        )
+
+        counts = Counter(comment_id for comment_id, _ in wanted)
+        Comment.objects.bulk_update(
+            [
+                Comment(pk=comment_id, like_count=counts[comment_id])
+                for comment_id in comment_ids
+            ],
+            ["like_count"],
+        )
+
+
+@shared_task
+def recompute_content_counts():
+    """
+    Recompute the denormalized category, tag and tool tag counters from their
+    source tables. They are kept up to date on every change (see signals.py),
+    so this only repairs drift, e.g. after bulk updates that skip signals.
+    """
+    updated = {
+        model.__name__: model.refresh_counts() for model in (Category, Tag, ToolTag)
+    }
+    logger.info(f"Recomputed content counts: {updated}")
+    return updated
+
+
+@shared_task
+def refresh_related_articles(article_id):
+    """
+    Update the related-articles index after an article was published,
+    unpublished, retagged or moved to another category.
+    """
+    related.refresh_article(article_id)
+
+
+@shared_task
+def backfill_related_articles(article_ids):
+    """Rebuild the related-articles lists that showed a deleted article."""
+    related.forget_article(article_ids)
+
+
+@shared_task
+def rebuild_related_articles(batch_size=500):
+    """
+    Rebuild every related-articles list from scratch. Incremental updates
+    keep lists that an article fell out of approximate; this resets them.
+    """
+    rebuilt = related.rebuild_all(batch_size=batch_size)
+    logger.info(f"Rebuilt related articles for {rebuilt} articles")
+    return rebuilt
+
+
+@shared_task
+def decay_trending_articles():
+    """
+    Fade the trending scores by the time elapsed since the last run, then
+    let cached trending lists pick up the new ranking.
+    """
+    factor = trending_service.decay()
+    content_cache.bump(TrendingService.SCOPE)
+    return factor
+
+
+def compute_trending_scores(now=None, half_lives=7):
+    """
+    Recompute the trending scores ({article id: score}) of published articles
+    from the engagement of the last `half_lives` half-lives. Events are
+    counted per hour, so this scans raw events once, not per article.
+    """
+    now = now or timezone.now()
+    since = now - timedelta(seconds=TrendingService.HALF_LIFE * half_lives)
+    weights = TrendingService.WEIGHTS
+
+    rows = []
+    for event, model in (
+        ("reaction", ArticleReaction),
+        ("comment", Comment),
+        ("save", SavedArticle),
+    ):
+        queryset = (
+            model.objects.filter(created_at__gte=since)
+            .values("article_id", hour=TruncHour("created_at"))
+            .annotate(count=Count("id"))
+            .order_by()
+            .values_list("article_id", "hour", "count")
+        )
+        rows.extend((pk, event, hour, count) for pk, hour, count in queryset)
+
+    activities = (
+        UserActivity.objects.filter(
+            event_type__in=list(TrendingService.ACTIVITY_EVENTS),
+            metadata__content_type="article",
+            timestamp__gte=since,
+        )
+        .values("metadata__content_id", "event_type", hour=TruncHour("timestamp"))
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("metadata__content_id", "event_type", "hour", "count")
+    )
+    rows.extend(
+        (content_id, TrendingService.ACTIVITY_EVENTS[event_type], hour, count)
+        for content_id, event_type, hour, count in activities
+    )
+
+    scores = Counter()
+    for article_id, event, hour, count in rows:
+        try:
+            article_id = str(uuid.UUID(str(article_id)))
+        except ValueError:
+            continue  # analytics metadata comes from clients
+        age = (now - hour).total_seconds()
+        decay = 0.5 ** (max(age, 0) / TrendingService.HALF_LIFE)
+        scores[article_id] += weights[event] * count * decay
+
+    published = {
+        str(pk)
+        for pk in Article.published.filter(pk__in=list(scores)).values_list(
+            "pk", flat=True
+        )
+    }
+    return {
+        article_id: score
+        for article_id, score in scores.most_common()
+        if article_id in published and score >= TrendingService.MIN_SCORE
+    }
+
+
+@shared_task
+def rebuild_trending_articles():
+    """
+    Rebuild the trending ranking from the database, e.g. after Redis lost
+    its data. Day to day it is maintained incrementally (see signals.py).
+    """
+    now = timezone.now()
+    scores = compute_trending_scores(now)
+    scores = dict(list(scores.items())[: TrendingService.MAX_SIZE])
+    trending_service.restore(scores, now.timestamp())
+    content_cache.bump(TrendingService.SCOPE)
+    logger.info(f"Rebuilt trending scores for {len(scores)} articles")
+    return len(scores)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def pregenerate_article_summary(self, article_id):
+    """
+    Generate the AI summary of a newly published article before readers ask
+    for it, so ArticleSummaryView is served from the cache. Returns whether
+    a summary was generated.
+    """
+    try:
+        article = Article.published.only("id", "title", "content").get(id=article_id)
+    except Article.DoesNotExist:
+        return False
+    if len(article.content.strip()) < 100:  # too short for ArticleSummaryView
+        return False
+
+    try:
+        result = groq_service.generate_summary(
+            article_id=str(article.id), title=article.title, content=article.content
+        )
+    except (ValueError, SummaryPendingError):
+        return False  # too short, or a reader's request is generating it
+    except Exception as e:
+        raise self.retry(exc=e)
+    return not result["cached"]
@@ -3,6 +3,7 @@ import uuid
 from apps.common.errors import ErrorCode
 from apps.common.utils import TestUtil
 from apps.content.models import Article, ArticleReaction, ArticleStatusChoices, Category
+from apps.content.tasks import reconcile_reaction_counts
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -273,5 +274,60 @@ class TestArticleReactions(APITestCase):
         response_data = response.json()["data"]
         self.assertEqual(response_data["action"], "added")
 
+    def test_toggle_reaction_updates_article_counters(self):
+        """Test that toggling keeps the denormalized counters on Article in sync"""
+        self.client.force_authenticate(user=self.user2)
+
+        self.client.post(self.pub_url, {"reaction_type": "❤️"})
+        self.client.post(self.pub_url, {"reaction_type": "🔥"})
+
+        self.published_article.refresh_from_db()
+        self.assertEqual(self.published_article.heart_count, 1)
+        self.assertEqual(self.published_article.fire_count, 1)
+        self.assertEqual(self.published_article.total_reaction_count, 2)
+
+        self.client.post(self.pub_url, {"reaction_type": "❤️"})
+
+        self.published_article.refresh_from_db()
+        self.assertEqual(self.published_article.heart_count, 0)
+        self.assertEqual(self.published_article.total_reaction_count, 1)
+        self.assertEqual(self.published_article.reaction_counts, {"🔥": 1})
+
+    def test_reconcile_reaction_counts_fixes_drift(self):
+        """Test that the reconciliation task recomputes counters from reactions"""
+        ArticleReaction.objects.create(
+            article=self.published_article, user=self.user2, reaction_type="❤️"
+        )
+        ArticleReaction.objects.create(
+            article=self.published_article, user=self.user3, reaction_type="👍"
+        )
+        Article.objects.filter(pk=self.draft_article.pk).update(
+            fire_count=4, total_reaction_count=4
+        )
+
+        fixed = reconcile_reaction_counts(batch_size=1)
+
+        self.assertEqual(fixed, 2)
+        self.published_article.refresh_from_db()
+        self.draft_article.refresh_from_db()
+        self.assertEqual(
+            self.published_article.reaction_counts, {"❤️": 1, "👍": 1}
+        )
+        self.assertEqual(self.published_article.total_reaction_count, 2)
+        self.assertEqual(self.draft_article.fire_count, 0)
+        self.assertEqual(self.draft_article.total_reaction_count, 0)
+
+    def test_article_list_uses_reaction_counters(self):
+        """Test that the article list reads counters instead of aggregating"""
+        self.client.force_authenticate(user=self.user2)
+        self.client.post(self.pub_url, {"reaction_type": "😍"})
+
+        response = self.client.get("/api/v1/articles/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        article_data = response.json()["data"]["results"][0]
+        self.assertEqual(article_data["reaction_counts"], {"😍": 1})
+        self.assertEqual(article_data["total_reaction_counts"], 1)
+
 
 # python manage.py test apps.content.tests.test_article_reactions
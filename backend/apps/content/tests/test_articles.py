@@ -1,19 +1,44 @@
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
 
 from apps.accounts.models import ContributorOnboarding
 from apps.accounts.utils import UserRoles
 from apps.common.errors import ErrorCode
+from apps.common.pagination import KeysetPagination
 from apps.common.utils import TestUtil
+from apps.content import related, search, tags
+from apps.content.excerpts import make_excerpt
 from apps.content.models import (
     Article,
     ArticleStatusChoices,
+    ArticleSummary,
     Category,
     Comment,
+    CommentMention,
     CommentThread,
+    RelatedArticle,
+    SavedArticle,
     Tag,
+    ToolTag,
 )
+from apps.content.serializers import process_tags
+from apps.content.sitemaps import ArticleSitemap
+from apps.content.services import comment_like_service
+from apps.content.services.ai_service import groq_service
+from apps.content.services.content_cache import content_cache
+from apps.content.services.tag_index import tag_index
+from apps.content.services.trending import trending_service
+from apps.content.tasks import compute_trending_scores, pregenerate_article_summary
+from apps.content.utils import ReadabilityMetrics
 from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.db import connection
 from django.db.models import F
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from redis import RedisError
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -160,6 +185,363 @@ class TestArticles(APITestCase):
         self.assertIn("Published Article 2", article_titles)
         self.assertNotIn("Draft Article", article_titles)
 
+    def test_article_list_is_saved_resolved_per_page(self):
+        """Test is_saved is resolved for the whole page with a single query"""
+        SavedArticle.objects.create(user=self.user1, article=self.published_article1)
+        self.client.force_authenticate(user=self.user1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.articles_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        is_saved = {
+            article["title"]: article["is_saved"]
+            for article in response.json()["data"]["results"]
+        }
+        self.assertTrue(is_saved["Published Article 1"])
+        self.assertFalse(is_saved["Published Article 2"])
+
+        saved_queries = [
+            q for q in ctx.captured_queries if SavedArticle._meta.db_table in q["sql"]
+        ]
+        self.assertEqual(len(saved_queries), 1)
+
+    def test_article_list_serves_stored_excerpt(self):
+        """Test lists serve the excerpt stored on save and never load content"""
+        self.published_article1.content = (
+            "<p>Intro &amp; more</p><p>" + "word " * 100 + "</p>"
+            '<img src="https://cdn.example.com/a.png">'
+        )
+        self.published_article1.save()
+        self.published_article1.refresh_from_db()
+        excerpt = self.published_article1.excerpt
+        self.assertTrue(excerpt.startswith("Intro & more word word"))
+        self.assertTrue(excerpt.endswith("..."))
+        self.assertLessEqual(len(excerpt), 200)
+        self.assertEqual(
+            self.published_article1.first_image_url, "https://cdn.example.com/a.png"
+        )
+        # Escaped text (code, comparisons) is kept, only real markup is stripped
+        self.assertEqual(
+            make_excerpt("<p>if a&lt;b, use Vec&lt;u8&gt;</p><p>c</p>"),
+            "if a<b, use Vec<u8> c",
+        )
+
+        self.client.force_authenticate(user=self.user1)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.articles_url)
+        contents = {
+            article["id"]: article["content"]
+            for article in response.json()["data"]["results"]
+        }
+        self.assertEqual(contents[str(self.published_article1.id)], excerpt)
+        self.assertFalse(
+            any('"content_article"."content"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_article_list_trending(self):
+        """Test ordering=trending ranks articles by decayed engagement"""
+        trending_service.clear()
+        self.addCleanup(trending_service.clear)
+        self.client.force_authenticate(user=self.user1)
+
+        SavedArticle.objects.create(user=self.user1, article=self.published_article2)
+        trending_service.record(self.published_article1.id, "view")
+        trending_service.record_activity(
+            "share",
+            {"content_type": "article", "content_id": str(self.draft_article.id)},
+        )
+        response = self.client.get(self.articles_url, {"ordering": "trending"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Drafts aren't ranked, unranked articles aren't listed
+        self.assertEqual(
+            [article["id"] for article in response.json()["data"]["results"]],
+            [str(self.published_article2.id), str(self.published_article1.id)],
+        )
+        self.assertIsNone(
+            trending_service.redis_client.zscore(
+                trending_service.KEY, str(self.draft_article.id)
+            )
+        )
+
+        # A ranking of articles that can't be listed falls back to newest first
+        trending_service.restore({str(self.draft_article.id): 5.0})
+        response = self.client.get(self.articles_url, {"ordering": "trending"})
+        self.assertEqual(
+            [article["id"] for article in response.json()["data"]["results"]],
+            [
+                str(pk)
+                for pk in Article.published.order_by("-created_at").values_list(
+                    "id", flat=True
+                )
+            ],
+        )
+
+        # Scores halve every half-life
+        trending_service.restore({str(self.published_article1.id): 8.0}, now=0)
+        self.assertEqual(trending_service.decay(now=trending_service.HALF_LIFE), 0.5)
+        self.assertEqual(
+            trending_service.redis_client.zscore(
+                trending_service.KEY, str(self.published_article1.id)
+            ),
+            4.0,
+        )
+
+        # The ranking can be rebuilt from the database alone
+        scores = compute_trending_scores()
+        self.assertGreater(
+            scores[str(self.published_article1.id)],  # four comments
+            scores[str(self.published_article2.id)],  # one save
+        )
+        self.assertNotIn(str(self.draft_article.id), scores)
+
+    def test_article_list_cursor_pagination(self):
+        """Test cursor mode walks the feed in order without counting"""
+        expected = [
+            str(pk)
+            for pk in Article.objects.filter(
+                status=ArticleStatusChoices.PUBLISHED
+            ).order_by("-created_at", "-id").values_list("id", flat=True)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                self.articles_url, {"pagination": "cursor", "page_size": 2}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any("COUNT(" in q["sql"].upper() for q in ctx.captured_queries)
+        )
+
+        data = response.json()["data"]
+        self.assertIsNone(data["count"])
+        self.assertIsNone(data["previous"])
+        first_page = [a["id"] for a in data["results"]]
+        self.assertEqual(first_page, expected[:2])
+
+        response = self.client.get(data["next"])
+        data = response.json()["data"]
+        self.assertEqual([a["id"] for a in data["results"]], expected[2:])
+        self.assertIsNone(data["next"])
+
+        response = self.client.get(data["previous"])
+        data = response.json()["data"]
+        self.assertEqual([a["id"] for a in data["results"]], first_page)
+
+        response = self.client.get(
+            self.articles_url, {"pagination": "cursor", "include_count": "true"}
+        )
+        self.assertEqual(response.json()["data"]["count"], len(expected))
+
+        response = self.client.get(self.articles_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # Well-formed cursors with values the ordering fields can't take
+        for values in (["not-a-date", str(uuid.uuid4())], ["2024-01-01", "x"]):
+            cursor = KeysetPagination().encode_cursor(values, reverse=False)
+            response = self.client.get(self.articles_url, {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_article_responses_cached_for_anonymous_users(self):
+        """Test anonymous list/detail are cached and invalidated on changes"""
+        detail_url = (
+            f"{self.articles_url}{self.user2.username}/{self.published_article1.slug}/"
+        )
+        self.client.get(self.articles_url)
+        self.client.get(detail_url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            list_response = self.client.get(self.articles_url)
+            detail_response = self.client.get(detail_url)
+        self.assertEqual(list_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(detail_response.status_code, status.HTTP_200_OK)
+        article_queries = [
+            q for q in ctx.captured_queries if Article._meta.db_table in q["sql"]
+        ]
+        self.assertEqual(article_queries, [])
+
+        # Comments only invalidate the article's detail page
+        TestUtil.create_comment(article=self.published_article1, user=self.user3)
+        response = self.client.get(detail_url)
+        self.assertEqual(response.json()["data"]["comments_count"], 5)
+
+        # Editing a published article invalidates lists too
+        self.published_article2.title = "Renamed Article"
+        self.published_article2.save()
+        response = self.client.get(self.articles_url)
+        titles = [a["title"] for a in response.json()["data"]["results"]]
+        self.assertIn("Renamed Article", titles)
+
+        # Authenticated responses are never served from the cache
+        self.client.force_authenticate(user=self.user1)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.articles_url)
+        self.assertTrue(
+            any(Article._meta.db_table in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_article_detail_conditional_get(self):
+        """Test article detail returns 304 until the article or its comments change"""
+        detail_url = (
+            f"{self.articles_url}{self.user2.username}/{self.published_article1.slug}/"
+        )
+        response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        TestUtil.create_comment(article=self.published_article1, user=self.user3)
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        # ETags are per user since is_saved differs
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Last-Modified can't tell users apart, so it isn't sent or honoured
+        self.assertFalse(response.has_header("Last-Modified"))
+        response = self.client.get(
+            detail_url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_article_readability_metrics_persisted(self):
+        """Test readability metrics are stored on save and only refreshed on content change"""
+        article = Article.objects.get(id=self.published_article1.id)
+        self.assertEqual(article.word_count, 6)
+        self.assertGreater(article.read_time_seconds, 0)
+        self.assertIsNotNone(article.flesch_score)
+
+        # Saving other fields doesn't re-run the analysis
+        with mock.patch.object(Article, "update_readability_metrics") as mock_update:
+            article.title = "Renamed"
+            article.save()
+            mock_update.assert_not_called()
+
+        article.content = " ".join(["word"] * 600)
+        article.save(update_fields=["content"])
+        article.refresh_from_db()
+        self.assertEqual(article.word_count, 600)
+        self.assertEqual(article.read_time_seconds, article.calculate_read_time())
+
+        response = self.client.get(
+            f"{self.articles_url}{self.user2.username}/{article.slug}/"
+        )
+        self.assertEqual(
+            response.json()["data"]["read_time"], article.read_time_seconds
+        )
+
+    def test_readability_analyze_many_matches_analyze(self):
+        """Test the bulk readability path returns the same metrics as analyze()"""
+        texts = [
+            "",
+            "Short one.",
+            "<p>Simple sentence here. Another one follows! Is it readable?</p>",
+            "Intro text.\n![img](https://example.com/a.png)\n```\ncode()\n```\nOutro.",
+            " ".join(["Complicated infrastructure observability"] * 50),
+        ]
+        expected = [ReadabilityMetrics.analyze(text) for text in texts]
+
+        self.assertEqual(ReadabilityMetrics.analyze_many(texts), expected)
+        self.assertEqual(
+            ReadabilityMetrics.analyze_many(texts, workers=2, chunksize=1), expected
+        )
+
+    def test_backfill_readability_command(self):
+        """Test the backfill command recomputes metrics for existing rows"""
+        Article.objects.update(read_time_seconds=0, flesch_score=None, word_count=0)
+
+        call_command("backfill_readability", batch_size=2, stdout=StringIO())
+
+        article = Article.objects.get(id=self.published_article2.id)
+        self.assertEqual(article.word_count, 4)
+        self.assertEqual(article.read_time_seconds, article.calculate_read_time())
+        self.assertFalse(Article.objects.filter(word_count=0).exists())
+
+    def test_article_search_ranked(self):
+        """Test search matches title, tags and stripped body, ranked by field"""
+        title_match = Article.objects.create(
+            title="Kubernetes in production",
+            content="<p>Notes from running clusters.</p>",
+            author=self.user2,
+            status=ArticleStatusChoices.PUBLISHED,
+        )
+        body_match = Article.objects.create(
+            title="Weekly roundup",
+            content="<p>We also looked at <strong>kubernetes</strong> operators.</p>",
+            author=self.user3,
+            status=ArticleStatusChoices.PUBLISHED,
+        )
+        # Drafts that never were published don't touch the index
+        with mock.patch.object(search, "remove_article") as remove_article:
+            draft = Article.objects.create(
+                title="Kubernetes draft",
+                content="Not public yet",
+                author=self.user2,
+                status=ArticleStatusChoices.DRAFT,
+            )
+            draft.content = "Still not public"
+            draft.save()
+        remove_article.assert_not_called()
+
+        response = self.client.get(self.articles_url, {"search": "kubernetes"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [a["id"] for a in response.json()["data"]["results"]]
+        self.assertEqual(ids, [str(title_match.id), str(body_match.id)])
+
+        # Cursor mode can't seek by relevance, so search keeps page numbers
+        response = self.client.get(
+            self.articles_url, {"search": "kubernetes", "pagination": "cursor"}
+        )
+        ids = [a["id"] for a in response.json()["data"]["results"]]
+        self.assertEqual(ids, [str(title_match.id), str(body_match.id)])
+
+        # Filters apply before the cap on ranked matches
+        with mock.patch.object(search, "FTS_MAX_RESULTS", 1):
+            response = self.client.get(
+                self.articles_url,
+                {"search": "kubernetes", "author__username": self.user3.username},
+            )
+        ids = [a["id"] for a in response.json()["data"]["results"]]
+        self.assertEqual(ids, [str(body_match.id)])
+
+        # Tags are indexed, and changing them updates the index
+        response = self.client.get(self.articles_url, {"search": "python"})
+        ids = [a["id"] for a in response.json()["data"]["results"]]
+        self.assertEqual(ids, [str(self.published_article1.id)])
+
+        self.published_article1.tags.remove(self.tag1)
+        response = self.client.get(self.articles_url, {"search": "python"})
+        self.assertEqual(response.json()["data"]["results"], [])
+
+        # Markup is not searchable, and unpublishing removes from the index
+        response = self.client.get(self.articles_url, {"search": "strong"})
+        self.assertEqual(response.json()["data"]["results"], [])
+
+        body_match.status = ArticleStatusChoices.DRAFT
+        body_match.save(update_fields=["status"])
+        response = self.client.get(self.articles_url, {"search": "kubernetes"})
+        ids = [a["id"] for a in response.json()["data"]["results"]]
+        self.assertEqual(ids, [str(title_match.id)])
+
+    def test_rebuild_search_index_command(self):
+        """Test the rebuild command indexes existing published articles"""
+        search.clear_index()
+        response = self.client.get(self.articles_url, {"search": "published"})
+        self.assertEqual(response.json()["data"]["results"], [])
+
+        call_command("rebuild_search_index", batch_size=1, stdout=StringIO())
+
+        response = self.client.get(self.articles_url, {"search": "published"})
+        ids = {a["id"] for a in response.json()["data"]["results"]}
+        self.assertEqual(
+            ids, {str(self.published_article1.id), str(self.published_article2.id)}
+        )
+
     def test_article_detail(self):
         """Test article detail endpoint returns published article details"""
         # Test successful retrieval of published article
@@ -197,6 +579,44 @@ class TestArticles(APITestCase):
         invalid_user_response = self.client.get(invalid_user_url)
         self.assertEqual(invalid_user_response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_article_root_comments_paginated(self):
+        """Test article detail embeds the first page of root comments only"""
+        for i in range(11):
+            comment = Comment.objects.create(
+                article=self.published_article1, user=self.user3, body=f"Root {i}"
+            )
+            comment.thread = CommentThread.objects.create(
+                article=self.published_article1, root_comment=comment
+            )
+            comment.save()
+        self.assertTrue(Comment.objects.get(id=comment.id).is_root)
+
+        detail_url = (
+            f"{self.articles_url}{self.user2.username}/{self.published_article1.slug}/"
+        )
+        data = self.client.get(detail_url).json()["data"]
+        self.assertEqual(len(data["comments"]), 10)
+        self.assertEqual(data["comments"][0]["body"], "Root 10")
+        self.assertIsNotNone(data["comments_next_cursor"])
+        self.assertEqual(data["comments_count"], 15)
+
+        comments_url = f"{self.articles_url}{self.published_article1.id}/comments/"
+        response = self.client.get(
+            comments_url, {"cursor": data["comments_next_cursor"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page = response.json()["data"]
+        # The remaining root: the setUp thread's root comment (replies excluded)
+        self.assertEqual(
+            [c["id"] for c in page["results"]], [str(self.root_comment.id)]
+        )
+        self.assertIsNone(page["next"])
+
+        response = self.client.get(
+            f"{self.articles_url}{self.draft_article.id}/comments/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_tag_list(self):
         """Test tag list endpoint returns all tags"""
 
@@ -228,6 +648,315 @@ class TestArticles(APITestCase):
             len(invalid_limit_data), 3
         )  # Should return all tags since we have only 3
 
+    def test_article_feeds_cached_with_validators(self):
+        """Test RSS feeds are cached per content version and answer 304s"""
+        feed_url = "/api/v1/articles/feed/"
+        response = self.client.get(feed_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "Published Article 1")
+        self.assertNotContains(response, "Draft Article")
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        # Pollers revalidate, and repeat fetches reuse the rendered XML
+        with self.assertNumQueries(0):
+            response = self.client.get(feed_url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            response = self.client.get(feed_url)
+            self.assertContains(response, "Published Article 1")
+
+        self.published_article1.title = "Renamed Article"
+        self.published_article1.save()
+        response = self.client.get(feed_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "Renamed Article")
+
+        response = self.client.get(f"/api/v1/tags/{self.tag1.name}/feed/")
+        self.assertContains(response, "Renamed Article")
+        self.assertNotContains(response, "Published Article 2")
+
+        response = self.client.get(f"/api/v1/categories/{self.category.slug}/feed/")
+        self.assertContains(response, "Published Article 2")
+        self.assertNotContains(response, "Draft Article")
+
+        response = self.client.get("/api/v1/tags/missing/feed/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_sitemap_index_and_cached_chunks(self):
+        """Test the sitemap is split into chunks, each cached until it changes"""
+        with mock.patch.object(ArticleSitemap, "limit", 1):
+            response = self.client.get("/sitemap.xml")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertContains(response, "sitemap-articles.xml?p=3")
+            self.assertContains(response, "sitemap-jobs.xml")
+
+            # self.article is the oldest published article: first chunk
+            first = self.client.get("/sitemap-articles.xml", {"p": 1})
+            self.assertContains(first, self.article.slug)
+            self.client.get("/sitemap-articles.xml", {"p": 2})
+            with self.assertNumQueries(0):
+                self.client.get("/sitemap-articles.xml", {"p": 1})
+                self.client.get("/sitemap-articles.xml", {"p": 2})
+
+            self.article.title = "A Renamed Article"
+            self.article.save()
+            response = self.client.get("/sitemap-articles.xml", {"p": 1})
+            self.assertContains(response, self.article.slug)
+            self.assertNotEqual(response["ETag"], first["ETag"])
+            # Other chunks stay cached, and finding an edited article's chunk
+            # doesn't query until articles are published or removed
+            with self.assertNumQueries(0):
+                self.client.get("/sitemap-articles.xml", {"p": 2})
+                self.assertEqual(ArticleSitemap().page_for(self.article), 1)
+                self.assertEqual(
+                    ArticleSitemap().page_for(self.published_article2), 3
+                )
+
+            for page in (4, 0, "x"):
+                response = self.client.get("/sitemap-articles.xml", {"p": page})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_related_articles(self):
+        """Test related articles are read from the precomputed neighbour lists"""
+        article3 = Article.objects.create(
+            title="Published Article 3",
+            content="Yet another published article content",
+            author=self.user3,
+            status=ArticleStatusChoices.PUBLISHED,
+        )
+        article3.tags.set([self.tag1, self.tag2])
+        self.assertEqual(related.rebuild_all(), 4)
+
+        url = f"{self.articles_url}{self.published_article1.id}/related/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Identical tags outrank a shared category with a partial tag overlap
+        self.assertEqual(
+            [item["id"] for item in response.json()["data"]],
+            [str(article3.id), str(self.published_article2.id)],
+        )
+        response = self.client.get(url, {"limit": 1})
+        self.assertEqual(len(response.json()["data"]), 1)
+
+        # Unpublishing drops the article from every other list
+        article3.status = ArticleStatusChoices.DRAFT
+        article3.save()
+        related.refresh_article(article3.id)
+        response = self.client.get(url)
+        self.assertEqual(
+            [item["id"] for item in response.json()["data"]],
+            [str(self.published_article2.id)],
+        )
+        self.assertFalse(RelatedArticle.objects.filter(article=article3).exists())
+
+        response = self.client.get(
+            f"{self.articles_url}{self.draft_article.id}/related/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tag_autocomplete(self):
+        """Test tag typeahead ranks prefix matches by usage from memory"""
+        tag_index.reset()
+        Tag.objects.create(name="pytest")
+        ToolTag.objects.create(name="Pydantic")
+        url = f"{self.tags_url}autocomplete/"
+
+        response = self.client.get(url, {"q": "Py"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual([tag["name"] for tag in data], ["python", "pytest"])
+        self.assertEqual(
+            data[0], {"id": str(self.tag1.id), "name": "python", "usage": 1}
+        )
+
+        # Empty prefix returns the most used tags; the index is already built
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"limit": 1})
+        self.assertEqual(response.json()["data"][0]["name"], "django")
+
+        response = self.client.get(url, {"q": "pyd", "kind": "tool"})
+        self.assertEqual([tag["name"] for tag in response.json()["data"]], ["Pydantic"])
+
+        # Tag changes bump the index version, picked up on the next check
+        with mock.patch.object(tag_index, "CHECK_INTERVAL", 0):
+            Tag.objects.create(name="pyramid")
+            response = self.client.get(url, {"q": "pyr"})
+        self.assertEqual([tag["name"] for tag in response.json()["data"]], ["pyramid"])
+
+    def test_process_tags_resolves_in_bulk(self):
+        """Test tag names are resolved with one lookup, one insert and a re-read"""
+        tags.clear_tag_cache()
+        names = [" Python ", "rust", "django", "RUST", "", "go"]
+
+        with CaptureQueriesContext(connection) as queries:
+            resolved = process_tags(names)
+        self.assertLessEqual(len(queries), 3)
+        self.assertEqual(
+            [tag.name for tag in resolved], ["python", "rust", "django", "go"]
+        )
+        self.assertEqual(resolved[0].id, self.tag1.id)
+        self.assertEqual(resolved[2].id, self.tag2.id)
+        self.assertTrue(Tag.objects.filter(name="rust").exists())
+
+        # Hot names come from the in-process cache
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [tag.id for tag in process_tags(["python", "go"])],
+                [self.tag1.id, resolved[3].id],
+            )
+
+        # A rename drops the stale name -> id entry
+        self.tag1.name = "python3"
+        self.tag1.save()
+        new_python = process_tags(["python"])[0]
+        self.assertNotEqual(new_python.id, self.tag1.id)
+        self.assertEqual(Tag.objects.filter(name__startswith="python").count(), 2)
+
+        # So does a rename in another process, through the shared version
+        Tag.objects.filter(pk=resolved[3].id).update(name="golang")
+        content_cache.bump(tags.TAG_NAMES_SCOPE)
+        self.assertNotEqual(process_tags(["go"])[0].id, resolved[3].id)
+
+    @override_settings(GROQ_FAKE_CLIENT=True)
+    def test_article_summary_single_flight(self):
+        """Test concurrent summary requests share one generation"""
+        groq_service.reset()
+        self.addCleanup(groq_service.reset)
+        content = "<p>" + "Django makes building web APIs fast. " * 10 + "</p>"
+        content_hash = groq_service._content_hash(groq_service._clean_content(content))
+        for article in (self.published_article1, self.published_article2):
+            key = groq_service._get_cache_key(str(article.id), content_hash)
+            groq_service.cache.delete(key)
+            self.addCleanup(groq_service.cache.delete, key)
+
+        groq_service.client.latency = 0.5
+        article_id = str(self.published_article1.id)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: groq_service.generate_summary(article_id, "DRF", content),
+                    range(4),
+                )
+            )
+        self.assertEqual(groq_service.client.calls, 1)
+        self.assertEqual(len({result["summary"] for result in results}), 1)
+        self.assertEqual(
+            sorted(result["cached"] for result in results), [False, True, True, True]
+        )
+
+        # Publishing pre-generates the summary, so readers hit the cache
+        groq_service.client.latency = 0
+        self.published_article2.content = content
+        self.published_article2.save()
+        self.assertTrue(pregenerate_article_summary(str(self.published_article2.id)))
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.post(
+            f"{self.articles_url}{self.published_article2.id}/summarize/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["data"]["cached"])
+        self.assertEqual(groq_service.client.calls, 2)
+
+    @override_settings(GROQ_FAKE_CLIENT=True)
+    def test_article_summary_keyed_by_content(self):
+        """Test summaries survive cache loss and are regenerated only on edits"""
+        groq_service.reset()
+        self.addCleanup(groq_service.reset)
+        article_id = str(self.published_article1.id)
+        original = "<p>" + "Django makes building web APIs fast. " * 10 + "</p>"
+        edited = "<p>" + "Django REST framework adds serializers. " * 10 + "</p>"
+        keys = []
+        for content in (original, edited):
+            clean_content = groq_service._clean_content(content)
+            keys.append(
+                groq_service._get_cache_key(
+                    article_id, groq_service._content_hash(clean_content)
+                )
+            )
+        groq_service.cache.delete_many(keys)
+        self.addCleanup(groq_service.cache.delete_many, keys)
+
+        first = groq_service.generate_summary(article_id, "DRF", original)
+        self.assertFalse(first["cached"])
+        stored = ArticleSummary.objects.get(article=self.published_article1)
+        self.assertEqual(stored.summary, first["summary"])
+        self.assertEqual(stored.model, groq_service.model)
+
+        # Losing the cache (expiry, flush) falls back to the stored summary
+        groq_service.cache.delete(keys[0])
+        restored = groq_service.generate_summary(article_id, "DRF", original)
+        self.assertTrue(restored["cached"])
+        self.assertEqual(restored["summary"], first["summary"])
+        self.assertIsNotNone(groq_service.cache.get(keys[0]))
+        self.assertEqual(groq_service.client.calls, 1)
+
+        # Markup-only changes clean to the same content
+        reformatted = original.replace("<p>", "<p class='lead'>")
+        self.assertTrue(
+            groq_service.generate_summary(article_id, "DRF", reformatted)["cached"]
+        )
+
+        # Editing the content regenerates and replaces the stored summary
+        regenerated = groq_service.generate_summary(article_id, "DRF", edited)
+        self.assertFalse(regenerated["cached"])
+        self.assertEqual(groq_service.client.calls, 2)
+        self.assertNotEqual(regenerated["summary"], first["summary"])
+        stored.refresh_from_db()
+        self.assertEqual(stored.summary, regenerated["summary"])
+        self.assertEqual(ArticleSummary.objects.count(), 1)
+
+    def test_article_top_comments(self):
+        """Test ordering=top ranks root comments by likes, then recency"""
+        roots = []
+        for i in range(3):
+            comment = Comment.objects.create(
+                article=self.published_article1, user=self.user3, body=f"Root {i}"
+            )
+            CommentThread.objects.create(
+                article=self.published_article1, root_comment=comment
+            )
+            roots.append(comment)
+
+        for user in (self.user1, self.user2):
+            self.client.force_authenticate(user=user)
+            self.client.post(f"/api/v1/comments/{roots[0].id}/like/")
+        self.client.post(f"/api/v1/comments/{self.root_comment.id}/like/")
+        self.client.post(f"/api/v1/comments/{roots[1].id}/like/")
+        # Replies are never ranked
+        reply = Comment.objects.get(thread=self.thread, body="First reply")
+        self.client.post(f"/api/v1/comments/{reply.id}/like/")
+
+        url = f"{self.articles_url}{self.published_article1.id}/comments/"
+        response = self.client.get(url, {"ordering": "top", "page_size": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["data"]["results"]
+        # roots[1] and self.root_comment tie, the newer one comes first
+        self.assertEqual(
+            [c["id"] for c in results],
+            [str(roots[0].id), str(roots[1].id), str(self.root_comment.id)],
+        )
+        self.assertEqual(results[0]["like_count"], 2)
+
+        # Deleted comments leave the ranking
+        with self.captureOnCommitCallbacks(execute=True):
+            roots[0].delete()
+        self.assertNotIn(
+            str(roots[0].id),
+            dict(comment_like_service.get_top_comments(self.published_article1.id, 3)),
+        )
+        response = self.client.get(url, {"ordering": "top", "page_size": 1})
+        results = response.json()["data"]["results"]
+        self.assertEqual([c["id"] for c in results], [str(roots[1].id)])
+
+        # Falls back to persisted like counts when Redis is unavailable
+        Comment.objects.filter(id=self.root_comment.id).update(like_count=5)
+        with mock.patch.object(
+            comment_like_service, "get_top_comments", side_effect=RedisError
+        ):
+            response = self.client.get(url, {"ordering": "top", "page_size": 1})
+        results = response.json()["data"]["results"]
+        self.assertEqual([c["id"] for c in results], [str(self.root_comment.id)])
+
     def test_thread_replies_success_with_replies(self):
         url = f"/api/v1/comments/{self.root_comment.id}/replies/"
         response = self.client.get(url)
@@ -471,6 +1200,44 @@ class TestArticles(APITestCase):
         self.assertEqual(data[0]["body"], "Reply number 1")
         self.assertEqual(data[99]["body"], "Reply number 100")
 
+    def test_thread_replies_mentions_prefetched_and_paginated(self):
+        """Test replies resolve mentions without per-reply queries and page by cursor"""
+        for i in range(12):
+            reply = Comment.objects.create(
+                article=self.published_article1,
+                user=self.user1,
+                body=f"@{self.user3.username} reply {i}",
+                thread=self.thread,
+            )
+            CommentMention.objects.create(comment=reply, mentioned_user=self.user3)
+
+        url = f"/api/v1/comments/{self.root_comment.id}/replies/"
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        data = response.json()["data"]
+        self.assertEqual(len(data), 15)
+        self.assertIsNone(data[0]["replying_to_username"])
+        self.assertEqual(data[-1]["replying_to_username"], self.user3.username)
+        self.assertEqual(data[-1]["replying_to_name"], self.user3.full_name)
+        mention_queries = [
+            q
+            for q in ctx.captured_queries
+            if CommentMention._meta.db_table in q["sql"]
+        ]
+        self.assertEqual(len(mention_queries), 1)
+
+        response = self.client.get(url, {"pagination": "cursor"})
+        page = response.json()["data"]
+        self.assertEqual(len(page["results"]), 10)
+        self.assertEqual(page["results"][0]["body"], "First reply")
+        response = self.client.get(page["next"])
+        page = response.json()["data"]
+        self.assertEqual(
+            [r["body"] for r in page["results"]],
+            [f"@{self.user3.username} reply {i}" for i in range(7, 12)],
+        )
+        self.assertIsNone(page["next"])
+
     def test_comment_create_unauthenticated(self):
         data = {
             "article_id": str(self.published_article1.id),
@@ -925,6 +1692,49 @@ class TestArticles(APITestCase):
         self.assertEqual(response_data["like_count"], 3)
         self.assertTrue(response_data["is_liked"])  # user3 is still authenticated
 
+    def test_comment_likes_embedded_in_comment_lists(self):
+        """Test replies and article comments include like data from one Redis call"""
+        first_reply = Comment.objects.get(thread=self.thread, body="First reply")
+        self.client.force_authenticate(user=self.user3)
+        self.client.post(f"/api/v1/comments/{first_reply.id}/like/")
+        self.client.post(f"/api/v1/comments/{self.root_comment.id}/like/")
+
+        url = f"/api/v1/comments/{self.root_comment.id}/replies/"
+        with mock.patch.object(
+            comment_like_service,
+            "get_bulk_like_status",
+            wraps=comment_like_service.get_bulk_like_status,
+        ) as mock_bulk:
+            response = self.client.get(url)
+        mock_bulk.assert_called_once()
+        likes = {
+            r["body"]: (r["like_count"], r["is_liked"])
+            for r in response.json()["data"]
+        }
+        self.assertEqual(likes["First reply"], (1, True))
+        self.assertEqual(likes["Second reply"], (0, False))
+
+        # Anonymous detail (served from the response cache) sees the new like
+        self.client.force_authenticate(user=None)
+        detail_url = (
+            f"{self.articles_url}{self.user2.username}/{self.published_article1.slug}/"
+        )
+        comment = self.client.get(detail_url).json()["data"]["comments"][0]
+        self.assertEqual((comment["like_count"], comment["is_liked"]), (1, None))
+        self.client.force_authenticate(user=self.user3)
+        self.client.post(f"/api/v1/comments/{self.root_comment.id}/like/")
+        self.client.force_authenticate(user=None)
+        comment = self.client.get(detail_url).json()["data"]["comments"][0]
+        self.assertEqual(comment["like_count"], 0)
+
+        # Comments still render without like data when Redis is down
+        with mock.patch.object(
+            comment_like_service, "get_bulk_like_status", side_effect=RedisError
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.json()["data"][0]["like_count"])
+
     def test_comment_like_status_comment_not_found(self):
         """Test 404 error when getting status for non-existent comment"""
         self.client.force_authenticate(user=self.user2)
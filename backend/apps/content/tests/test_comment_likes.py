@@ -0,0 +1,133 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from apps.common.utils import TestUtil
+from apps.content.models import Comment, CommentLike
+from apps.content.services import comment_like_service
+from apps.content.tasks import sync_comment_likes
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+
+def delete_likes(comment_id):
+    """
+    Test cleanup. remove_all_likes would queue the comment for the next
+    sync_comment_likes run, this also takes it off the shared dirty set.
+    """
+    comment_like_service.redis_client.delete(comment_like_service._get_key(comment_id))
+    comment_like_service.redis_client.srem(
+        comment_like_service.DIRTY_KEY, str(comment_id)
+    )
+
+
+class TestCommentLikeService(SimpleTestCase):
+    """Runs against the Redis at REDIS_URL, like the comment like endpoints"""
+
+    def setUp(self):
+        self.comment_id = uuid.uuid4()
+        self.addCleanup(delete_likes, self.comment_id)
+
+    def test_toggle_like_single_call(self):
+        user_id = uuid.uuid4()
+
+        result = comment_like_service.toggle_like(self.comment_id, user_id)
+        self.assertEqual(result, {"is_liked": True, "like_count": 1, "action": "liked"})
+
+        result = comment_like_service.toggle_like(self.comment_id, user_id)
+        self.assertEqual(
+            result, {"is_liked": False, "like_count": 0, "action": "unliked"}
+        )
+
+    def test_concurrent_toggles_keep_count_consistent(self):
+        """Many threads toggling one comment never lose or double count a like"""
+        users = [uuid.uuid4() for _ in range(20)]
+        # Every user toggles 5 times (ends liked), one user double-clicks 10 times
+        # (ends unliked)
+        double_clicker = uuid.uuid4()
+        calls = [user for user in users for _ in range(5)]
+        calls += [double_clicker] * 10
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(
+                executor.map(
+                    lambda user: comment_like_service.toggle_like(
+                        self.comment_id, user
+                    ),
+                    calls,
+                )
+            )
+
+        like_status = comment_like_service.get_like_status(
+            self.comment_id, double_clicker
+        )
+        self.assertEqual(like_status["like_count"], len(users))
+        self.assertFalse(like_status["is_liked"])
+        # Each reply reflects a real state: liked and unliked alternate per user
+        for user in users + [double_clicker]:
+            actions = [
+                result["action"]
+                for call_user, result in zip(calls, results)
+                if call_user == user
+            ]
+            net_likes = actions.count("liked") - actions.count("unliked")
+            self.assertEqual(net_likes, 1 if user in users else 0)
+        self.assertTrue(
+            all(0 <= result["like_count"] <= len(users) + 1 for result in results)
+        )
+
+        self.assertEqual(
+            comment_like_service.remove_all_likes(self.comment_id), len(users)
+        )
+        self.assertEqual(
+            comment_like_service.get_like_status(self.comment_id)["like_count"], 0
+        )
+
+
+class TestCommentLikePersistence(TestCase):
+    def setUp(self):
+        self.user1 = TestUtil.verified_user()
+        self.user2 = TestUtil.other_verified_user()
+        article = TestUtil.create_article(author=self.user1)
+        self.comment = TestUtil.create_comment(article=article, user=self.user1)
+        self.addCleanup(delete_likes, self.comment.id)
+
+    def test_sync_comment_likes_writes_behind(self):
+        comment_like_service.toggle_like(self.comment.id, self.user1.id)
+        comment_like_service.toggle_like(self.comment.id, self.user2.id)
+        self.assertGreaterEqual(sync_comment_likes(), 1)
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.like_count, 2)
+        self.assertEqual(
+            set(self.comment.likes.values_list("user_id", flat=True)),
+            {self.user1.id, self.user2.id},
+        )
+
+        # Only changed comments are synced again
+        self.assertEqual(sync_comment_likes(), 0)
+
+        comment_like_service.toggle_like(self.comment.id, self.user1.id)
+        sync_comment_likes()
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.like_count, 1)
+        self.assertEqual(
+            list(CommentLike.objects.values_list("user_id", flat=True)),
+            [self.user2.id],
+        )
+
+    def test_rehydrate_comment_likes(self):
+        comment_like_service.toggle_like(self.comment.id, self.user2.id)
+        sync_comment_likes()
+
+        # Simulate Redis losing its data
+        comment_like_service.redis_client.delete(
+            comment_like_service._get_key(self.comment.id)
+        )
+        call_command("rehydrate_comment_likes", stdout=StringIO())
+
+        like_status = comment_like_service.get_like_status(
+            self.comment.id, self.user2.id
+        )
+        self.assertEqual(like_status, {"like_count": 1, "is_liked": True})
+        self.assertEqual(Comment.objects.get(id=self.comment.id).like_count, 1)
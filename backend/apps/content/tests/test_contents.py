@@ -1,5 +1,11 @@
+from io import StringIO
+
 from apps.common.utils import TestUtil
-from apps.content.models import Category, Event, Job, Resource, Tool
+from apps.content.choices import ArticleStatusChoices
+from apps.content.models import Category, Event, Job, Resource, Tag, Tool, ToolTag
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -86,6 +92,30 @@ class TestContents(APITestCase):
         response = self.client.get(f"{self.jobs_url}{fake_id}/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_job_detail_conditional_get(self):
+        """Test job detail returns 304 until the job changes"""
+        url = f"{self.jobs_url}{self.job1.id}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Other objects of the same type get their own ETag
+        response = self.client.get(
+            f"{self.jobs_url}{self.job2.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.job1.title = "Staff Engineer"
+        self.job1.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["title"], "Staff Engineer")
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_event_list(self):
         """Test event list endpoint"""
         response = self.client.get(self.events_url)
@@ -180,6 +210,64 @@ class TestContents(APITestCase):
         self.assertEqual(data["name"], "Technology")
         self.assertEqual(data["slug"], "technology")
 
+    def test_category_counts_maintained(self):
+        """Test category/tag counters follow publishing and tagging"""
+        self.assertEqual(
+            Category.objects.filter(pk=self.category.pk)
+            .values("job_count", "event_count", "resource_count", "tool_count")
+            .get(),
+            {"job_count": 2, "event_count": 2, "resource_count": 2, "tool_count": 2},
+        )
+
+        # Saves that don't move published content don't touch the counters
+        self.job2.title = "Principal Engineer"
+        with CaptureQueriesContext(connection) as ctx:
+            self.job2.save()
+        self.assertFalse(
+            any("content_category" in q["sql"] for q in ctx.captured_queries)
+        )
+
+        self.job1.is_published = False
+        self.job1.save()
+        Resource.objects.get(pk=self.resource1.pk).delete()
+        other = Category.objects.create(name="Design", desc="Design")
+        self.tool1.category = other
+        self.tool1.save()
+
+        article = TestUtil.create_article(author=self.user2)
+        article.category = self.category
+        article.save()
+        tag = Tag.objects.create(name="python")
+        article.tags.add(tag)
+        tool_tag = ToolTag.objects.create(name="Editor")
+        self.tool2.tags.add(tool_tag)
+
+        self.category.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.category.article_count, 1)
+        self.assertEqual(self.category.job_count, 1)
+        self.assertEqual(self.category.resource_count, 1)
+        self.assertEqual(self.category.tool_count, 1)
+        self.assertEqual(other.tool_count, 1)
+        self.assertEqual(Tag.objects.get(pk=tag.pk).article_count, 1)
+        self.assertEqual(ToolTag.objects.get(pk=tool_tag.pk).tool_count, 1)
+
+        # Unpublishing drops the article from category and tag counts
+        article.status = ArticleStatusChoices.DRAFT
+        article.save()
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.article_count, 0)
+        self.assertEqual(Tag.objects.get(pk=tag.pk).article_count, 0)
+
+        # The recompute command repairs drift from writes that skip signals
+        Category.objects.update(job_count=99)
+        call_command("recompute_content_counts", stdout=StringIO())
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.job_count, 1)
+
+        response = self.client.get(self.categories_url, {"ordering": "-article_count"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_category_detail_not_found(self):
         """Test category detail with invalid slug"""
         response = self.client.get(f"{self.categories_url}non-existent-slug/")
@@ -1,6 +1,15 @@
 from rest_framework.throttling import UserRateThrottle
 
 
+class TagAutocompleteThrottle(UserRateThrottle):
+    """
+    Throttle for tag autocomplete, which the editor calls on every keystroke
+    Allows 120 requests per minute per user (or IP for anonymous users)
+    """
+
+    scope = "tag_autocomplete"
+
+
 class ArticleSummaryThrottle(UserRateThrottle):
     """
     Custom throttle for article summary endpoint
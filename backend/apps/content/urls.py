@@ -1,12 +1,13 @@
 from django.urls import path
 
 from . import views
-from .feeds import LatestArticlesFeed
+from .feeds import CategoryArticlesFeed, LatestArticlesFeed, TagArticlesFeed
 
 urlpatterns = [
     # SECTION 1: Static paths (no parameters)
     path("categories/", views.CategoryGenericView.as_view()),
     path("tags/", views.TagGenericView.as_view()),
+    path("tags/autocomplete/", views.TagAutocompleteView.as_view()),
     path("contribute/", views.AcceptGuidelinesView.as_view()),
     path("jobs/", views.JobListView.as_view()),
     path("events/", views.EventListView.as_view()),
@@ -59,6 +60,14 @@ urlpatterns = [
         "articles/<uuid:article_id>/summarize/",
         views.ArticleSummaryView.as_view(),
     ),
+    path(
+        "articles/<uuid:article_id>/comments/",
+        views.ArticleCommentListView.as_view(),
+    ),
+    path(
+        "articles/<uuid:article_id>/related/",
+        views.ArticleRelatedView.as_view(),
+    ),
     path(
         "articles/<uuid:article_id>/reactions/",
         views.ArticleReactionView.as_view(),
@@ -113,6 +122,14 @@ urlpatterns = [
     ),
     # SECTION 3: Slug-based paths (LAST!)
     # ⚠️ IMPORTANT: These MUST be last because they're catch-all patterns
+    path(
+        "categories/<slug:slug>/feed/",
+        CategoryArticlesFeed(),
+    ),
+    path(
+        "tags/<str:name>/feed/",
+        TagArticlesFeed(),
+    ),
     path(
         "categories/<slug:slug>/",
         views.CategoryRetrieveView.as_view(),
@@ -1,7 +1,9 @@
 from .article_reaction import ArticleReactionView
 from .articles import (
     AcceptGuidelinesView,
+    ArticleCommentListView,
     ArticleListView,
+    ArticleRelatedView,
     ArticleRetrieveView,
     ArticleSummaryView,
     CommentCreateView,
@@ -9,6 +11,7 @@ from .articles import (
     CommentLikeStatusView,
     CommentLikeToggleView,
     RSSFeedInfoView,
+    TagAutocompleteView,
     TagGenericView,
     ThreadRepliesView,
 )
@@ -42,7 +45,9 @@ from .workflow import (
 __all__ = [
     "ArticleListView",
     "ArticleRetrieveView",
+    "ArticleRelatedView",
     "TagGenericView",
+    "TagAutocompleteView",
     "CategoryGenericView",
     "AcceptGuidelinesView",
     "JobListView",
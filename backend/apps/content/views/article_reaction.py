@@ -14,6 +14,7 @@ from apps.content.serializers import (
     ArticleReactionToggleSerializer,
 )
 from apps.notification.utils import create_notification
+from django.db import transaction
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
@@ -59,14 +60,11 @@ class ArticleReactionView(APIView):
         """
         try:
 
-            article = (
-                Article.published.select_related("author", "category")
-                .prefetch_related("tags", "reactions")
-                .get(id=article_id)
-            )
+            article = Article.published.get(id=article_id)
 
-            reaction_counts = article.reaction_counts
-            total_reactions = article.total_reaction_counts
+            # Aggregate from the source of truth rather than the counters
+            reaction_counts = article.compute_reaction_counts()
+            total_reactions = sum(reaction_counts.values())
 
             user_reactions = None
             if request.user.is_authenticated:
@@ -137,36 +135,38 @@ class ArticleReactionView(APIView):
 
             user = request.user
 
-            existing_reaction = ArticleReaction.objects.filter(
-                user=user, article=article, reaction_type=reaction_type
-            ).first()
-
-            if existing_reaction:
-                # User already reacted with this emoji - REMOVE IT
-                existing_reaction.delete()
-                action = "removed"
-                is_reacted = False
-                logger.info(
-                    f"User {user.id} {action} {reaction_type} from article {article.id}"
-                )
-            else:
-                # User hasn't reacted with this emoji - ADD IT
-                ArticleReaction.objects.create(
+            with transaction.atomic():
+                deleted, _ = ArticleReaction.objects.filter(
                     user=user, article=article, reaction_type=reaction_type
-                )
-                action = "added"
-                is_reacted = True
-                logger.info(
-                    f"User {user.id} {action} {reaction_type} to article {article.id}"
-                )
-
-                # Create notification for article author (only when adding reaction)
-                if article.author != user:
-                    verb = f"{reaction_type} your article '{article.title}'"
-                    create_notification(
-                        recipient=article.author, verb=verb, target=article, actor=user
+                ).delete()
+
+                if deleted:
+                    # User already reacted with this emoji - REMOVE IT
+                    article.adjust_reaction_count(reaction_type, -1)
+                    action = "removed"
+                    is_reacted = False
+                    logger.info(
+                        f"User {user.id} {action} {reaction_type} from article {article.id}"
+                    )
+                else:
+                    # User hasn't reacted with this emoji - ADD IT
+                    ArticleReaction.objects.create(
+                        user=user, article=article, reaction_type=reaction_type
+                    )
+                    article.adjust_reaction_count(reaction_type, 1)
+                    action = "added"
+                    is_reacted = True
+                    logger.info(
+                        f"User {user.id} {action} {reaction_type} to article {article.id}"
                     )
 
+            # Create notification for article author (only when adding reaction)
+            if is_reacted and article.author != user:
+                verb = f"{reaction_type} your article '{article.title}'"
+                create_notification(
+                    recipient=article.author, verb=verb, target=article, actor=user
+                )
+
             reaction_counts = article.reaction_counts
             total_reactions = article.total_reaction_counts
 
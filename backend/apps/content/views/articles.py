@@ -3,15 +3,20 @@ import logging
 from apps.accounts.utils import UserRoles
 from apps.common.errors import ErrorCode
 from apps.common.exceptions import NotFoundError
-from apps.common.pagination import DefaultPagination
+from apps.common.pagination import DefaultPagination, KeysetPagination
 from apps.common.responses import CustomResponse
 from apps.content.choices import ArticleStatusChoices
-from apps.content.models import Article, Comment, CommentThread, Tag
+from apps.content.filters import ArticleSearchFilter
+from apps.content.mixins import ConditionalGetMixin
+from apps.content.models import Article, Comment, CommentMention, CommentThread, Tag
 from apps.content.permissions import IsCommentAuthor
+from apps.content.related import RELATED_K
 from apps.content.schema_examples import (
     ACCEPT_GUIDELINES_RESPONSE_EXAMPLE,
+    ARTICLE_COMMENTS_RESPONSE_EXAMPLE,
     ARTICLE_DETAIL_RESPONSE_EXAMPLE,
     ARTICLE_LIST_RESPONSE_EXAMPLE,
+    ARTICLE_RELATED_RESPONSE_EXAMPLE,
     ARTICLE_SUMMARY_RESPONSE_EXAMPLE,
     COMMENT_CREATE_RESPONSE_EXAMPLE,
     COMMENT_DELETE_RESPONSE_EXAMPLE,
@@ -19,10 +24,12 @@ from apps.content.schema_examples import (
     COMMENT_LIKE_TOGGLE_RESPONSE_EXAMPLE,
     COMMENT_UPDATE_RESPONSE_EXAMPLE,
     RSS_RESPONSE_EXAMPLE,
+    TAG_AUTOCOMPLETE_RESPONSE_EXAMPLE,
     TAG_RESPONSE_EXAMPLE,
     THREAD_REPLIES_RESPONSE_EXAMPLE,
 )
 from apps.content.serializers import (
+    ArticleCommentSerializer,
     ArticleDetailSerializer,
     ArticleListSerializer,
     ArticleSummaryResponseSerializer,
@@ -35,16 +42,24 @@ from apps.content.serializers import (
     TagSerializer,
     ThreadReplySerializer,
 )
-from apps.content.services import comment_like_service
-from apps.content.services.ai_service import groq_service
+from apps.content.services import (
+    comment_like_service,
+    content_cache,
+    trending_service,
+)
+from apps.content.services.ai_service import SummaryPendingError, groq_service
+from apps.content.services.tag_index import tag_index
+from apps.content.services.trending import TrendingService
 from apps.content.throttles import (
     ArticleSummaryRegenerateThrottle,
     ArticleSummaryThrottle,
+    TagAutocompleteThrottle,
 )
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.db import transaction
-from django.db.models import F, Prefetch
+from django.db.models import Case, F, IntegerField, Prefetch, Value, When
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
 from redis import RedisError
@@ -113,15 +128,17 @@ class ArticleListView(ListAPIView):
         Article.objects.filter(status=ArticleStatusChoices.PUBLISHED)
         .select_related("category", "author")
         .prefetch_related("tags")
-        .all()
+        .defer("content")  # lists show Article.excerpt
     )
     serializer_class = ArticleListSerializer
     # serializer_class = ArticleCommentWithLikesSerializer
-    filter_backends = (DjangoFilterBackend, SearchFilter)
+    filter_backends = (DjangoFilterBackend, ArticleSearchFilter)
     filterset_fields = ("is_featured", "category", "author__username")
-    search_fields = ["title", "content"]
     pagination_class = DefaultPagination
+    keyset_ordering = ("-created_at", "-id")
     default_limit = 10
+    # Trending mode ranks (at most) this many of the top trending articles
+    trending_depth = 100
 
     @extend_schema(
         summary="Retrieve a list of all published articles",
@@ -129,7 +146,9 @@ class ArticleListView(ListAPIView):
         parameters=[
             OpenApiParameter(
                 name="search",
-                description="Search across title, and description.",
+                description="Full-text search across title, tags and body. "
+                "Results are ordered by relevance. Cursor pagination is not "
+                "available in this mode.",
             ),
             OpenApiParameter(
                 name="limit",
@@ -138,6 +157,32 @@ class ArticleListView(ListAPIView):
                 required=False,
                 description="Maximum number of articles to return (default is 10).",
             ),
+            OpenApiParameter(
+                name="pagination",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["cursor"],
+                description="Use cursor (keyset) pagination for infinite scroll. "
+                "Follow the returned `next` link; `limit` is ignored in this mode.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Cursor mode only: also return the total count.",
+            ),
+            OpenApiParameter(
+                name="ordering",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["trending"],
+                description="`trending` ranks articles by recent views, shares, "
+                "reactions, comments and saves, with older engagement counting "
+                "less. Cursor pagination is not available in this mode.",
+            ),
         ],
         tags=article_tags,
         auth=[],
@@ -149,8 +194,52 @@ class ArticleListView(ListAPIView):
         """
         return super().get(request, *args, **kwargs)
 
+    def is_trending(self, request):
+        return request.query_params.get("ordering") == "trending"
+
     def list(self, request, *args, **kwargs):
+        scopes = ()
+        if self.is_trending(request):
+            # A ranking can't be seeked by created_at
+            self.keyset_ordering = None
+            scopes = (TrendingService.SCOPE,)
+        elif request.query_params.get(ArticleSearchFilter.search_param, "").strip():
+            self.keyset_ordering = None  # nor can search relevance
+
+        # Anonymous responses don't depend on the user (e.g. is_saved), so
+        # they are served from the versioned content cache
+        if request.user.is_authenticated:
+            return self._list(request)
+        return content_cache.cached_response(
+            lambda: content_cache.list_key(request, *scopes),
+            lambda: self._list(request),
+        )
+
+    def rank_by_trending(self, queryset):
+        """
+        Order `queryset` by the precomputed trending ranking (see
+        TrendingService). Falls back to newest first while none of its
+        articles are ranked (e.g. a filtered list).
+        """
+        try:
+            ids = trending_service.get_top_ids(self.trending_depth)
+        except RedisError as e:
+            logger.error(f"Trending ranking unavailable: {e}")
+            ids = []
+        ranked = queryset.filter(pk__in=ids)
+        if not ids or not ranked.exists():
+            return queryset
+
+        rank = Case(
+            *(When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)),
+            output_field=IntegerField(),
+        )
+        return ranked.order_by(rank, "-created_at")
+
+    def _list(self, request):
         queryset = self.filter_queryset(self.get_queryset())
+        if self.is_trending(request):
+            queryset = self.rank_by_trending(queryset)
 
         try:
             limit = int(request.query_params.get("limit", self.default_limit))
@@ -160,7 +249,9 @@ class ArticleListView(ListAPIView):
             # if an invalid integer uses the default instead of crashing
             limit = self.default_limit
 
-        queryset = queryset[:limit]
+        # A sliced queryset can't be seeked, and cursors page through everything
+        if not self.paginator.is_keyset_request(request, self):
+            queryset = queryset[:limit]
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -180,8 +271,10 @@ class ArticleListView(ListAPIView):
         )
 
 
-class ArticleRetrieveView(APIView):
+class ArticleRetrieveView(ConditionalGetMixin, APIView):
     serializer_class = ArticleDetailSerializer
+    vary_on_user = True  # is_saved
+    validator_max_age = 60 * 10  # author/commenter profiles aren't versioned
 
     @extend_schema(
         summary="Retrieve article details",
@@ -190,19 +283,30 @@ class ArticleRetrieveView(APIView):
         responses=ARTICLE_DETAIL_RESPONSE_EXAMPLE,
         auth=[],
     )
-    def get(self, *args, **kwargs):
+    def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._cached_retrieve(request, **kwargs), **kwargs
+        )
+
+    def get_version_scopes(self, request, **kwargs):
+        return [
+            content_cache.GLOBAL_SCOPE,
+            content_cache.article_scope(kwargs["slug"]),
+        ]
+
+    def _cached_retrieve(self, request, **kwargs):
+        if request.user.is_authenticated:
+            return self._retrieve(**kwargs)
+        return content_cache.cached_response(
+            lambda: content_cache.detail_key(request, kwargs["slug"]),
+            lambda: self._retrieve(**kwargs),
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             article = (
                 Article.objects.filter(status=ArticleStatusChoices.PUBLISHED)
-                .prefetch_related(
-                    Prefetch(
-                        "comments",
-                        queryset=Comment.objects.filter(is_active=True).select_related(
-                            "user", "thread"
-                        ),
-                    ),
-                    "tags",
-                )
+                .prefetch_related("tags")
                 .select_related("author", "category")
                 .get(author__username=kwargs["username"], slug=kwargs["slug"])
             )
@@ -220,18 +324,140 @@ class ArticleRetrieveView(APIView):
             raise NotFoundError(err_msg="Article not found.")
 
 
+class ArticleCommentListView(ListAPIView):
+    """
+    Root comments of a published article, newest first. Paged with cursors
+    so deep pages stay cheap; the article detail embeds the first page and
+    `comments_next_cursor` continues here. `?ordering=top` returns the most
+    liked comments instead (a single page).
+    """
+
+    serializer_class = ArticleCommentSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-created_at", "-id")
+
+    def get_queryset(self):
+        return self.article.root_comments().select_related("user", "thread")
+
+    @extend_schema(
+        summary="List root comments of an article",
+        description=(
+            "Retrieve the root comments (thread starters) of a published article, "
+            "newest first. Follow the `next` link for older comments; replies are "
+            "fetched per thread from the replies endpoint."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="ordering",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["top"],
+                description="`top`: the `page_size` most liked comments, without "
+                "further pages.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Cursor from `next`/`previous` or the article's "
+                "`comments_next_cursor`.",
+            ),
+            OpenApiParameter(
+                name="include_count",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Also return the total number of root comments.",
+            ),
+        ],
+        tags=article_tags,
+        auth=[],
+        responses=ARTICLE_COMMENTS_RESPONSE_EXAMPLE,
+    )
+    def get(self, request, article_id):
+        try:
+            self.article = Article.objects.only("id").get(
+                id=article_id, status=ArticleStatusChoices.PUBLISHED
+            )
+        except Article.DoesNotExist:
+            raise NotFoundError(err_msg="Article not found.")
+
+        if request.query_params.get("ordering") == "top":
+            comments = self._top_comments(self.paginator.get_page_size(request))
+            serializer = self.get_serializer(comments, many=True)
+            data = {
+                "count": None,
+                "next": None,
+                "previous": None,
+                "results": serializer.data,
+            }
+        else:
+            page = self.paginate_queryset(self.get_queryset())
+            serializer = self.get_serializer(page, many=True)
+            data = self.get_paginated_response(serializer.data).data
+
+        return CustomResponse.success(
+            message="Comments retrieved successfully.",
+            data=data,
+            status_code=status.HTTP_200_OK,
+        )
+
+    def _top_comments(self, size):
+        """
+        The `size` most liked root comments, newest first on ties. The
+        ranking comes from the article's Redis ZSET; the rest (or everything,
+        when Redis is down or the ZSET was evicted) is filled from the
+        persisted like counts.
+        """
+        try:
+            ranked = comment_like_service.get_top_comments(self.article.id, size)
+        except RedisError as e:
+            logger.error(f"Top comments ranking unavailable: {e}")
+            ranked = []
+
+        queryset = self.get_queryset()
+        likes = dict(ranked)
+        ranked_ids = list(likes)
+        comments = sorted(
+            queryset.filter(pk__in=ranked_ids),
+            key=lambda c: (likes[str(c.pk)], c.created_at),
+            reverse=True,
+        )[:size]
+        if len(comments) < size:
+            comments += queryset.exclude(pk__in=ranked_ids).order_by(
+                "-like_count", "-created_at"
+            )[: size - len(comments)]
+        return comments
+
+
 class ThreadRepliesView(APIView):
     """View for fetching all replies in a thread"""
 
     serializer_class = ThreadReplySerializer
+    pagination_class = DefaultPagination
+    keyset_ordering = ("created_at", "id")
 
     @extend_schema(
         summary="Get replies for a thread",
         description=(
             "Retrieve all replies in a thread. Pass the root comment ID to get all replies. "
             "Returns replies sorted chronologically (oldest first) for natural conversation flow. "
-            "Only works for root comments - returns error if called on a reply."
+            "Only works for root comments - returns error if called on a reply. "
+            "Pass `pagination=cursor` to page through long threads instead."
         ),
+        parameters=[
+            OpenApiParameter(
+                name="pagination",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["cursor"],
+                description="Return a cursor-paginated page (`count`, `next`, "
+                "`previous`, `results`) instead of the full list.",
+            ),
+        ],
         tags=article_tags,
         auth=[],
         responses=THREAD_REPLIES_RESPONSE_EXAMPLE,
@@ -262,15 +488,33 @@ class ThreadRepliesView(APIView):
                 thread=comment.thread,
             )
             .exclude(id=comment.id)  # Don't include root in replies list
-            .select_related("user", "article")
-            .order_by("created_at")
+            .select_related("user")
+            .prefetch_related(
+                Prefetch(
+                    "mentions",
+                    queryset=CommentMention.objects.select_related(
+                        "mentioned_user"
+                    ).order_by("created_at", "id"),
+                )
+            )
+            .order_by(*self.keyset_ordering)
         )  # Oldest first
 
-        serializer = self.serializer_class(replies, many=True)
+        paginator = self.pagination_class()
+        if paginator.is_keyset_request(request, self):
+            page = paginator.paginate_queryset(replies, request, self)
+            serializer = self.serializer_class(
+                page, many=True, context={"request": request}
+            )
+            data = paginator.get_paginated_response(serializer.data).data
+        else:
+            data = self.serializer_class(
+                replies, many=True, context={"request": request}
+            ).data
 
         return CustomResponse.success(
             message="Replies retrieved successfully.",
-            data=serializer.data,
+            data=data,
             status_code=status.HTTP_200_OK,
         )
 
@@ -308,6 +552,74 @@ class CommentCreateView(APIView):
         )
 
 
+class ArticleRelatedView(APIView):
+    """
+    Articles related to a published article, read from the precomputed
+    related-articles index (see apps.content.related). Until the index has
+    an entry for the article, the newest articles of its category are used.
+    """
+
+    default_limit = 5
+
+    @extend_schema(
+        summary="List related articles",
+        description="Retrieve published articles related to an article by shared tags and category, favouring recent ones.",
+        tags=article_tags,
+        auth=[],
+        parameters=[
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=f"Maximum number of articles to return (default is 5, at most {RELATED_K}).",
+            ),
+        ],
+        responses=ARTICLE_RELATED_RESPONSE_EXAMPLE,
+    )
+    def get(self, request, article_id):
+        try:
+            article = Article.objects.only("id", "category_id").get(
+                id=article_id, status=ArticleStatusChoices.PUBLISHED
+            )
+        except Article.DoesNotExist:
+            raise NotFoundError(err_msg="Article not found.")
+
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+            if limit <= 0:
+                limit = self.default_limit
+        except ValueError:
+            limit = self.default_limit
+        limit = min(limit, RELATED_K)
+
+        queryset = (
+            Article.published.select_related("category", "author")
+            .prefetch_related("tags")
+            .defer("content")
+        )
+        articles = list(
+            queryset.filter(related_to_entries__article=article).order_by(
+                "-related_to_entries__score"
+            )[:limit]
+        )
+        if not articles and article.category_id is not None:
+            articles = list(
+                queryset.filter(category_id=article.category_id)
+                .exclude(pk=article.pk)
+                .order_by("-created_at")[:limit]
+            )
+
+        serializer = ArticleListSerializer(
+            articles, many=True, context={"request": request}
+        )
+        return CustomResponse.success(
+            message="Related articles retrieved successfully.",
+            data=serializer.data,
+            status_code=status.HTTP_200_OK,
+        )
+
+
 class TagGenericView(ListAPIView):
     serializer_class = TagSerializer
     filter_backends = (DjangoFilterBackend, SearchFilter)
@@ -365,6 +677,66 @@ class TagGenericView(ListAPIView):
         return self.list(request, *args, **kwargs)
 
 
+class TagAutocompleteView(APIView):
+    """
+    Typeahead for tag names, served from an in-memory prefix index
+    (see TagIndexService) so keystrokes never hit the database.
+    """
+
+    throttle_classes = [TagAutocompleteThrottle]
+    default_limit = 10
+
+    @extend_schema(
+        summary="Autocomplete tags",
+        description="Suggest tags whose name starts with `q`, most used first. Use `kind=tool` for tool tags (ranked by tools) instead of article tags (ranked by published articles).",
+        tags=article_tags,
+        responses=TAG_AUTOCOMPLETE_RESPONSE_EXAMPLE,
+        auth=[],
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Prefix typed so far. Empty returns the most used tags.",
+            ),
+            OpenApiParameter(
+                name="kind",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=list(tag_index.KINDS),
+                description="Tag kind (default is article).",
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=f"Maximum number of tags to return (default is 10, at most {tag_index.MAX_LIMIT}).",
+            ),
+        ],
+    )
+    def get(self, request):
+        kind = request.query_params.get("kind", "article")
+        if kind not in tag_index.KINDS:
+            kind = "article"
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+
+        entries = tag_index.search(request.query_params.get("q", ""), kind, limit)
+        return CustomResponse.success(
+            message="Tag suggestions retrieved successfully.",
+            data=[
+                {"id": entry.id, "name": entry.name, "usage": entry.usage}
+                for entry in entries
+            ],
+            status_code=status.HTTP_200_OK,
+        )
+
+
 class RSSFeedInfoView(APIView):
     @extend_schema(
         summary="RSS Feed Information",
@@ -379,9 +751,11 @@ class RSSFeedInfoView(APIView):
             message="RSS Feed information retrieved successfully.",
             data={
                 "rss_url": f"{base_url}/api/v1/articles/feed/",
+                "category_rss_url": f"{base_url}/api/v1/categories/{{slug}}/feed/",
+                "tag_rss_url": f"{base_url}/api/v1/tags/{{name}}/feed/",
                 "description": "Subscribe to get the latest Tech Hive articles",
                 "format": "RSS 2.0 XML",
-                "items_count": 10,
+                "items_count": settings.RSS_FEED_ITEMS,
                 "update_frequency": "When new articles are published",
             },
             status_code=status.HTTP_200_OK,
@@ -447,13 +821,14 @@ class CommentDetailView(APIView):
         is_reply = not comment.is_root_comment
         thread_id = comment.thread_id
 
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
 
-        # If it was a reply, decrement the thread's reply count
-        if is_reply and thread_id:
-            CommentThread.objects.filter(id=thread_id).update(
-                reply_count=F("reply_count") - 1
-            )
+            # If it was a reply, decrement the thread's reply count
+            if is_reply and thread_id:
+                CommentThread.objects.filter(id=thread_id).update(
+                    reply_count=F("reply_count") - 1
+                )
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -496,7 +871,10 @@ class CommentLikeToggleView(APIView):
 
             try:
                 result = comment_like_service.toggle_like(
-                    comment_id=comment.id, user_id=user_id
+                    comment_id=comment.id,
+                    user_id=user_id,
+                    # Only root comments are ranked in "top comments"
+                    article_id=comment.article_id if comment.is_root else None,
                 )
             except RedisError as e:
                 logger.error(f"Redis error in toggle like: {e}")
@@ -506,6 +884,9 @@ class CommentLikeToggleView(APIView):
                     err_code=ErrorCode.SERVICE_UNAVAILABLE,
                 )
 
+            # Like counts are embedded in the article's comments
+            content_cache.invalidate_article(comment.article, listed=False)
+
             response_data = {
                 "comment_id": comment.id,
                 "is_liked": result["is_liked"],
@@ -590,7 +971,8 @@ class ArticleSummaryView(APIView):
     Generate AI-powered bullet-point summary of an article using GROQ AI.
 
     This endpoint uses GROQ AI to generate a concise bullet-point summary
-    of the article. Summaries are cached for 30 days for improved performance.
+    of the article. Summaries are stored and cached until the article's content
+    changes, so only edits are summarized again.
 
     Requirements:
     - User must be authenticated
@@ -607,7 +989,8 @@ class ArticleSummaryView(APIView):
     @extend_schema(
         summary="Generate AI Summary",
         description="Generate an AI-powered bullet-point summary of the article using GROQ AI. "
-        "Summaries are cached for 30 days. Only published articles can be summarized.",
+        "Summaries are cached until the article's content changes. Only published "
+        "articles can be summarized.",
         responses=ARTICLE_SUMMARY_RESPONSE_EXAMPLE,
         tags=["Articles"],
         parameters=[
@@ -688,6 +1071,22 @@ class ArticleSummaryView(APIView):
                     status_code=status.HTTP_200_OK,
                 )
 
+            except SummaryPendingError as e:
+                # Generated by a concurrent request (or the pre-warming task)
+                logger.info(f"Summary pending for article {article.id}: {e}")
+                return CustomResponse.info(
+                    "Article summary is being generated, please retry shortly.",
+                    {
+                        "article_id": str(article.id),
+                        "article_title": article.title,
+                        "article_slug": article.slug,
+                        "summary": None,
+                        "cached": False,
+                    },
+                    status_code=status.HTTP_202_ACCEPTED,
+                    headers={"Retry-After": "5"},
+                )
+
             except ValueError as e:
                 logger.warning(
                     f"Content validation error for article {article.id}: {str(e)}"
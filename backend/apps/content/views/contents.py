@@ -1,6 +1,7 @@
 from apps.common.exceptions import NotFoundError
 from apps.common.responses import CustomResponse
 from apps.content.filters import EventFilter, JobFilter
+from apps.content.mixins import ConditionalGetMixin
 from apps.content.models import Category, Event, Job, Resource, Tool
 from apps.content.schema_examples import (
     CATEGORY_DETAIL_RESPONSE_EXAMPLE,
@@ -22,7 +23,6 @@ from apps.content.serializers import (
     ToolSerializer,
 )
 from apps.general.views import CustomListView
-from django.db.models import Count
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
@@ -37,7 +37,8 @@ class CategoryGenericView(CustomListView):
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = ["name"]
     ordering_fields = ["name", "article_count"]
-    queryset = Category.objects.annotate(article_count=Count("articles")).all()
+    keyset_ordering = None  # ordering is client-selectable here
+    queryset = Category.objects.all()
 
     @extend_schema(
         summary="List all categories",
@@ -106,7 +107,9 @@ class ResourceListView(CustomListView):
     search_fields = ["name"]
 
     queryset = (
-        Resource.objects.filter(is_published=True).select_related("category").all()
+        Resource.objects.filter(is_published=True)
+        .select_related("category")
+        .defer("body")  # lists show Resource.excerpt
     )
 
     @extend_schema(
@@ -133,7 +136,7 @@ class ToolListView(CustomListView):
         Tool.objects.filter(is_published=True)
         .select_related("category")
         .prefetch_related("tags")
-        .all()
+        .defer("desc")  # lists show Tool.excerpt
     )
 
     @extend_schema(
@@ -147,7 +150,8 @@ class ToolListView(CustomListView):
         return self.list(request, *args, **kwargs)
 
 
-class CategoryRetrieveView(APIView):
+class CategoryRetrieveView(ConditionalGetMixin, APIView):
+    version_scopes = ["categories"]
     serializer_class = CategorySerializer
 
     @extend_schema(
@@ -158,6 +162,11 @@ class CategoryRetrieveView(APIView):
         auth=[],
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._retrieve(**kwargs), **kwargs
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             category = Category.objects.get(slug=kwargs["slug"])
             serializer = self.serializer_class(category)
@@ -170,7 +179,8 @@ class CategoryRetrieveView(APIView):
             raise NotFoundError(err_msg="Category not found.")
 
 
-class JobRetrieveView(APIView):
+class JobRetrieveView(ConditionalGetMixin, APIView):
+    version_scopes = ["jobs"]
     serializer_class = JobSerializer
 
     @extend_schema(
@@ -181,6 +191,11 @@ class JobRetrieveView(APIView):
         auth=[],
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._retrieve(**kwargs), **kwargs
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             job = (
                 Job.objects.filter(is_published=True)
@@ -197,7 +212,8 @@ class JobRetrieveView(APIView):
             raise NotFoundError(err_msg="Job not found.")
 
 
-class EventRetrieveView(APIView):
+class EventRetrieveView(ConditionalGetMixin, APIView):
+    version_scopes = ["events"]
     serializer_class = EventSerializer
 
     @extend_schema(
@@ -208,6 +224,11 @@ class EventRetrieveView(APIView):
         auth=[],
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._retrieve(**kwargs), **kwargs
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             event = (
                 Event.objects.filter(is_published=True)
@@ -224,7 +245,8 @@ class EventRetrieveView(APIView):
             raise NotFoundError(err_msg="Event not found.")
 
 
-class ResourceRetrieveView(APIView):
+class ResourceRetrieveView(ConditionalGetMixin, APIView):
+    version_scopes = ["resources"]
     serializer_class = ResourceSerializer
 
     @extend_schema(
@@ -235,6 +257,11 @@ class ResourceRetrieveView(APIView):
         auth=[],
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._retrieve(**kwargs), **kwargs
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             resource = (
                 Resource.objects.filter(is_published=True)
@@ -251,7 +278,8 @@ class ResourceRetrieveView(APIView):
             raise NotFoundError(err_msg="Resource not found.")
 
 
-class ToolRetrieveView(APIView):
+class ToolRetrieveView(ConditionalGetMixin, APIView):
+    version_scopes = ["tools"]
     serializer_class = ToolSerializer
 
     @extend_schema(
@@ -262,6 +290,11 @@ class ToolRetrieveView(APIView):
         auth=[],
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request, lambda: self._retrieve(**kwargs), **kwargs
+        )
+
+    def _retrieve(self, **kwargs):
         try:
             tool = (
                 Tool.objects.filter(is_published=True)
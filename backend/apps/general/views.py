@@ -25,6 +25,7 @@ tags = ["General"]
 
 class CustomListView(ListAPIView):
     pagination_class = DefaultPagination
+    keyset_ordering = ("-created_at", "-id")
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
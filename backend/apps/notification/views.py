@@ -26,6 +26,7 @@ class NotificationListView(ListAPIView):
     filter_backends = (DjangoFilterBackend,)
     filterset_fields = ("is_read",)
     pagination_class = DefaultPagination
+    keyset_ordering = ("-created_at", "-id")
     queryset = Notification.objects.none()
 
     def get_queryset(self):
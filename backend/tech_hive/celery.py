@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 from decouple import config
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'tech_hive.settings.{config("SETTINGS")}')
@@ -7,3 +8,11 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'tech_hive.settings.{config("SE
 app = Celery('tech_hive')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def warm_up_worker_services(**kwargs):
+    # Each prefork child builds its own clients (never inherited from the parent)
+    from apps.common.services import warm_up_services
+
+    warm_up_services()
@@ -223,6 +223,7 @@ REST_FRAMEWORK = {
         "user": "1000/day",
         "article_summary": "10/hour",
         "article_summary_regenerate": "3/hour",
+        "tag_autocomplete": "120/minute",
     },
     "EXCEPTION_HANDLER": "apps.common.exceptions.custom_exception_handler",
 }
@@ -497,6 +498,10 @@ sentry_sdk.init(
 )
 
 ARTICLE_SUMMARY_MAX_CONTENT_LENGTH = 10000  # Max chars to send to AI
+# Summarize with an offline fake instead of the Groq API (tests, local dev)
+GROQ_FAKE_CLIENT = config("GROQ_FAKE_CLIENT", default=False, cast=bool)
+# Generate summaries of newly published articles in the background
+ARTICLE_SUMMARY_PREWARM = config("ARTICLE_SUMMARY_PREWARM", default=True, cast=bool)
 
 REDIS_URL = config("REDIS_URL")  #  prod uses prod redis url
 CELERY_BROKER_URL = config("REDIS_URL")
@@ -517,8 +522,28 @@ CACHES = {
         "KEY_PREFIX": "article_summaries",
         "TIMEOUT": 60 * 60 * 24 * 30,  # 30 days for summaries
     },
+    # Versioned public article responses, see ContentCacheService
+    "responses": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "responses",
+        "TIMEOUT": 60 * 10,  # bounds staleness for changes that don't bump versions
+    },
 }
 
+# URLs per sitemap page; the sitemap index links every page of each section
+SITEMAP_CHUNK_SIZE = config("SITEMAP_CHUNK_SIZE", default=1000, cast=int)
+
+# Number of articles in each RSS feed (latest, per category and per tag)
+RSS_FEED_ITEMS = config("RSS_FEED_ITEMS", default=5, cast=int)
+
+# Modules defining LazyService singletons, built by warm_up_services() when a
+# web or Celery worker process starts (see wsgi.py and celery.py)
+SERVICE_MODULES = [
+    "apps.content.services",
+    "apps.content.services.ai_service",
+]
+
 CELERY_BEAT_SCHEDULE = {
     "retry-failed-payments": {
         "task": "apps.subscriptions.tasks.retry_failed_payments",
@@ -557,6 +582,31 @@ CELERY_BEAT_SCHEDULE = {
             "description": "Daily task to handle inactive articles, remind reviewers/editors, and escalate stale reviews"
         },
     },
+    # Recompute denormalized article reaction counters nightly
+    "reconcile-reaction-counts": {
+        "task": "apps.content.tasks.reconcile_reaction_counts",
+        "schedule": crontab(hour=2, minute=30),  # 2:30 AM daily
+    },
+    # Repair drift in the category/tag content counters nightly
+    "recompute-content-counts": {
+        "task": "apps.content.tasks.recompute_content_counts",
+        "schedule": crontab(hour=2, minute=45),  # 2:45 AM daily
+    },
+    # Rebuild the related-articles index weekly (updates are incremental)
+    "rebuild-related-articles": {
+        "task": "apps.content.tasks.rebuild_related_articles",
+        "schedule": crontab(hour=4, minute=0, day_of_week=0),  # Sunday 4:00 AM
+    },
+    # Fade trending article scores (see TrendingService)
+    "decay-trending-articles": {
+        "task": "apps.content.tasks.decay_trending_articles",
+        "schedule": crontab(minute="*/10"),  # Every 10 minutes
+    },
+    # Persist comment likes from Redis (write-behind)
+    "sync-comment-likes": {
+        "task": "apps.content.tasks.sync_comment_likes",
+        "schedule": crontab(),  # Every minute
+    },
     # Cleanup expired JWT tokens daily at 3 AM
     "cleanup-expired-tokens": {
         "task": "apps.accounts.tasks.cleanup_expired_tokens",
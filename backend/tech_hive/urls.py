@@ -1,10 +1,9 @@
 from apps.common.responses import CustomResponse
 from apps.common.serializers import SuccessResponseSerializer
-from apps.content.sitemaps import ArticleSitemap
+from apps.content import sitemaps
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.http import JsonResponse
 from django.urls import include, path
 from drf_spectacular.utils import extend_schema
@@ -59,10 +58,6 @@ def handler500(request, exception=None):
 handler404 = handler404
 handler500 = handler500
 
-sitemaps = {
-    "articles": ArticleSitemap,
-}
-
 from django.urls import path
 
 urlpatterns = [
@@ -77,8 +72,14 @@ urlpatterns = [
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "sitemap.xml",
-        sitemap,
-        {"sitemaps": sitemaps},
+        sitemaps.index,
+        {"sitemaps": sitemaps.sitemaps},
+        name="django.contrib.sitemaps.views.index",
+    ),
+    path(
+        "sitemap-<section>.xml",
+        sitemaps.section,
+        {"sitemaps": sitemaps.sitemaps},
         name="django.contrib.sitemaps.views.sitemap",
     ),
     path(
@@ -16,3 +16,9 @@ from decouple import config
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'tech_hive.settings.{config("SETTINGS")}')
 
 application = get_wsgi_application()
+
+# Connect service clients before the first request instead of during it.
+# With --preload this runs in the master and children rebuild them lazily.
+from apps.common.services import warm_up_services  # noqa: E402
+
+warm_up_services()